@@ -1,6 +1,8 @@
 from qpy import Environment
-from Mappers.Utils.DistributionMapper import get_distribution
-from Mappers.Utils.QueueMapper import get_queue_discipline
+from qpy.spec import SPEC_VERSION
+from qpy.time_resolution import DEFAULT_TIME_RESOLUTION
+from Mappers.Utils.DistributionMapper import get_distribution_spec
+from Mappers.Utils.QueueMapper import get_queue_discipline_spec
 
 
 class SimulationRequestMapper:
@@ -9,71 +11,69 @@ class SimulationRequestMapper:
         self._setup_environment()
 
     def _setup_environment(self):
-        self._create_environment_object()
-        self._add_devices()
+        self._server_ids_mapper = {server.deviceId: server_id for server_id, server in enumerate(self._request.devices.servers)}
+        self._spec = self._create_spec()
+        self._env = Environment.from_spec(self._spec)
+
+    def _create_spec(self):
+        is_open = self._request.networkConfiguration.networkType == "Open"
+        servers = self._get_servers()
 
         if self._request.connections:
-            self._add_connections()
-
-    def _create_environment_object(self):
-        if self._request.networkConfiguration.networkType == "Open":
-            self._env = Environment()
-        else:
-            self._env = Environment(number_of_terminals=int(self._request.networkConfiguration.numberOfTerminals),
-                            think_time_distribution=get_distribution(self._request.networkConfiguration.thinkTimeDistribution))
-
-    def _add_servers(self):
-        for server in self._request.devices.servers:
-            service_dist = get_distribution(server.distribution)
-            queue_disc = None
-            if server.queue:
-                queue_disc = get_queue_discipline(server.queue)
-            self._server_ids_mapper[server.deviceId] = self._env.add_server(service_dist, queue_disc)
-
-    def _add_arrivals(self):
-        for arrival in self._request.devices.arrivals:
-            arrival_dist = get_distribution(arrival.distribution)
-
-            priority = None
-            if arrival.priorityDistribution:
-                priority = {p["key"]: p["prob"] for p in arrival.priorityDistribution}
-
-            target_server_id = self._server_ids_mapper[arrival.destination]
-            self._env.add_entry_point(target_server_id, arrival_dist, priority)            
-
-    def _add_terminal_configuration(self):
+            self._add_connections(servers)
+
+        return {
+            'version': SPEC_VERSION,
+            'time_unit': 'seconds',
+            'time_resolution': DEFAULT_TIME_RESOLUTION,
+            'servers': servers,
+            'entry_points': self._get_entry_points() if is_open else [],
+            'terminals': None if is_open else self._get_terminals()
+        }
+
+    def _get_servers(self):
+        return [{'service': get_distribution_spec(server.distribution), 'queue': get_queue_discipline_spec(server.queue), 'routing': []} for server in self._request.devices.servers]
+
+    def _get_entry_points(self):
+        entry_points = []
+
+        for arrival in self._request.devices.arrivals or []:
+            entry_points.append({
+                'server': self._server_ids_mapper[arrival.destination],
+                'arrival': get_distribution_spec(arrival.distribution),
+                'priorities': self._get_priorities(arrival.priorityDistribution)
+            })
+
+        return entry_points
+
+    def _get_terminals(self):
+        network = self._request.networkConfiguration
         config = self._request.terminalsConfiguration
 
-        if config.priorityDistribution:
-            priorities = {p["key"]: p["prob"] for p in config.priorityDistribution}
-
-            self._env.add_priority_closed_network(priorities)
-        
-        for route in config.routes:
-            target_server_id = self._server_ids_mapper[route.target]
-
-            self._env.add_terminals_routing_probability(target_server_id, route.routingProbability)   
+        return {
+            'number_of_terminals': int(network.numberOfTerminals),
+            'think_time': get_distribution_spec(network.thinkTimeDistribution),
+            'routing': [{'server': self._server_ids_mapper[route.target], 'probability': route.routingProbability} for route in config.routes],
+            'priorities': self._get_priorities(config.priorityDistribution)
+        }
 
-    def _add_devices(self):
-        self._server_ids_mapper = {}
-        
-        self._add_servers()
+    def _get_priorities(self, priority_distribution):
+        if priority_distribution:
+            return [{'priority': p["key"], 'probability': p["prob"]} for p in priority_distribution]
 
-        if self._request.networkConfiguration.networkType == "Open":
-            self._add_arrivals()
-        else:
-            self._add_terminal_configuration()
-    
-    def _add_connections(self):
+    def _add_connections(self, servers):
         for connection in self._request.connections:
             if connection.source.startswith("server") and connection.target.startswith("server"):
                 origin = self._server_ids_mapper[connection.source]
                 dest = self._server_ids_mapper[connection.target]
 
-                self._env.add_servers_connection(origin, dest, connection.routingProbability or 1.0)
-    
+                servers[origin]['routing'].append({'server': dest, 'probability': connection.routingProbability or 1.0})
+
     def get_environemnt(self):
         return self._env
-    
+
+    def get_spec(self):
+        return self._spec
+
     def get_ids_map(self):
         return self._server_ids_mapper
\ No newline at end of file
@@ -1,15 +1,12 @@
-from qpy import Distribution
-
-
-def get_distribution(distributionProperties):
+def get_distribution_spec(distributionProperties):
     match distributionProperties.distribution:
         case 'exponential':
-            return Distribution.exponential(lambda_value=distributionProperties.params['lambda'])
+            return {'type': 'exponential', 'lambda_value': distributionProperties.params['lambda']}
         case 'constant':
-            return Distribution.constant(value=distributionProperties.params['constantValue'])
+            return {'type': 'constant', 'value': distributionProperties.params['constantValue']}
         case 'uniform':
-            return Distribution.uniform(lower_bound=distributionProperties.params['lowerBound'], upper_bound=distributionProperties.params['upperBound'])
+            return {'type': 'uniform', 'lower_bound': distributionProperties.params['lowerBound'], 'upper_bound': distributionProperties.params['upperBound']}
         case 'normal':
-            return Distribution.normal(mu=distributionProperties.params['mu'], sigma=distributionProperties.params['sigma'])
+            return {'type': 'normal', 'mu': distributionProperties.params['mu'], 'sigma': distributionProperties.params['sigma']}
         case _:
             raise ValueError('Distribution not allowed: ' + distributionProperties.distribution)
\ No newline at end of file
@@ -1,17 +1,17 @@
-from qpy import QueueDiscipline
+def get_queue_discipline_spec(queueProperties):
+    if queueProperties is None:
+        return {'discipline': 'fcfs'}
 
-
-def get_queue_discipline(queueProperties):
     match queueProperties.queueDiscipline:
         case 'fcfs':
-            return QueueDiscipline.fcfs()
+            return {'discipline': 'fcfs'}
         case 'lcfs':
-            return QueueDiscipline.lcfs()
+            return {'discipline': 'lcfs'}
         case 'srt':
-            return QueueDiscipline.srt(bool(queueProperties.params['withPreemption']))
+            return {'discipline': 'srt', 'with_preemption': bool(queueProperties.params['withPreemption'])}
         case 'rr':
-            return QueueDiscipline.round_robin(float(queueProperties.params['preemptionTime']))
+            return {'discipline': 'round_robin', 'preemption_time': float(queueProperties.params['preemptionTime'])}
         case 'priority':
-            return QueueDiscipline.priority_queue(bool(queueProperties.params['withPreemption']))
+            return {'discipline': 'priority_queue', 'with_preemption': bool(queueProperties.params['withPreemption'])}
         case _:
             raise ValueError('Queue discipline not allowed: ' + queueProperties.queueDiscipline)
\ No newline at end of file
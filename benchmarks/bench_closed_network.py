@@ -0,0 +1,74 @@
+import gc, sys, time
+
+
+from qpy import Distribution, Environment, QueueDiscipline
+from qpy.event import Event
+from qpy.job import Job
+
+
+SIMULATION_TIME = float(sys.argv[1]) if len(sys.argv) > 1 else 50000
+WARMUP_TIME = SIMULATION_TIME / 10
+REPETITIONS = 3
+
+NUMBER_OF_TERMINALS = 50
+THINK_TIME = 5
+MU = 1
+
+
+def _closed_network() -> Environment:
+    env = Environment(number_of_terminals=NUMBER_OF_TERMINALS, think_time_distribution=Distribution.exponential(THINK_TIME))
+
+    for _ in range(3):
+        env.add_server(Distribution.exponential(1/MU), QueueDiscipline.fcfs())
+
+    env.add_servers_connection(0, 1, 0.5)
+    env.add_servers_connection(0, 2, 0.3)
+    env.add_terminals_routing_probability(0, 1)
+
+    return env
+
+def _runtime(env: Environment, disable_gc: bool) -> tuple:
+    best = float('inf')
+    collections = [generation['collections'] for generation in gc.get_stats()]
+
+    for _ in range(REPETITIONS):
+        start = time.perf_counter()
+        results = env.simulate(time_in_seconds=SIMULATION_TIME, warmup_time=WARMUP_TIME, seed=1, disable_gc=disable_gc)
+        best = min(best, time.perf_counter() - start)
+
+    collections = [(generation['collections'] - before) // REPETITIONS for generation, before in zip(gc.get_stats(), collections)]
+
+    return best, collections, results.environment_metrics.get_number_of_processed_jobs()
+
+def _allocated_objects(env: Environment) -> dict:
+    """Number of Job and Event objects created by one run."""
+    created = {Job: 0, Event: 0}
+    original_inits = {cls: cls.__init__ for cls in created}
+
+    def counting(cls):
+        def init(self, *args, **kwargs):
+            created[cls] += 1
+            original_inits[cls](self, *args, **kwargs)
+
+        return init
+
+    for cls in created:
+        cls.__init__ = counting(cls)
+
+    try:
+        env.simulate(time_in_seconds=SIMULATION_TIME, warmup_time=WARMUP_TIME, seed=1)
+    finally:
+        for cls, init in original_inits.items():
+            cls.__init__ = init
+
+    return {cls.__name__: count for cls, count in created.items()}
+
+if __name__ == '__main__':
+    env = _closed_network()
+
+    print(f'Closed network, {NUMBER_OF_TERMINALS} terminals, {SIMULATION_TIME:,.0f} time units')
+    print('Objects created per run: ' + ', '.join(f'{name} {count:,}' for name, count in _allocated_objects(env).items()))
+
+    for disable_gc in (False, True):
+        elapsed, collections, jobs = _runtime(env, disable_gc)
+        print(f'disable_gc={disable_gc}: {elapsed:.2f}s, {jobs / elapsed:,.0f} jobs/s, GC collections per run (gen 0/1/2) {collections}')
@@ -0,0 +1,45 @@
+import sys, time
+
+
+from qpy import Distribution, Environment, QueueDiscipline
+
+
+NUMBERS_OF_SERVERS = [int(argument) for argument in sys.argv[1:]] or [10, 100, 1000, 2000]
+SIMULATION_TIME = 10000
+WARMUP_TIME = 1000
+REPETITIONS = 3
+
+LAMBDA = 0.8
+MU = 1
+PATH_LENGTH = 3
+
+
+def _network_with_fixed_path(number_of_servers: int) -> Environment:
+    """Every job visits the first PATH_LENGTH servers in sequence; the other servers are never visited."""
+    env = Environment()
+
+    for server in range(number_of_servers):
+        env.add_server(Distribution.exponential(1/MU), QueueDiscipline.fcfs())
+
+        if 0 < server < PATH_LENGTH:
+            env.add_servers_connection(server - 1, server, 1)
+
+    env.add_entry_point(0, Distribution.exponential(1/LAMBDA))
+
+    return env
+
+def _departures_per_second(env: Environment) -> float:
+    best = 0
+
+    for _ in range(REPETITIONS):
+        start = time.perf_counter()
+        results = env.simulate(time_in_seconds=SIMULATION_TIME, warmup_time=WARMUP_TIME, engine='event')
+        elapsed = time.perf_counter() - start
+
+        best = max(best, results.environment_metrics.get_number_of_processed_jobs() / elapsed)
+
+    return best
+
+if __name__ == '__main__':
+    for number_of_servers in NUMBERS_OF_SERVERS:
+        print(f'{number_of_servers} servers, path of {PATH_LENGTH}: {_departures_per_second(_network_with_fixed_path(number_of_servers)):,.0f} departures/s')
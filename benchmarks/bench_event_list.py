@@ -0,0 +1,37 @@
+import random
+import sys
+import time
+
+
+from qpy.event_list import create_event_list
+
+
+PENDING_EVENTS = (10**3, 10**5, 10**7)
+HOLD_OPERATIONS = 200000
+EVENT_LISTS = ('heap', 'calendar')
+
+
+def _hold_operations_per_second(event_list_name: str, pending_events: int) -> float:
+    """
+    Classic "hold" model: the list is filled with pending events and every operation pops the earliest one and schedules a successor,
+    so the number of pending events stays constant. Times are quantized to 1e-4 like the simulation clock.
+    """
+    generator = random.Random(0)
+    entries = [(round(generator.expovariate(1) * pending_events, 4), entry_id, None) for entry_id in range(pending_events)]
+    event_list = create_event_list(event_list_name, entries)
+    del entries
+
+    start = time.perf_counter()
+
+    for entry_id in range(pending_events, pending_events + HOLD_OPERATIONS):
+        current_time = event_list.pop()[0]
+        event_list.push((round(current_time + generator.expovariate(1) * pending_events, 4), entry_id, None))
+
+    return HOLD_OPERATIONS / (time.perf_counter() - start)
+
+if __name__ == '__main__':
+    sizes = [int(float(size)) for size in sys.argv[1:]] or PENDING_EVENTS
+
+    for pending_events in sizes:
+        for event_list_name in EVENT_LISTS:
+            print(f'{event_list_name:>8} | {pending_events:>10,} pending events: {_hold_operations_per_second(event_list_name, pending_events):,.0f} hold ops/s')
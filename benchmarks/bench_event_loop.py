@@ -0,0 +1,53 @@
+import time
+
+
+from qpy import Distribution, Environment, QueueDiscipline
+
+
+SIMULATION_TIME = 20000
+WARMUP_TIME = 1000
+REPETITIONS = 3
+
+LAMBDA = 0.8
+MU = 1
+NUMBER_OF_SERVERS = 10
+
+
+def _mm1() -> Environment:
+    env = Environment()
+
+    server = env.add_server(Distribution.exponential(1/MU), QueueDiscipline.fcfs())
+    env.add_entry_point(server, Distribution.exponential(1/LAMBDA))
+
+    return env
+
+def _ten_server_network() -> Environment:
+    env = Environment()
+
+    servers = [env.add_server(Distribution.exponential(1/MU), QueueDiscipline.fcfs()) for _ in range(NUMBER_OF_SERVERS)]
+
+    for origin, destination in zip(servers, servers[1:]):
+        env.add_servers_connection(origin, destination, 0.5)
+        env.add_entry_point(destination, Distribution.exponential(1/(LAMBDA / 2)))
+
+    env.add_entry_point(servers[0], Distribution.exponential(1/LAMBDA))
+
+    return env
+
+def _events_per_second(env: Environment) -> float:
+    best = 0
+
+    for _ in range(REPETITIONS):
+        start = time.perf_counter()
+        results = env.simulate(time_in_seconds=SIMULATION_TIME, warmup_time=WARMUP_TIME, engine='event')
+        elapsed = time.perf_counter() - start
+
+        # Each visit to a server is one arrival plus one departure event
+        events = sum(2 * server.get_number_of_processed_jobs() for server in results.server_metrics)
+        best = max(best, events / elapsed)
+
+    return best
+
+if __name__ == '__main__':
+    for name, factory in (('M/M/1', _mm1), (f'{NUMBER_OF_SERVERS}-server network', _ten_server_network)):
+        print(f'{name}: {_events_per_second(factory()):,.0f} events/s')
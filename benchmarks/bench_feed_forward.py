@@ -0,0 +1,45 @@
+import sys, time
+
+
+from qpy import Distribution, Environment, QueueDiscipline
+
+
+SIMULATION_TIMES = [float(argument) for argument in sys.argv[1:]] or [1e4, 1e5, 1e6]
+REPETITIONS = 3
+
+LAMBDA = 0.8
+MU = 1
+NUMBER_OF_STAGES = 5
+
+
+def _tandem() -> Environment:
+    env = Environment()
+
+    for server in range(NUMBER_OF_STAGES):
+        env.add_server(Distribution.exponential(1/MU), QueueDiscipline.fcfs())
+
+        if server > 0:
+            env.add_servers_connection(server - 1, server, 1)
+
+    env.add_entry_point(0, Distribution.exponential(1/LAMBDA))
+
+    return env
+
+def _jobs_per_second(env: Environment, simulation_time: float, engine: str) -> float:
+    best = 0
+
+    for _ in range(REPETITIONS):
+        start = time.perf_counter()
+        results = env.simulate(time_in_seconds=simulation_time, warmup_time=simulation_time / 10, engine=engine)
+        elapsed = time.perf_counter() - start
+
+        best = max(best, results.environment_metrics.get_number_of_processed_jobs() / elapsed)
+
+    return best
+
+if __name__ == '__main__':
+    env = _tandem()
+
+    for simulation_time in SIMULATION_TIMES:
+        engines = ('event', 'feed_forward') if simulation_time <= 1e5 else ('feed_forward',)
+        print(f'{NUMBER_OF_STAGES} M/M/1 stations in tandem, {simulation_time:,.0f} time units: ' + ', '.join(f'{engine} {_jobs_per_second(env, simulation_time, engine):,.0f} jobs/s' for engine in engines))
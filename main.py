@@ -1,6 +1,10 @@
+import asyncio
 import os
 
 
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 from DTO.SimulationRequestDTO import SimulationRequest
 from DTO.SimulationResponseDTO import SimulationResponse
@@ -9,13 +13,46 @@ from fastapi.middleware.cors import CORSMiddleware
 from Mappers.SimulationResponseMapper import SimulationResponseMapper
 from Mappers.SimulationRequestMapper import SimulationRequestMapper
 from middlewares.api_key import api_key_middleware
+from qpy import Distribution, Environment
 
 load_dotenv()
 
+# Simulations run in a pool of worker processes, so a long one never blocks the event loop. At most SIMULATION_QUEUE_SIZE requests are
+# admitted at once (running or waiting for a worker); the others are turned away with a Retry-After instead of piling up
+SIMULATION_WORKERS = int(os.getenv("SIMULATION_WORKERS", os.cpu_count() or 1))
+SIMULATION_QUEUE_SIZE = int(os.getenv("SIMULATION_QUEUE_SIZE", 4 * SIMULATION_WORKERS))
+SIMULATION_RETRY_AFTER = int(os.getenv("SIMULATION_RETRY_AFTER", 5))
+
+
+def _warm_up_worker():
+    # Imports qpy and compiles a small model once per worker, so the first request a worker gets doesn't pay for it
+    env = Environment()
+    env.add_server(Distribution.constant(1))
+    env.compile()
+
+def _run_simulation(spec: dict, simulation_time: float, warmup_time: float):
+    return Environment.from_spec(spec).simulate(simulation_time, warmup_time)
+
+def _create_pool() -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers=SIMULATION_WORKERS, initializer=_warm_up_worker)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.pool = _create_pool()
+    app.state.admitted = 0
+
+    # The pool only starts its processes on demand: one task per worker starts them all before the first request
+    await asyncio.gather(*(asyncio.get_running_loop().run_in_executor(app.state.pool, os.getpid) for _ in range(SIMULATION_WORKERS)))
+
+    yield
+
+    app.state.pool.shutdown(cancel_futures=True)
+
 app = FastAPI(
     title="qpy API",
     description="API to expose QPy funcionalities",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 allowed_origins = os.getenv("ALLOWED_ORIGINS", "")
@@ -34,19 +71,37 @@ app.add_middleware(
 @app.post("/simulate")
 async def simulate(request: SimulationRequest) -> SimulationResponse:
     """
-    Recebe uma configuração de rede e executa a simulação da qpy.
+    Recebe uma configuração de rede e executa a simulação da qpy em um processo do pool.
     """
 
+    if app.state.admitted >= SIMULATION_QUEUE_SIZE:
+        raise HTTPException(status_code=429, detail="Too many simulations in progress", headers={"Retry-After": str(SIMULATION_RETRY_AFTER)})
+
     try:
         request_mapper = SimulationRequestMapper(request)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-        env = request_mapper.get_environemnt()
+    app.state.admitted += 1
+    pool = app.state.pool
 
-        results = env.simulate(float(request.networkParameters.simulationTime), float(request.networkParameters.warmupTime))
+    try:
+        results = await asyncio.get_running_loop().run_in_executor(pool, _run_simulation, request_mapper.get_spec(), float(request.networkParameters.simulationTime), float(request.networkParameters.warmupTime))
 
         response_mapper = SimulationResponseMapper(results, request_mapper.get_ids_map())
 
         return response_mapper.get_response_object()
 
+    except BrokenProcessPool:
+        # A worker died (e.g. out of memory): the pool can't run anything else, so it is replaced for the next requests
+        if app.state.pool is pool:
+            app.state.pool = _create_pool()
+            pool.shutdown(wait=False)
+
+        raise HTTPException(status_code=503, detail="Simulation workers are unavailable", headers={"Retry-After": str(SIMULATION_RETRY_AFTER)})
+
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
+
+    finally:
+        app.state.admitted -= 1
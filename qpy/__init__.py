@@ -1,11 +1,20 @@
+from .cache import ResultCache
 from .distribution import Distribution
 from .environment import Environment
-from .results import SimulationResults
+from .results import ReplicationResults, SimulationResults
 from .queue_discipline import QueueDiscipline
+from .sweep import SweepDesign, SweepResults, run_sweep
+from .trace import JobTrace
 
 __all__ = [
-    "Environment"
-    "Distribution"
-    "QueueDiscipline"
-    "SimulationResults"
+    "Environment",
+    "Distribution",
+    "JobTrace",
+    "QueueDiscipline",
+    "ReplicationResults",
+    "ResultCache",
+    "SimulationResults",
+    "SweepDesign",
+    "SweepResults",
+    "run_sweep",
 ]
\ No newline at end of file
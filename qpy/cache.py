@@ -0,0 +1,110 @@
+import os
+import pickle
+import sqlite3
+
+
+from .results import SimulationResults
+from .spec import spec_hash
+from contextlib import closing
+from pydantic import PositiveInt, validate_call
+from typing import Optional
+
+
+# Bumped whenever the engines change what a given model and seed produce, so older entries are never returned
+CACHE_FORMAT_VERSION = 1
+DEFAULT_CACHE_SIZE = 1024 ** 3
+SQLITE_TIMEOUT = 30
+# Accesses are ordered by a counter kept in the file rather than the clock, so the LRU order holds across processes and fast calls
+NEXT_ACCESS = '(SELECT COALESCE(MAX(last_access), 0) + 1 FROM results)'
+
+
+class ResultCache:
+    """
+    On-disk cache of simulation results in a SQLite file, keyed by the SHA-256 of the model spec and the run parameters (see key). A seeded
+    run is deterministic, so a hit returns the results of the earlier run without simulating. When the stored results exceed
+    `maximum_size_in_bytes`, the least recently used ones are evicted.
+
+    Results are stored pickled: only open cache files you trust. The file can be shared by several processes.
+    """
+    @validate_call
+    def __init__(self, path: str, maximum_size_in_bytes: PositiveInt = DEFAULT_CACHE_SIZE):
+        """
+        Opens the cache at `path`, creating the file if needed.
+
+        Parameters
+        ----------
+        path : str - Required
+            The SQLite file of the cache.
+
+        maximum_size_in_bytes : int - Optional
+            The maximum total size of the stored results. Default is 1 GiB.
+        """
+        self.path = path
+        self.maximum_size_in_bytes = maximum_size_in_bytes
+        self.hits = 0
+        self.misses = 0
+
+        directory = os.path.dirname(path)
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as connection:
+            connection.execute('CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, last_access INTEGER NOT NULL)')
+            connection.execute('CREATE INDEX IF NOT EXISTS results_by_last_access ON results (last_access)')
+
+    def _connect(self):
+        return closing(sqlite3.connect(self.path, timeout=SQLITE_TIMEOUT, isolation_level=None))
+
+    @staticmethod
+    def key(spec: dict, parameters: dict) -> str:
+        """The cache key of a run: the hash of the model spec (see Environment.to_spec) and of every parameter that changes its results."""
+        return spec_hash({'format': CACHE_FORMAT_VERSION, 'model': spec, 'parameters': parameters})
+
+    def get(self, key: str) -> Optional[SimulationResults]:
+        with self._connect() as connection:
+            row = connection.execute('SELECT value FROM results WHERE key = ?', (key,)).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            connection.execute(f'UPDATE results SET last_access = {NEXT_ACCESS} WHERE key = ?', (key,))
+
+        self.hits += 1
+
+        return pickle.loads(row[0])
+
+    def put(self, key: str, results: SimulationResults):
+        value = pickle.dumps(results, protocol=pickle.HIGHEST_PROTOCOL)
+
+        if len(value) > self.maximum_size_in_bytes:
+            return
+
+        with self._connect() as connection:
+            connection.execute('BEGIN IMMEDIATE')
+            connection.execute(f'INSERT OR REPLACE INTO results (key, value, size, last_access) VALUES (?, ?, ?, {NEXT_ACCESS})', (key, value, len(value)))
+
+            excess = connection.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0] - self.maximum_size_in_bytes
+
+            for evicted_key, size in connection.execute('SELECT key, size FROM results ORDER BY last_access').fetchall():
+                if excess <= 0:
+                    break
+
+                connection.execute('DELETE FROM results WHERE key = ?', (evicted_key,))
+                excess -= size
+
+            connection.execute('COMMIT')
+
+    def size(self) -> int:
+        """The total size of the stored results, in bytes."""
+        with self._connect() as connection:
+            return connection.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+
+    def __len__(self) -> int:
+        with self._connect() as connection:
+            return connection.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+    def clear(self):
+        with self._connect() as connection:
+            connection.execute('DELETE FROM results')
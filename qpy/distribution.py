@@ -1,44 +1,104 @@
 import random, numpy as np
 
 
-from abc import ABC, abstractmethod
+from abc import ABC
 from pydantic import validate_call
+from typing import Optional
+
+
+SAMPLE_BLOCK_SIZE = 4096
 
 
 class IDistribution(ABC):
-    @abstractmethod
-    def sample(self):
-        pass
+    """
+    Samples are drawn from a NumPy Generator in blocks of SAMPLE_BLOCK_SIZE and handed out one by one by sample(), so the per-sample cost is
+    an index bump instead of a Python-level RNG call. Unless a generator is given to reset(), it is seeded from the random module on first
+    use, so random.seed() keeps simulations reproducible.
+    """
+    _generator = None
+    _buffer = ()
+    _index = 0
+
+    def _draw_block(self, generator: np.random.Generator, size: int) -> np.ndarray:
+        # A distribution that only defines sample() gets its blocks from it; the built-in ones draw them from the generator instead
+        if type(self).sample is IDistribution.sample:
+            raise NotImplementedError(f'{type(self).__name__} must define sample() or _draw_block().')
+
+        return np.array([self.sample() for _ in range(size)], dtype=float)
+
+    def _get_generator(self) -> np.random.Generator:
+        if self._generator is None:
+            self._generator = np.random.default_rng(random.getrandbits(128))
+
+        return self._generator
+
+    def reset(self, generator: Optional[np.random.Generator] = None):
+        self._generator = generator
+        self._buffer = ()
+        self._index = 0
+
+    def sample(self) -> float:
+        index = self._index
+
+        if index == len(self._buffer):
+            self._buffer = self._draw_block(self._get_generator(), SAMPLE_BLOCK_SIZE).tolist()
+            index = 0
+
+        self._index = index + 1
+
+        return self._buffer[index]
+
+    def sample_many(self, size: int) -> np.ndarray:
+        return self._draw_block(self._get_generator(), size)
+
+    def to_spec(self) -> dict:
+        """The factory of Distribution that builds this distribution and its parameters, see Distribution.from_spec."""
+        raise ValueError(f'{type(self).__name__} has no spec: only the distributions built by Distribution can be described by one.')
 
 class ConstantDistribution(IDistribution):
     def __init__(self, value: float):
         self._value = value
-    
+
+    def _draw_block(self, generator: np.random.Generator, size: int) -> np.ndarray:
+        return np.full(size, float(self._value))
+
     def sample(self) -> float:
-        return max(round(self._value, 4), 0.0001)
+        return self._value
+
+    def to_spec(self) -> dict:
+        return {'type': 'constant', 'value': float(self._value)}
 
 class ExponentialDistribution(IDistribution):
     def __init__(self, lambda_value: float):
         self._lambda_value = lambda_value
-    
-    def sample(self) -> float:
-        return max(round(-np.log(1 - random.random()) * self._lambda_value, 4), 0.0001)
+
+    def _draw_block(self, generator: np.random.Generator, size: int) -> np.ndarray:
+        return generator.exponential(self._lambda_value, size)
+
+    def to_spec(self) -> dict:
+        return {'type': 'exponential', 'lambda_value': float(self._lambda_value)}
 
 class UniformDistribution(IDistribution):
     def __init__(self, lower_bound: float, upper_bound: float):
         self._lower_bound = lower_bound
         self._upper_bound = upper_bound
-    
-    def sample(self) -> float:
-        return max(round(random.uniform(self._lower_bound, self._upper_bound), 4), 0.0001)
+
+    def _draw_block(self, generator: np.random.Generator, size: int) -> np.ndarray:
+        return generator.uniform(self._lower_bound, self._upper_bound, size)
+
+    def to_spec(self) -> dict:
+        return {'type': 'uniform', 'lower_bound': float(self._lower_bound), 'upper_bound': float(self._upper_bound)}
     
 class NormalDistribution(IDistribution):
     def __init__(self, mu: float, sigma: float):
         self._mu = mu
         self._sigma = sigma
-    
-    def sample(self) -> float:
-        return max(round(random.gauss(self._mu, self._sigma), 4), 0.0001)
+
+    def _draw_block(self, generator: np.random.Generator, size: int) -> np.ndarray:
+        return np.maximum(generator.normal(self._mu, self._sigma, size), 0.0)
+
+    def to_spec(self) -> dict:
+        return {'type': 'normal', 'mu': float(self._mu), 'sigma': float(self._sigma)}
     
 class Distribution():
     def __new__(cls, *args, **kwargs):
@@ -121,4 +181,24 @@ class Distribution():
         if mu < 0 or sigma < 0:
             raise ValueError('Negative values for distribution parameters are not allowed')
                 
-        return NormalDistribution(mu, sigma)
\ No newline at end of file
+        return NormalDistribution(mu, sigma)
+
+    @staticmethod
+    @validate_call
+    def from_spec(spec: dict) -> IDistribution:
+        """
+        Returns the distribution described by `spec`, as given by the to_spec() method of a distribution.
+
+        Parameters
+        ----------
+        spec : dict - Required
+            The name of the factory under 'type' and its parameters, e.g. {'type': 'exponential', 'lambda_value': 2.0}.
+        """
+        factories = {'constant': Distribution.constant, 'exponential': Distribution.exponential, 'uniform': Distribution.uniform, 'normal': Distribution.normal}
+        parameters = {key: value for key, value in spec.items() if key != 'type'}
+
+        if spec.get('type') not in factories:
+            raise ValueError(f'Distribution not allowed in a spec: {spec.get("type")}')
+
+        return factories[spec['type']](**parameters)
+
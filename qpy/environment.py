@@ -1,16 +1,32 @@
-from .distribution import IDistribution
+import numpy as np
+import random
+
+
+from concurrent.futures import ProcessPoolExecutor
+from .cache import ResultCache
+from .distribution import Distribution, IDistribution
 from .execution import Execution
+from .feed_forward import FeedForwardExecution, is_feed_forward_eligible
+from .lindley import LindleyExecution, is_lindley_eligible
 from .network import ClosedNetwork, OpenNetwork
-from .queue_discipline import IQueue
-from .results import SimulationResults
+from .plan import ExecutionPlan
+from .queue_discipline import IQueue, QueueDiscipline
+from .results import ReplicationResults, SimulationResults
+from .spec import SPEC_VERSION, priorities_from_spec, spec_hash
+from .time_resolution import DEFAULT_TIME_RESOLUTION, TimeResolution
+from .trace import JobTrace
 from .utils import validate_priority_input
-from typing import Optional
-from pydantic import validate_call
+from typing import Annotated, Literal, Optional, Union
+from pydantic import Field, PositiveFloat, PositiveInt, validate_call
+
+
+def _simulate_replication(environment: 'Environment', time_in_seconds: float, warmup_time: Union[float, Literal['auto']], seed: int, event_list: str, engine: str) -> SimulationResults:
+    return environment.simulate(time_in_seconds, warmup_time, event_list=event_list, seed=seed, engine=engine)
 
 
 class Environment():
     @validate_call(config=dict(arbitrary_types_allowed=True))
-    def __init__(self, number_of_terminals: Optional[int] = None, think_time_distribution: Optional[IDistribution] = None, time_unit: str = 'seconds'):
+    def __init__(self, number_of_terminals: Optional[int] = None, think_time_distribution: Optional[IDistribution] = None, time_unit: str = 'seconds', time_resolution: Optional[float] = DEFAULT_TIME_RESOLUTION):
         """
         Initializes the Environment object. Determines if the network is open or closed based on the input.
 
@@ -24,10 +40,16 @@ class Environment():
         
         time_unit : str - Optional
             The unit of time used for reporting results. Default is 'seconds'.
+
+        time_resolution : float - Optional
+            The size of a clock tick, in time units. Every event time and sampled duration is snapped to a whole number of ticks and lasts at
+            least one tick. Default is 0.0001. If None, times keep full float precision and are never rounded, which is faster and suits models
+            whose times are smaller than a tick.
         """        
         self._network = None
         self._is_closed = False
-        self._time_unit = time_unit    
+        self._time_unit = time_unit
+        self._time_resolution = TimeResolution(time_resolution)
         
         if number_of_terminals is None or think_time_distribution is None or number_of_terminals <= 0:
             self._network = OpenNetwork()
@@ -35,8 +57,94 @@ class Environment():
             self._network = ClosedNetwork(think_time_distribution, number_of_terminals)
             self._is_closed = True
     
-    def _reset_environment(self):
-        self._network.reset_servers()
+    def compile(self) -> ExecutionPlan:
+        """
+        Validates the environment and freezes it into an immutable execution plan: routing and priority CDF arrays, integer queue discipline
+        codes and pre-bound sampling functions. The plan is cached and reused by every call to simulate until the environment is changed.
+
+        Returns
+        -------
+        ExecutionPlan
+            The compiled plan of this environment.
+        """
+        return self._network.compile(self._time_resolution)
+
+    def to_spec(self) -> dict:
+        """
+        Describes the whole model as a plain dict of JSON values: servers with their service distribution, queue discipline and routing,
+        entry points or terminals, priorities, time unit and time resolution. Environment.from_spec(spec) rebuilds an equivalent
+        environment, which gives the same runs for the same seed. The spec is versioned by its 'version' key.
+
+        Returns
+        -------
+        dict
+            The spec of this environment.
+
+        Raises
+        ------
+        ValueError
+            If a distribution or queue discipline was not built by the Distribution or QueueDiscipline factories.
+        """
+        return {'version': SPEC_VERSION, 'time_unit': self._time_unit, 'time_resolution': self._time_resolution.tick, **self._network.to_spec()}
+
+    def content_hash(self) -> str:
+        """
+        SHA-256 of the canonical JSON of the spec of this environment (see to_spec). Equal models built the same way have the same hash,
+        on any machine and across runs.
+
+        Returns
+        -------
+        str
+            The hash, in hexadecimal.
+        """
+        return spec_hash(self.to_spec())
+
+    @staticmethod
+    @validate_call
+    def from_spec(spec: dict):
+        """
+        Builds the environment described by a spec given by to_spec(), possibly after a round trip through JSON.
+
+        Parameters
+        ----------
+        spec : dict - Required
+            The spec of the environment.
+
+        Returns
+        -------
+        Environment
+            A new environment equivalent to the one the spec was taken from.
+
+        Raises
+        ------
+        ValueError
+            If the spec has another version or describes an invalid model.
+        """
+        if spec.get('version') != SPEC_VERSION:
+            raise ValueError(f'Unsupported spec version {spec.get("version")}, expected {SPEC_VERSION}.')
+
+        terminals = spec['terminals']
+
+        if terminals:
+            environment = Environment(terminals['number_of_terminals'], Distribution.from_spec(terminals['think_time']), spec['time_unit'], spec['time_resolution'])
+        else:
+            environment = Environment(time_unit=spec['time_unit'], time_resolution=spec['time_resolution'])
+
+        for server in spec['servers']:
+            environment.add_server(Distribution.from_spec(server['service']), QueueDiscipline.from_spec(server['queue']))
+        for server_id, server in enumerate(spec['servers']):
+            for route in server['routing']:
+                environment.add_servers_connection(server_id, route['server'], route['probability'])
+        for entry_point in spec['entry_points']:
+            environment.add_entry_point(entry_point['server'], Distribution.from_spec(entry_point['arrival']), priorities_from_spec(entry_point['priorities']))
+
+        if terminals:
+            for route in terminals['routing']:
+                environment.add_terminals_routing_probability(route['server'], route['probability'])
+            if terminals['priorities']:
+                environment.add_priority_closed_network(priorities_from_spec(terminals['priorities']))
+
+        return environment
 
     @validate_call(config=dict(arbitrary_types_allowed=True))
     def add_server(self, service_distribution: IDistribution, queue_discipline: Optional[IQueue] = None) -> int:
@@ -145,27 +253,169 @@ class Environment():
         else:
             raise ValueError('Open network does not allow terminal routing')
     
-    @validate_call
-    def simulate(self, time_in_seconds: float, warmup_time: float) -> SimulationResults:
+    @validate_call(config=dict(arbitrary_types_allowed=True))
+    def simulate(self, time_in_seconds: float, warmup_time: Union[float, Literal['auto']], event_list: Literal['heap', 'calendar'] = 'heap', debug: bool = False, seed: Optional[int] = None, engine: Literal['auto', 'event', 'lindley', 'feed_forward'] = 'auto', trace: Optional[JobTrace] = None, disable_gc: bool = False, target_relative_half_width: Optional[PositiveFloat] = None, confidence: Annotated[float, Field(gt=0, lt=1)] = 0.95, batch_means: bool = False, overlapping_batches: bool = False, cache: Optional[ResultCache] = None) -> SimulationResults:
         """
         Runs the simulation for the specified time, including a warm-up period. Without the warm-up, the metrics could be compromised.
 
         Parameters
         ----------
         time_in_seconds : float - Required
-            The total simulation time, excluding the warm-up period.
+            The total simulation time, excluding the warm-up period. With target_relative_half_width, the maximum simulation time.
         
-        warmup_time : float - Required
-            The warm-up period before collecting statistics. Jobs executed during this time are ignored in the results.
+        warmup_time : float | str - Required
+            The warm-up period before collecting statistics. Jobs executed during this time are ignored in the results. If 'auto', the
+            'event' engine finds the end of the initial transient itself with the MSER-5 rule (applied to the batch means of the response
+            time and of the number of jobs in the system) and starts measuring once it does: SimulationResults.warmup_time is that
+            detection time, and the earlier truncation point chosen by MSER is reported in SimulationResults.warmup_truncation_time. The
+            warm-up never exceeds time_in_seconds.
+
+        event_list : str - Optional
+            The data structure holding the pending events. 'heap' (default) uses a binary heap, 'calendar' uses a calendar queue keyed on the
+            simulation clock ticks, which keeps scheduling close to O(1) when many events are pending. Both produce events in the same order.
+
+        debug : bool - Optional
+            The whole model is validated once, when it is compiled, and the engine then runs without per-event checks. If True,
+            every job, server and metric update is also validated while the simulation runs, which is slower but helps locating bugs.
+
+        seed : int - Optional
+            Seed of the simulation. Every entry point, server service, routing decision and terminal draws from its own independent stream
+            derived from it, so the same seed always reproduces the same run, parallel runs don't share state and streams stay aligned across
+            runs (e.g. for common random numbers). If not provided, the seed is drawn from the random module.
+
+        engine : str - Optional
+            'event' runs the general event-driven engine. 'lindley' solves a single FCFS server with one entry point, no priorities and no
+            routing between servers over NumPy arrays (Lindley recursion), which is orders of magnitude faster; the individual jobs are not
+            kept in the results. 'feed_forward' extends it to open networks of FCFS servers without priorities whose routing has no cycles,
+            solving the servers one after the other. 'auto' (default) uses 'lindley' or else 'feed_forward' whenever the model allows it and
+            neither debug, trace, batch means, target_relative_half_width nor an 'auto' warmup_time is set, and 'event' otherwise.
+
+        trace : JobTrace - Optional
+            Individual jobs are not kept in the results by default, so memory doesn't grow with the simulated time. To inspect them, pass
+            JobTrace.last(n) (ring buffer of the last n departed jobs), JobTrace.sample(k) (one of every k departures) or
+            JobTrace.sink(callback) (each departure is handed to callback and nothing is kept). Only the 'event' engine records jobs.
+
+        disable_gc : bool - Optional
+            If True, Python's cyclic garbage collector is frozen and disabled while the 'event' engine runs, and restored afterwards. This
+            avoids collection passes triggered by the constant creation of events and jobs, at the cost of reclaiming reference cycles
+            only after the run.
+
+        target_relative_half_width : float - Optional
+            If provided, the 'event' engine keeps batch-means confidence intervals of E[T] and of the utilization of every server and stops
+            as soon as all their half-widths are within this fraction of their means (e.g. 0.01 for 1%), or at time_in_seconds otherwise.
+            The intervals are only checked after at least 10000 measured departures, so a short run never stops on a spuriously narrow one.
+            The measured time is then the time actually run, and the achieved intervals are reported by
+            environment_metrics.get_time_in_system_confidence_interval() and server.get_server_utilization_confidence_interval().
+
+        confidence : float - Optional
+            Confidence level of the intervals checked by target_relative_half_width. Default is 0.95.
+
+        batch_means : bool - Optional
+            If True, the 'event' engine also keeps batch-means estimators (in constant memory, with the batch size chosen automatically) for
+            every mean of the environment, server and priority metrics, whose get_*_confidence_interval() methods then return the mean,
+            the variance of the batch means and the half-width of the confidence interval from this single run. Always on with
+            target_relative_half_width.
+
+        overlapping_batches : bool - Optional
+            If True, the batch-means estimators use overlapping batches, whose variance estimate is more stable for the same run length.
+            Implies batch_means.
+
+        cache : ResultCache - Optional
+            If provided, the results are looked up in the cache by the hash of the model spec, the seed and the other parameters above
+            before simulating, and stored in it after. A hit returns the results of the earlier run without simulating. Requires a seed
+            and no trace, and every distribution and discipline must have a spec (see to_spec).
 
         Returns
         -------
         SimulationResults
             An object containing the metrics and results from the simulation.
         """
-        self._reset_environment()
-        queue = self._network.generate_jobs(time_in_seconds + warmup_time)
+        if cache is not None:
+            if seed is None or trace is not None:
+                raise ValueError('Only seeded simulations without a trace can be cached.')
+
+            # debug and disable_gc don't change the results, so they are not part of the key
+            key = cache.key(self.to_spec(), {'time_in_seconds': time_in_seconds, 'warmup_time': warmup_time, 'event_list': event_list, 'seed': seed, 'engine': engine, 'target_relative_half_width': target_relative_half_width, 'confidence': confidence, 'batch_means': batch_means, 'overlapping_batches': overlapping_batches})
+            results = cache.get(key)
+
+            if results is None:
+                results = self.simulate(time_in_seconds, warmup_time, event_list, debug, seed, engine, trace, disable_gc, target_relative_half_width, confidence, batch_means, overlapping_batches)
+                cache.put(key, results)
+
+            return results
+
+        if seed is None:
+            seed = random.getrandbits(128)
+
+        plan = self.compile().with_streams(seed)
+        event_only_options = [option for option, is_set in (('trace', trace is not None), ('warmup_time=\'auto\'', warmup_time == 'auto'), ('target_relative_half_width', target_relative_half_width is not None), ('batch_means', batch_means or overlapping_batches)) if is_set]
+        vectorize = engine == 'auto' and not debug and not event_only_options
+
+        if engine in ('lindley', 'feed_forward') and event_only_options:
+            raise ValueError(f'The {engine} engine does not support {", ".join(event_only_options)}, use engine=\'event\'.')
+
+        if engine == 'lindley' or (vectorize and is_lindley_eligible(plan)):
+            return LindleyExecution(time_in_seconds, warmup_time, plan, self._time_unit).execute()
+        if engine == 'feed_forward' or (vectorize and is_feed_forward_eligible(plan)):
+            return FeedForwardExecution(time_in_seconds, warmup_time, plan, self._time_unit).execute()
+
+        self._network.load_plan(plan, checked=debug)
+        queue = self._network.generate_jobs(time_in_seconds + (time_in_seconds if warmup_time == 'auto' else warmup_time))
+
+        new_execution = Execution(time_in_seconds, warmup_time, queue, self._network, self._time_unit, event_list, checked=debug, time_resolution=self._time_resolution, trace=trace, disable_gc=disable_gc, target_relative_half_width=target_relative_half_width, confidence=confidence, batch_means=batch_means, overlapping_batches=overlapping_batches)
+
+        return new_execution.execute()
+
+    @validate_call
+    def simulate_replications(self, number_of_replications: Annotated[int, Field(ge=2)], time_in_seconds: float, warmup_time: Union[float, Literal['auto']], workers: Optional[PositiveInt] = None, seed: Optional[int] = None, confidence: Annotated[float, Field(gt=0, lt=1)] = 0.95, event_list: Literal['heap', 'calendar'] = 'heap', engine: Literal['auto', 'event', 'lindley', 'feed_forward'] = 'auto') -> ReplicationResults:
+        """
+        Runs independent replications of the simulation in parallel and aggregates them. Each replication is a full call to simulate with
+        its own 64-bit seed, one of the words generated from `seed` by NumPy's SeedSequence (not a spawned child sequence), so the whole
+        set is reproducible from one seed, whatever the number of workers.
+
+        Parameters
+        ----------
+        number_of_replications : int - Required
+            The number of independent replications, at least 2.
+
+        time_in_seconds : float - Required
+            The simulation time of each replication, excluding the warm-up period.
+
+        warmup_time : float | str - Required
+            The warm-up period of each replication, or 'auto' (see simulate).
+
+        workers : int - Optional
+            The number of worker processes. If not provided, one per CPU. With 1, the replications run one after the other in this process.
+
+        seed : int - Optional
+            Seed from which the seeds of the replications are generated. If not provided, it is drawn from the random module.
+
+        confidence : float - Optional
+            Confidence level of the Student's t intervals over the replications. Default is 0.95.
+
+        event_list : str - Optional
+            The event list of each replication (see simulate).
+
+        engine : str - Optional
+            The engine of each replication (see simulate).
+
+        Returns
+        -------
+        ReplicationResults
+            The results of every replication and the mean, standard deviation and confidence interval half-width of every environment,
+            server and priority metric over them.
+        """
+        if seed is None:
+            seed = random.getrandbits(128)
+
+        seeds = [int(replication_seed) for replication_seed in np.random.SeedSequence(seed).generate_state(number_of_replications, np.uint64)]
+        arguments = ([self] * number_of_replications, [time_in_seconds] * number_of_replications, [warmup_time] * number_of_replications, seeds, [event_list] * number_of_replications, [engine] * number_of_replications)
+
+        if workers == 1:
+            replications = list(map(_simulate_replication, *arguments))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                replications = list(executor.map(_simulate_replication, *arguments))
 
-        new_execution = Execution(time_in_seconds, warmup_time, queue, self._network, self._time_unit)
+        return ReplicationResults(replications, confidence)
 
-        return new_execution.execute()
\ No newline at end of file
@@ -0,0 +1,201 @@
+import math
+import numpy as np
+
+
+from statistics import NormalDist
+from typing import NamedTuple, Optional
+
+
+BATCH_MEANS_MAXIMUM_BATCHES = 40
+BATCH_MEANS_MINIMUM_BATCHES = 10
+# One-sided 5% test of the lag-1 autocorrelation of the batch means: above it the batches are too small to be taken as independent
+INDEPENDENCE_TEST_QUANTILE = 1.645
+OVERLAPPING_SUB_BATCHES = 4
+# Sequential stopping only looks at the intervals after this many observations: early batches of a few jobs each look independent and
+# tight long before the run covers the correlation of a congested system, so the rule would stop on a spuriously narrow interval
+PRECISION_MINIMUM_OBSERVATIONS = 10000
+STUDENT_T_NEWTON_STEPS = 50
+
+
+def _student_t_cdf(t: float, degrees_of_freedom: int) -> float:
+    # Closed form of the CDF for an integer number of degrees of freedom (Abramowitz & Stegun 26.7.3 / 26.7.4)
+    theta = math.atan(t / math.sqrt(degrees_of_freedom))
+    squared_cosine = math.cos(theta) ** 2
+    term = 1.0
+    total = 1.0
+
+    if degrees_of_freedom % 2 == 1:
+        for k in range(3, degrees_of_freedom, 2):
+            term *= squared_cosine * (k - 1) / k
+            total += term
+
+        probability = (2 / math.pi) * (theta + (math.sin(theta) * math.cos(theta) * total if degrees_of_freedom > 1 else 0))
+    else:
+        for k in range(2, degrees_of_freedom, 2):
+            term *= squared_cosine * (k - 1) / k
+            total += term
+
+        probability = math.sin(theta) * total
+
+    return (1 + probability) / 2
+
+def _student_t_pdf(t: float, degrees_of_freedom: int) -> float:
+    log_density = math.lgamma((degrees_of_freedom + 1) / 2) - math.lgamma(degrees_of_freedom / 2) - (degrees_of_freedom + 1) / 2 * math.log1p(t * t / degrees_of_freedom)
+
+    return math.exp(log_density) / math.sqrt(degrees_of_freedom * math.pi)
+
+def student_t_quantile(probability: float, degrees_of_freedom: int) -> float:
+    """
+    Quantile of the Student's t distribution. Starts from the Cornish-Fisher expansion around the normal quantile and refines it with
+    Newton steps on the exact CDF, so no statistics package is needed.
+    """
+    if degrees_of_freedom == 1:
+        return math.tan(math.pi * (probability - 0.5))
+    if degrees_of_freedom == 2:
+        return (2 * probability - 1) / math.sqrt(2 * probability * (1 - probability))
+
+    z = NormalDist().inv_cdf(probability)
+    t = z + (z ** 3 + z) / (4 * degrees_of_freedom) + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * degrees_of_freedom ** 2)
+
+    for _ in range(STUDENT_T_NEWTON_STEPS):
+        step = (_student_t_cdf(t, degrees_of_freedom) - probability) / _student_t_pdf(t, degrees_of_freedom)
+        t -= step
+
+        if abs(step) < 1e-12 * max(1, abs(t)):
+            break
+
+    return t
+
+class ReplicationStatistics(NamedTuple):
+    """Mean, standard deviation and Student's t half-width of a metric over independent replications."""
+    mean: float
+    standard_deviation: float
+    half_width: float
+
+def replication_statistics(values, confidence: float = 0.95) -> ReplicationStatistics:
+    values = np.asarray(values, dtype=float)
+    standard_deviation = float(np.std(values, ddof=1)) if len(values) > 1 else 0.0
+    half_width = student_t_quantile((1 + confidence) / 2, len(values) - 1) * standard_deviation / math.sqrt(len(values)) if len(values) > 1 else math.inf
+
+    return ReplicationStatistics(float(np.mean(values)), standard_deviation, half_width)
+
+class ConfidenceInterval(NamedTuple):
+    """Point estimate, variance of the batch means and Student's t half-width of a steady-state mean."""
+    mean: float
+    variance: float
+    half_width: float
+
+    @property
+    def relative_half_width(self) -> float:
+        return self.half_width / abs(self.mean) if self.mean != 0 else math.inf
+
+def _lag_one_autocorrelation(means: np.ndarray) -> float:
+    deviations = means - means.mean()
+    squares = float(np.dot(deviations, deviations))
+
+    return float(np.dot(deviations[:-1], deviations[1:])) / squares if squares > 0 else 0.0
+
+class BatchMeans:
+    """
+    Batch-means estimator of a steady-state mean from one long run, in constant memory. Observations are grouped in batches of
+    `batch_size` and only the total of each batch is kept. When the stored batches are full, neighbouring batches are merged and the
+    batch size doubles, so the batches grow with the run and their means become less correlated.
+
+    Each observation carries a weight: the batch mean is the sum of the values over the sum of the weights (1 per observation for means
+    per job, the elapsed time for time averages).
+
+    The batch size of the interval is chosen when it is computed: stored batches are grouped in pairs, then fours, ... while the lag-1
+    autocorrelation of the batch means is significant, keeping at least BATCH_MEANS_MINIMUM_BATCHES batches. With `overlapping`, each
+    batch is stored as OVERLAPPING_SUB_BATCHES sub-batches and the interval uses every window of consecutive sub-batches with the chosen
+    size (overlapping batch means), which gives a more stable variance estimate for the same run.
+    """
+    def __init__(self, maximum_number_of_batches: int = BATCH_MEANS_MAXIMUM_BATCHES, overlapping: bool = False):
+        self.maximum_number_of_batches = maximum_number_of_batches
+        self.overlapping = overlapping
+        self.batch_size = 1
+        self.number_of_observations = 0
+        self._sub_batches = OVERLAPPING_SUB_BATCHES if overlapping else 1
+        self._slots = maximum_number_of_batches * self._sub_batches
+        self._values = []
+        self._weights = []
+        self._batch_value = 0.0
+        self._batch_weight = 0.0
+        self._batch_observations = 0
+
+    def add(self, value: float, weight: float = 1.0):
+        self._batch_value += value
+        self._batch_weight += weight
+        self._batch_observations += 1
+        self.number_of_observations += 1
+
+        if self._batch_observations < self.batch_size:
+            return
+
+        self._values.append(self._batch_value)
+        self._weights.append(self._batch_weight)
+        self._batch_value = 0.0
+        self._batch_weight = 0.0
+        self._batch_observations = 0
+
+        if len(self._values) == self._slots:
+            self._values = [self._values[i] + self._values[i + 1] for i in range(0, self._slots, 2)]
+            self._weights = [self._weights[i] + self._weights[i + 1] for i in range(0, self._slots, 2)]
+            self.batch_size *= 2
+
+    @property
+    def number_of_batches(self) -> int:
+        return len(self._values)
+
+    @property
+    def batch_completed(self) -> bool:
+        """True right after an observation completed a batch."""
+        return self.number_of_observations > 0 and self._batch_observations == 0
+
+    def _stored_batches_per_batch(self, cumulative_values: np.ndarray, cumulative_weights: np.ndarray) -> Optional[int]:
+        """Number of stored batches in each batch of the interval, or None if the batch means stay correlated down to the minimum."""
+        batches_per_batch = self._sub_batches
+
+        while len(self._values) // batches_per_batch >= BATCH_MEANS_MINIMUM_BATCHES:
+            limits = np.arange(0, len(self._values) + 1, batches_per_batch)
+            means = np.diff(cumulative_values[limits]) / np.diff(cumulative_weights[limits])
+
+            if _lag_one_autocorrelation(means) <= INDEPENDENCE_TEST_QUANTILE / math.sqrt(len(means)):
+                return batches_per_batch
+
+            batches_per_batch *= 2
+
+        return None
+
+    def confidence_interval(self, confidence: float = 0.95) -> Optional[ConfidenceInterval]:
+        """
+        Mean of the complete batches with the variance of the batch means and the Student's t half-width at `confidence`. None until half
+        of the batches are filled, or while even the largest batches are still correlated.
+        """
+        number_of_batches = len(self._values)
+
+        if number_of_batches < self._slots // 2 or not all(self._weights):
+            return None
+
+        cumulative_values = np.concatenate(([0.0], np.cumsum(self._values)))
+        cumulative_weights = np.concatenate(([0.0], np.cumsum(self._weights)))
+        batches_per_batch = self._stored_batches_per_batch(cumulative_values, cumulative_weights)
+
+        if batches_per_batch is None:
+            return None
+
+        mean = cumulative_values[-1] / cumulative_weights[-1]
+
+        if self.overlapping:
+            # Every window of `batches_per_batch` consecutive sub-batches, with Meketon & Schmeiser's estimator and degrees of freedom
+            means = (cumulative_values[batches_per_batch:] - cumulative_values[:-batches_per_batch]) / (cumulative_weights[batches_per_batch:] - cumulative_weights[:-batches_per_batch])
+            variance = float(np.sum((means - mean) ** 2)) / (number_of_batches - batches_per_batch)
+            mean_variance = batches_per_batch * variance / (number_of_batches - batches_per_batch + 1)
+            degrees_of_freedom = max(1, int(1.5 * (number_of_batches / batches_per_batch - 1)))
+        else:
+            limits = np.arange(0, number_of_batches + 1, batches_per_batch)
+            means = np.diff(cumulative_values[limits]) / np.diff(cumulative_weights[limits])
+            variance = float(np.var(means, ddof=1))
+            mean_variance = variance / len(means)
+            degrees_of_freedom = len(means) - 1
+
+        return ConfidenceInterval(float(mean), variance, student_t_quantile((1 + confidence) / 2, degrees_of_freedom) * math.sqrt(mean_variance))
@@ -1,12 +1,24 @@
 from .job import Job
+from enum import IntEnum
+from typing import Optional
 
 
+class EventType(IntEnum):
+    ARRIVAL = 0
+    DEPARTURE = 1
+    PREEMPTION = 2
+
 class Event:
-    def __init__(self, current_time: float, event_id: int, event_type: str, job: Job, server_id: int):
+    __slots__ = ('current_time', 'id', 'type', 'job', 'server_id', 'entry_point', 'canceled')
+
+    def __init__(self, current_time: float, event_id: int, event_type: EventType, job: Job, server_id: int, entry_point: Optional[int] = None):
+        self.restart(current_time, event_id, event_type, job, server_id, entry_point)
+
+    def restart(self, current_time: float, event_id: int, event_type: EventType, job: Job, server_id: int, entry_point: Optional[int] = None):
         self.current_time = current_time
         self.id = event_id
         self.type = event_type
         self.job = job
         self.server_id = server_id
-        self.server = None
-        self.canceled = False
\ No newline at end of file
+        self.entry_point = entry_point
+        self.canceled = False
@@ -0,0 +1,173 @@
+import heapq
+
+
+from abc import ABC, abstractmethod
+from bisect import insort
+
+
+class IEventList(ABC):
+    @abstractmethod
+    def push(self, entry: tuple):
+        pass
+
+    @abstractmethod
+    def pop(self) -> tuple:
+        pass
+
+    @abstractmethod
+    def remove_canceled(self):
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+class HeapEventList(IEventList):
+    def __init__(self, entries: list = None):
+        self._queue = list(entries) if entries else []
+        heapq.heapify(self._queue)
+
+    def push(self, entry: tuple):
+        heapq.heappush(self._queue, entry)
+
+    def pop(self) -> tuple:
+        return heapq.heappop(self._queue)
+
+    def remove_canceled(self):
+        self._queue = [entry for entry in self._queue if not entry[2].canceled]
+        heapq.heapify(self._queue)
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+class CalendarEventList(IEventList):
+    """
+    Calendar queue (R. Brown, 1988) keyed on integer ticks of the simulated clock.
+
+    Each bucket covers `width` consecutive ticks of a "year" of `len(buckets) * width` ticks and keeps its entries sorted by (time, id),
+    so entries come out in exactly the same order as from a binary heap. The number of buckets follows the number of pending events and
+    the bucket width is re-estimated from the closest upcoming events on every resize, keeping scheduling close to O(1).
+    """
+    MIN_BUCKETS = 2
+    WIDTH_SAMPLE_SIZE = 25
+
+    def __init__(self, entries: list = None, tick: float = 0.0001):
+        entries = list(entries) if entries else []
+
+        self._ticks_per_unit = 1 / tick
+        self._size = 0
+        self._resize(entries, self._number_of_buckets_for(len(entries)), start_tick=0)
+
+    def _number_of_buckets_for(self, size: int) -> int:
+        number_of_buckets = self.MIN_BUCKETS
+
+        while 2 * number_of_buckets < size:
+            number_of_buckets *= 2
+
+        return number_of_buckets
+
+    def _tick(self, time: float) -> int:
+        return int(time * self._ticks_per_unit)
+
+    def _estimate_width(self, entries: list) -> int:
+        sample = heapq.nsmallest(self.WIDTH_SAMPLE_SIZE + 1, entries)
+
+        if len(sample) < 2:
+            return 1
+
+        average_separation = (self._tick(sample[-1][0]) - self._tick(sample[0][0])) / (len(sample) - 1)
+
+        return max(1, int(3 * average_separation))
+
+    def _move_to_tick(self, tick: int):
+        year_slot = tick // self._width
+
+        self._current_bucket = year_slot & self._bucket_mask
+        self._bucket_top = (year_slot + 1) * self._width
+        self._last_tick = tick
+
+    def _resize(self, entries: list, number_of_buckets: int, start_tick: int):
+        self._width = self._estimate_width(entries)
+        self._buckets = [[] for _ in range(number_of_buckets)]
+        self._bucket_mask = number_of_buckets - 1
+        self._grow_threshold = 2 * number_of_buckets
+        self._shrink_threshold = number_of_buckets // 2 if number_of_buckets > self.MIN_BUCKETS else -1
+
+        if entries:
+            start_tick = min(start_tick, self._tick(min(entries)[0]))
+        self._move_to_tick(start_tick)
+
+        for entry in entries:
+            insort(self._buckets[(self._tick(entry[0]) // self._width) & self._bucket_mask], entry)
+
+        self._size = len(entries)
+
+    def _all_entries(self) -> list:
+        return [entry for bucket in self._buckets for entry in bucket]
+
+    def push(self, entry: tuple):
+        tick = self._tick(entry[0])
+
+        insort(self._buckets[(tick // self._width) & self._bucket_mask], entry)
+        self._size += 1
+
+        if tick < self._last_tick:
+            self._move_to_tick(tick)
+
+        if self._size > self._grow_threshold:
+            self._resize(self._all_entries(), 2 * len(self._buckets), self._last_tick)
+
+    def pop(self) -> tuple:
+        if self._size == 0:
+            raise IndexError('pop from an empty event list')
+
+        buckets = self._buckets
+        bucket_index = self._current_bucket
+        bucket_top = self._bucket_top
+
+        for _ in range(len(buckets)):
+            bucket = buckets[bucket_index]
+
+            if bucket and self._tick(bucket[0][0]) < bucket_top:
+                entry = bucket.pop(0)
+
+                self._current_bucket = bucket_index
+                self._bucket_top = bucket_top
+                self._last_tick = self._tick(entry[0])
+                self._size -= 1
+
+                if self._size < self._shrink_threshold:
+                    self._resize(self._all_entries(), len(buckets) // 2, self._last_tick)
+
+                return entry
+
+            bucket_index = (bucket_index + 1) & self._bucket_mask
+            bucket_top += self._width
+
+        # Every pending event lies beyond the current year: jump straight to the earliest one
+        self._move_to_tick(self._tick(min(bucket[0] for bucket in buckets if bucket)[0]))
+
+        return self.pop()
+
+    def remove_canceled(self):
+        for bucket in self._buckets:
+            bucket[:] = [entry for entry in bucket if not entry[2].canceled]
+
+        self._size = sum(len(bucket) for bucket in self._buckets)
+
+    def __len__(self) -> int:
+        return self._size
+
+EVENT_LISTS = {
+    'heap': HeapEventList,
+    'calendar': CalendarEventList,
+}
+
+def create_event_list(event_list: str, entries: list = None, tick: float = 0.0001) -> IEventList:
+    if event_list not in EVENT_LISTS:
+        raise ValueError(f'Event list not allowed: {event_list}. Options are {", ".join(EVENT_LISTS.keys())}.')
+
+    if event_list == 'calendar':
+        return CalendarEventList(entries, tick)
+
+    return EVENT_LISTS[event_list](entries)
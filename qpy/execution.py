@@ -1,105 +1,211 @@
-import heapq
+import gc
+import warnings
 
 
-from .event import Event
+from .event import Event, EventType
+from .event_list import create_event_list
 from .job import Job
 from .network import INetwork
 from .results import SimulationResults
+from .time_resolution import DEFAULT_RESOLUTION, TimeResolution
+from .trace import JobTrace
+from .warmup import MSERWarmupDetector
+from typing import Literal, Optional, Union
 
 
+COMPACTION_DEAD_EVENT_RATIO = 0.5
+COMPACTION_MIN_QUEUE_SIZE = 64
+
 class Execution:
-    def __init__(self, time: float, warmup: float, queue: list, network_configuration: INetwork, time_unit: str):
+    def __init__(self, time: float, warmup: Union[float, Literal['auto']], queue: list, network_configuration: INetwork, time_unit: str, event_list: str = 'heap', checked: bool = True, time_resolution: TimeResolution = DEFAULT_RESOLUTION, trace: Optional[JobTrace] = None, disable_gc: bool = False, target_relative_half_width: Optional[float] = None, confidence: float = 0.95, batch_means: bool = False, overlapping_batches: bool = False):
         self.time = time
-        self.warmup = warmup
+        # With 'auto' nothing is measured until the detector finds the end of the transient (see _end_warmup)
+        self.warmup_detector = MSERWarmupDetector() if warmup == 'auto' else None
+        self.warmup = float('inf') if warmup == 'auto' else warmup
         self.current_time = 0
-        self.event_queue = queue
+        self.event_queue = create_event_list(event_list, queue, time_resolution.calendar_tick())
         self.event_count = len(queue)
         self.network_configuration = network_configuration
-        self.results = SimulationResults(len(self.network_configuration.servers), time, time_unit)
+        self.results = SimulationResults(len(self.network_configuration.servers), time, time_unit, checked, time_resolution, trace, 0 if warmup == 'auto' else warmup, batch_means or target_relative_half_width is not None, overlapping_batches)
         self.next_departure_event_by_server = [None] * len(self.network_configuration.servers)
-
-    def _add_next_departure_event(self, server: int, job: Job, current_time: float, service_time: float, event_type: str):            
-        if event_type == 'preemption':
+        self.dead_events = 0
+        self.time_resolution = time_resolution
+        self.disable_gc = disable_gc
+        self.target_relative_half_width = target_relative_half_width
+        self.confidence = confidence
+        self._interrupted = False
+
+    def _add_next_departure_event(self, server: int, job: Job, current_time: float, service_time: float, event_type: EventType):
+        if event_type == EventType.PREEMPTION:
             service_time = self.network_configuration.servers[server].get_preemption_time()
-            
-        new_event_object = Event(round(current_time + service_time, 4), self.event_count, event_type, job, server)
-        
-        heapq.heappush(self.event_queue, (round(current_time + service_time, 4), self.event_count, new_event_object))
+
+        departure_time = current_time + service_time
+
+        if self.time_resolution.tick is not None:
+            departure_time = self.time_resolution.quantize(departure_time)
+
+        new_event_object = Event(departure_time, self.event_count, event_type, job, server)
+
+        self.event_queue.push((departure_time, self.event_count, new_event_object))
         self.next_departure_event_by_server[server] = new_event_object
 
         self.event_count += 1
 
         job.serve(current_time)
 
+    def _cancel_event(self, event: Event):
+        event.canceled = True
+        self.dead_events += 1
+        self.results.event_list_statistics.compute_cancellation(self.dead_events, len(self.event_queue))
+
+        if len(self.event_queue) >= COMPACTION_MIN_QUEUE_SIZE and self.dead_events > COMPACTION_DEAD_EVENT_RATIO * len(self.event_queue):
+            self._compact_event_queue()
+
+    def _compact_event_queue(self):
+        self.event_queue.remove_canceled()
+
+        self.dead_events = 0
+        self.results.event_list_statistics.compactions += 1
+
+    def _next_departure_event_type(self, server) -> EventType:
+        return EventType.DEPARTURE if server.is_next_event_departure() else EventType.PREEMPTION
+
     def _route_job_after_event(self, event: Event):
-        route = event.server.route_job()
+        route = self.network_configuration.servers[event.server_id].route_job()
 
         if route != 'end':
-            event.job.reroute(self.current_time, route)
+            queue_time, time_in_server = event.job.reroute(self.current_time, route)
             destination_server = self.network_configuration.servers[route]
 
             if event.job.arrival_time > self.warmup:
                 self.results.reroute(self.current_time, event.server_id, route)
+                self.results.compute_visit(event.server_id, queue_time, time_in_server)
                 self.results.compute_arrival(self.current_time, route)
 
-            new_event = Event(self.current_time, self.event_count, 'arrival', event.job, route)
+            new_event = Event(self.current_time, self.event_count, EventType.ARRIVAL, event.job, route)
             self.event_count += 1
 
             service_time = destination_server.job_arrival(new_event)
 
             if service_time:
-                self._add_next_departure_event(route, new_event.job, self.current_time, service_time, event_type='departure' if destination_server.is_next_event_departure() else 'preemption')
+                if self.next_departure_event_by_server[route]:
+                    self._cancel_event(self.next_departure_event_by_server[route])
+
+                self._add_next_departure_event(route, new_event.job, self.current_time, service_time, self._next_departure_event_type(destination_server))
         else:
-            event.job.reroute(self.current_time)
+            queue_time, time_in_server = event.job.reroute(self.current_time)
+            if self.warmup_detector is not None and self.warmup_detector.compute_departure(self.current_time - event.job.arrival_time, self.current_time):
+                self._end_warmup(self.current_time)
             if event.job.arrival_time > self.warmup:
                 self.results.reroute(self.current_time, event.server_id, destination_server=None)
+                self.results.compute_visit(event.server_id, queue_time, time_in_server)
                 self.results.compute_departure(event.job, self.current_time)
-            self.event_count = self.network_configuration.finish_job(self.event_queue, self.current_time, self.event_count)
+
+                if self.target_relative_half_width is not None and self.results.has_reached_precision(self.target_relative_half_width, self.confidence):
+                    self._interrupted = True
+            self.event_count = self.network_configuration.finish_job(self.event_queue, self.current_time, self.event_count, event)
 
     def _case_event_is_arrival(self, event: Event):
+        server = self.network_configuration.servers[event.server_id]
+
+        if self.warmup_detector is not None:
+            self.warmup_detector.compute_arrival()
+
+        if event.entry_point is not None:
+            self.event_count = self.network_configuration.next_arrival(self.event_queue, self.current_time, event.entry_point, self.event_count)
+
         event.job.reroute(self.current_time)
-        service_time = event.server.job_arrival(event)
+        service_time = server.job_arrival(event)
 
         if service_time:
             if self.next_departure_event_by_server[event.server_id]:
-                self.next_departure_event_by_server[event.server_id].canceled = True
+                self._cancel_event(self.next_departure_event_by_server[event.server_id])
 
-            self._add_next_departure_event(event.server_id, event.job, self.current_time, service_time, event_type='departure' if event.server.is_next_event_departure() else 'preemption')
+            self._add_next_departure_event(event.server_id, event.job, self.current_time, service_time, self._next_departure_event_type(server))
         if event.job.arrival_time > self.warmup:
             self.results.compute_arrival(self.current_time, event.server_id, (event.job.arrival_time == event.current_time))
 
     def _case_event_is_departure_or_preemption(self, event: Event):
-        new_job_being_executed = event.server.finish_execution(self.current_time, is_preemption=(event.type == 'preemption'))
+        server = self.network_configuration.servers[event.server_id]
+        new_job_being_executed = server.finish_execution(self.current_time, is_preemption=(event.type == EventType.PREEMPTION))
         self.next_departure_event_by_server[event.server_id] = None
 
         if new_job_being_executed:
             new_job_service_time = new_job_being_executed[0]
             new_job = new_job_being_executed[1]
 
-            self._add_next_departure_event(event.server_id, new_job, self.current_time, new_job_service_time, event_type='departure' if event.server.is_next_event_departure() else 'preemption')
+            self._add_next_departure_event(event.server_id, new_job, self.current_time, new_job_service_time, self._next_departure_event_type(server))
 
-        self._route_job_after_event(event)
+        if event.type == EventType.DEPARTURE:
+            self._route_job_after_event(event)
 
     def execute(self) -> SimulationResults:
-        end_time = self.warmup + self.time
+        if not self.disable_gc or not gc.isenabled():
+            return self._run()
+
+        # Objects alive before the run are moved out of the collector's reach and collection is off until the run ends, so the churn of
+        # events and jobs doesn't trigger collection passes. Reference cycles created during the run are reclaimed after it
+        gc.freeze()
+        gc.disable()
+
+        try:
+            return self._run()
+        finally:
+            gc.enable()
+            gc.unfreeze()
+
+    def _end_warmup(self, time: float):
+        """
+        Ends the warm-up at `time`, when the detector found the end of the transient: only jobs arriving after it are measured, for the
+        following `self.time` time units. The earlier MSER truncation point found by the detector is reported separately.
+        """
+        self.results.warmup_time = time
+        self.results.warmup_truncation_time = self.warmup_detector.truncation_time
+        self.warmup = time
+        self.warmup_detector = None
+        self._interrupted = True
+
+    def _run(self) -> SimulationResults:
+        if self.warmup_detector is not None:
+            # The warm-up can't outlast the measured period; a transient longer than that would dominate the results anyway
+            self._process_events(self.time)
+
+            if self.warmup_detector is not None:
+                warnings.warn(f'No end of the initial transient was detected in {self.time} time units, measuring from there on. The system may be unstable.', RuntimeWarning)
+                self._end_warmup(self.time)
+
+        self._process_events(self.warmup + self.time)
+
+        if self._interrupted:
+            # The precision target was met before the horizon
+            self.results.compute_total_simulation_time(self.current_time - self.warmup)
+
+        self.results.compute_servers_departures()
+
+        return self.results
+
+    def _process_events(self, end_time: float):
+        """Processes the events up to `end_time`, or until the warm-up detection or the precision target interrupts the run."""
+        pop_next_entry = self.event_queue.pop
+        handlers = (self._case_event_is_arrival, self._case_event_is_departure_or_preemption, self._case_event_is_departure_or_preemption)
+        self._interrupted = False
+
+        while not self._interrupted:
+            try:
+                next_entry = pop_next_entry()
+            except IndexError:
+                break
 
-        while len(self.event_queue) > 0:
-            top_time = self.event_queue[0][0]
-            if top_time > end_time:
+            if next_entry[0] > end_time:
+                self.event_queue.push(next_entry)
                 break
 
-            next_event = heapq.heappop(self.event_queue)[2]
+            next_event = next_entry[2]
 
             if next_event.canceled:
+                self.dead_events -= 1
                 continue
 
-            next_event.server = self.network_configuration.servers[next_event.server_id]
-
-            self.current_time = round(next_event.current_time, 4)
-
-            if next_event.type == 'arrival':
-                self._case_event_is_arrival(next_event)
-            else:
-                self._case_event_is_departure_or_preemption(next_event)
+            self.current_time = next_event.current_time
 
-        return self.results
\ No newline at end of file
+            handlers[next_event.type](next_event)
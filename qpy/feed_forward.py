@@ -0,0 +1,232 @@
+import numpy as np
+
+
+from .lindley import LINDLEY_BLOCK_SIZE, lindley_departures
+from .plan import EntryPointPlan, ExecutionPlan
+from .queue_discipline import Discipline
+from .results import SimulationResults
+from .time_resolution import TimeResolution
+from typing import Optional
+
+
+def topological_order(plan: ExecutionPlan) -> Optional[list]:
+    """Returns the servers sorted so that every server comes after the ones routing to it, or None if the routing has a cycle."""
+    number_of_servers = len(plan.servers)
+    destinations = [[] for _ in range(number_of_servers)]
+    incoming_routes = [0] * number_of_servers
+
+    for server in plan.servers:
+        for destination, probability in zip(server.routing.values, server.routing.probabilities):
+            if destination != 'end' and probability > 0:
+                destinations[server.server_id].append(destination)
+                incoming_routes[destination] += 1
+
+    order = [server_id for server_id in range(number_of_servers) if incoming_routes[server_id] == 0]
+
+    for server_id in order:
+        for destination in destinations[server_id]:
+            incoming_routes[destination] -= 1
+
+            if incoming_routes[destination] == 0:
+                order.append(destination)
+
+    return order if len(order) == number_of_servers else None
+
+def is_feed_forward_eligible(plan: ExecutionPlan) -> bool:
+    if plan.terminals is not None or not plan.entry_points:
+        return False
+
+    if any(server.discipline != Discipline.FCFS.value for server in plan.servers) or any(entry_point.priorities is not None for entry_point in plan.entry_points):
+        return False
+
+    return topological_order(plan) is not None
+
+class _Occupancy:
+    """
+    Time-weighted number of jobs, as integrated by the metrics classes, accumulated block by block: only counted jobs, and only up to the
+    last event processed before the end of the simulation. Jobs still there at the end are the only ones kept.
+    """
+    def __init__(self):
+        self.finished_time = 0.0
+        self.last_event_time = None
+        self._staying = []
+
+    def arrive(self, arrival_times: np.ndarray):
+        if len(arrival_times):
+            self.last_event_time = max(self.last_event_time if self.last_event_time is not None else -np.inf, float(arrival_times.max()))
+
+    def leave(self, arrival_times: np.ndarray, departure_times: np.ndarray, end_time: float):
+        finished = departure_times <= end_time
+
+        self.finished_time += float(np.sum(departure_times[finished] - arrival_times[finished]))
+        self._staying.append(arrival_times[~finished])
+
+        if finished.any():
+            self.last_event_time = max(self.last_event_time, float(departure_times[finished].max()))
+
+    def stay(self, arrival_times: np.ndarray):
+        self._staying.append(arrival_times)
+
+    def totals(self) -> tuple:
+        if self.last_event_time is None:
+            return 0.0, 0, 0.0
+
+        staying = np.concatenate(self._staying) if self._staying else np.empty(0)
+
+        return self.finished_time + float(np.sum(self.last_event_time - staying)), len(staying), self.last_event_time
+
+class _EntryPointArrivals:
+    """Arrivals of an entry point, sampled LINDLEY_BLOCK_SIZE at a time (as the other engines do) and handed out window by window."""
+    def __init__(self, entry_point: EntryPointPlan, time_resolution: TimeResolution, end_time: float):
+        self.entry_point = entry_point
+        self.time_resolution = time_resolution
+        self.end_time = end_time
+        self.units = np.empty(0)
+        self.exhausted = False
+        self._last_arrival = 0
+
+    def fill(self):
+        while not self.exhausted and len(self.units) < LINDLEY_BLOCK_SIZE:
+            arrival_units = self._last_arrival + np.cumsum(self.time_resolution.durations_to_units(self.entry_point.arrival_distribution.sample_many(LINDLEY_BLOCK_SIZE)))
+
+            self.units = np.concatenate((self.units, arrival_units))
+            self._last_arrival = arrival_units[-1]
+            self.exhausted = self.time_resolution.units_to_times(arrival_units[-1:])[0] >= self.end_time
+
+    def take(self, window_end_units: Optional[float]) -> np.ndarray:
+        """The arrivals before `window_end_units`, or all the arrivals before the end of the simulation if None."""
+        if window_end_units is None:
+            taken = self.units[:int(np.searchsorted(self.time_resolution.units_to_times(self.units), self.end_time, side='left'))]
+            self.units = np.empty(0)
+        else:
+            number_of_arrivals = int(np.searchsorted(self.units, window_end_units, side='left'))
+            taken, self.units = self.units[:number_of_arrivals], self.units[number_of_arrivals:]
+
+        return taken
+
+class FeedForwardExecution:
+    """
+    Simulates an open network of FCFS servers whose routing has no cycles without the event loop.
+
+    The horizon is processed in windows of about LINDLEY_BLOCK_SIZE arrivals per entry point, so memory stays bounded by the window and
+    the jobs in the network, not by the horizon. In each window, servers are solved one at a time in topological order: the arrivals of a
+    server before the end of the window (from entry points and from the servers routing to it) are merged and sorted by time, its
+    departures come from the Lindley recursion started at its last departure of the previous window, and routing draws split them into
+    the arrivals of the next servers, which are kept until the window they belong to. Service and routing samples are taken per server in
+    arrival and departure order, from the same per-site streams as the event-driven engine.
+    """
+    def __init__(self, time: float, warmup: float, plan: ExecutionPlan, time_unit: str):
+        if not is_feed_forward_eligible(plan):
+            raise ValueError('The feed_forward engine only supports open networks of FCFS servers without routing cycles or priorities.')
+
+        self.time = time
+        self.warmup = warmup
+        self.plan = plan
+        self.results = SimulationResults(len(plan.servers), time, time_unit, False, plan.time_resolution, warmup_time=warmup)
+
+    def execute(self) -> SimulationResults:
+        time_resolution = self.plan.time_resolution
+        end_time = self.warmup + self.time
+        order = topological_order(self.plan)
+        number_of_servers = len(self.plan.servers)
+        entry_points = [_EntryPointArrivals(entry_point, time_resolution, end_time) for entry_point in self.plan.entry_points]
+        # Arrivals waiting for their window, per server: units, source (ties are broken as if every source had been appended in order, entry
+        # points first and then servers in topological order), entry time of the job and queue time accumulated by the job so far
+        pending = [[] for _ in range(number_of_servers)]
+        source_of_server = {server_id: len(entry_points) + position for position, server_id in enumerate(order)}
+        last_departure = [0] * number_of_servers
+        visited = [False] * number_of_servers
+        server_occupancy = [_Occupancy() for _ in range(number_of_servers)]
+        server_totals = np.zeros((number_of_servers, 3))
+        environment_occupancy = _Occupancy()
+        number_of_departures = 0
+        time_in_system = 0.0
+        queue_time = 0.0
+        is_last_window = False
+
+        while not is_last_window:
+            for entry_point in entry_points:
+                entry_point.fill()
+
+            open_entry_points = [entry_point.units[-1] for entry_point in entry_points if not entry_point.exhausted]
+            is_last_window = not open_entry_points
+            window_end_units = None if is_last_window else min(open_entry_points)
+
+            for source, entry_point in enumerate(entry_points):
+                arrival_units = entry_point.take(window_end_units)
+                entry_times = time_resolution.units_to_times(arrival_units)
+
+                environment_occupancy.arrive(entry_times[entry_times > self.warmup])
+                pending[entry_point.entry_point.server_id].append((arrival_units, np.full(len(arrival_units), source), entry_times, np.zeros(len(arrival_units))))
+
+            for server_id in order:
+                if not pending[server_id]:
+                    continue
+
+                arrival_units, sources, entry_times, waits = (np.concatenate(column) for column in zip(*pending[server_id]))
+                ready = time_resolution.units_to_times(arrival_units) <= end_time if is_last_window else arrival_units < window_end_units
+                pending[server_id] = [(arrival_units[~ready], sources[~ready], entry_times[~ready], waits[~ready])] if not ready.all() else []
+
+                if not ready.any():
+                    continue
+
+                sorted_arrivals = np.lexsort((sources[ready], arrival_units[ready]))
+                arrival_units, entry_times, waits = arrival_units[ready][sorted_arrivals], entry_times[ready][sorted_arrivals], waits[ready][sorted_arrivals]
+                server = self.plan.servers[server_id]
+                visited[server_id] = True
+
+                service_units = time_resolution.durations_to_units(server.service_distribution.sample_many(len(arrival_units)))
+                departure_units = lindley_departures(arrival_units, service_units, last_departure[server_id])
+                last_departure[server_id] = departure_units[-1]
+                routes = server.routing.draw_many(len(arrival_units))
+
+                arrival_times = time_resolution.units_to_times(arrival_units)
+                start_times = time_resolution.units_to_times(departure_units - service_units)
+                departure_times = time_resolution.units_to_times(departure_units)
+                waits = waits + (start_times - arrival_times)
+
+                counted = entry_times > self.warmup
+                finished = counted & (departure_times <= end_time)
+                server_totals[server_id] += (float(np.sum(departure_times[finished] - arrival_times[finished])), float(np.sum(start_times[finished] - arrival_times[finished])), int(np.count_nonzero(finished)))
+                server_occupancy[server_id].arrive(arrival_times[counted])
+                server_occupancy[server_id].leave(arrival_times[counted], departure_times[counted], end_time)
+
+                for index, destination in enumerate(server.routing.values):
+                    routed = routes == index
+
+                    if not routed.any():
+                        continue
+
+                    if destination == 'end':
+                        left = routed & counted
+                        departed = left & (departure_times <= end_time)
+
+                        number_of_departures += int(np.count_nonzero(departed))
+                        time_in_system += float(np.sum(departure_times[departed] - entry_times[departed]))
+                        queue_time += float(np.sum(waits[departed]))
+                        environment_occupancy.leave(entry_times[left], departure_times[left], end_time)
+                    else:
+                        pending[destination].append((departure_units[routed], np.full(int(np.count_nonzero(routed)), source_of_server[server_id]), entry_times[routed], waits[routed]))
+
+        # Jobs still on their way to a server at the end never left the system
+        for chunks in pending:
+            for _, _, entry_times, _ in chunks:
+                environment_occupancy.stay(entry_times[entry_times > self.warmup])
+
+        self.results.environment_metrics.compute_jobs_in_system(*environment_occupancy.totals())
+
+        for server_id in order:
+            if visited[server_id]:
+                server_time, server_queue_time, finished_visits = server_totals[server_id]
+
+                self.results.server_metrics[server_id].compute_jobs_in_system(*server_occupancy[server_id].totals())
+                self.results.server_metrics[server_id].compute_environment_departures(0, float(server_time), float(server_queue_time), int(finished_visits))
+
+        if number_of_departures > 0:
+            self.results.environment_metrics.compute_departures(number_of_departures, time_in_system, queue_time)
+            self.results.priority_metrics[0].compute_departures(number_of_departures, time_in_system, queue_time)
+
+            for server_metrics in self.results.server_metrics:
+                server_metrics.compute_environment_departures(number_of_departures, 0.0, 0.0, 0)
+
+        return self.results
@@ -1,42 +1,57 @@
 from .validation_utils import validate_number_params_not_negative_and_not_none, validate_number_params_not_negative
-from collections import defaultdict
 
 
 class Job:
-    def __init__(self, id: int, arrival_time: float, current_server: int, priority: int):
+    """
+    A job in flight. Only the state of the current visit is kept: the time spent in the queue and in the server is handed to the metrics
+    at every hop, so a job has the same size however many servers it visits. Closed networks recycle the same object for every cycle
+    of a terminal (see restart).
+    """
+    __slots__ = ('id', 'arrival_time', 'current_server', 'priority', 'arrival_time_at_current_server', 'queued_since', 'queue_time_at_current_server', 'total_queue_time', '_checked')
+
+    def __init__(self, id: int, arrival_time: float, current_server: int, priority: int, checked: bool = True):
+        self._checked = checked
+        self.restart(id, arrival_time, current_server, priority)
+
+    def restart(self, id: int, arrival_time: float, current_server: int, priority: int):
         self.id = id
         self.arrival_time = arrival_time
         self.current_server = current_server
         self.priority = priority
         self.arrival_time_at_current_server = arrival_time
-        self.arrival_times_per_server = defaultdict(lambda: [])
-        self.queue_times_per_server = defaultdict(lambda: 0)
-        self.total_time_per_server = defaultdict(lambda: 0)
-        self.total_visits_per_server = defaultdict(lambda: 0)
-
-        self.arrival_times_per_server[current_server].append(arrival_time)
-        self.total_visits_per_server[current_server] += 1
-
-    def _switch_servers_and_compute_state(self, time: float, server: int):
-        self.current_server = server
-        self.arrival_time_at_current_server = time
-        self.arrival_times_per_server[server].append(time)
-        self.total_visits_per_server[server] += 1
+        self.queued_since = arrival_time
+        self.queue_time_at_current_server = 0
+        self.total_queue_time = 0
 
     def serve(self, service_started_time: float):
         if service_started_time < self.arrival_time_at_current_server:
             raise ValueError(f'Job can\'t be executed before arrival.\nService started: {service_started_time} | Arrival time: {self.arrival_time_at_current_server}')
-        
-        self.queue_times_per_server[self.current_server] += service_started_time - self.arrival_time_at_current_server
 
+        queue_time = service_started_time - self.queued_since
+
+        self.queue_time_at_current_server += queue_time
+        self.total_queue_time += queue_time
+
+    def requeue(self, time: float):
+        """Puts the job back in the queue of the current server after it was preempted, so only the new wait counts as queue time."""
+        self.queued_since = time
+
+    def reroute(self, completion_time: float, new_server: int = None) -> tuple:
+        """
+        Finishes the visit to the current server and, if `new_server` is provided, starts a visit to it. Returns the queue time and the
+        total time of the finished visit.
+        """
+        if self._checked:
+            validate_number_params_not_negative_and_not_none(function_name='reroute', completion_time=completion_time)
+            validate_number_params_not_negative(function_name='reroute', new_server=new_server)
+
+        visit = (self.queue_time_at_current_server, completion_time - self.arrival_time_at_current_server)
+
+        if new_server is not None:
+            self.current_server = new_server
 
-    def reroute(self, completion_time: float, new_server: int = None):
-        validate_number_params_not_negative_and_not_none(function_name='reroute', completion_time=completion_time)
-        validate_number_params_not_negative(function_name='reroute', new_server=new_server)
-        
-        self.total_time_per_server[self.current_server] += completion_time - self.arrival_time_at_current_server
+        self.arrival_time_at_current_server = completion_time
+        self.queued_since = completion_time
+        self.queue_time_at_current_server = 0
 
-        if new_server:
-            self._switch_servers_and_compute_state(completion_time, new_server)
-        else:
-            self.arrival_time_at_current_server = completion_time
\ No newline at end of file
+        return visit
@@ -0,0 +1,108 @@
+import numpy as np
+
+
+from .plan import ExecutionPlan
+from .queue_discipline import Discipline
+from .results import SimulationResults
+
+
+LINDLEY_BLOCK_SIZE = 65536
+
+
+def is_lindley_eligible(plan: ExecutionPlan) -> bool:
+    if plan.terminals is not None or len(plan.servers) != 1 or len(plan.entry_points) != 1:
+        return False
+
+    server = plan.servers[0]
+    entry_point = plan.entry_points[0]
+    routes_back = any(destination != 'end' and probability > 0 for destination, probability in zip(server.routing.values, server.routing.probabilities))
+
+    return server.discipline == Discipline.FCFS.value and not routes_back and entry_point.priorities is None
+
+def lindley_departures(arrivals: np.ndarray, services: np.ndarray, last_departure = 0) -> np.ndarray:
+    """
+    Departure times of a FCFS server for time-sorted `arrivals` and their `services`, given the departure of the job served before them.
+    """
+    cumulative_service = np.cumsum(services)
+
+    return cumulative_service + np.maximum(np.maximum.accumulate(arrivals - (cumulative_service - services)), last_departure)
+
+class LindleyExecution:
+    """
+    Simulates a single FCFS station fed by one entry point without the event loop.
+
+    Departure times follow the Lindley recursion d[k] = max(d[k-1], a[k]) + s[k]. Writing c for the cumulative service times of a block,
+    d[k] - c[k] is the running maximum of a[j] - c[j-1] (started at the last departure of the previous block), so each block of arrivals is
+    solved with a handful of NumPy array operations (see lindley_departures). With a time resolution the recursion runs on integer ticks
+    and is exact. The samples come from the same per-site streams, in the same order, as in the event-driven engine.
+    """
+    def __init__(self, time: float, warmup: float, plan: ExecutionPlan, time_unit: str):
+        if not is_lindley_eligible(plan):
+            raise ValueError('The lindley engine only supports a single FCFS server with one entry point, no priorities and no routing between servers.')
+
+        self.time = time
+        self.warmup = warmup
+        self.plan = plan
+        self.results = SimulationResults(1, time, time_unit, False, plan.time_resolution, warmup_time=warmup)
+
+    def execute(self) -> SimulationResults:
+        time_resolution = self.plan.time_resolution
+        arrival_distribution = self.plan.entry_points[0].arrival_distribution
+        service_distribution = self.plan.servers[0].service_distribution
+        end_time = self.warmup + self.time
+
+        last_arrival = 0
+        last_departure = 0
+        number_of_departures = 0
+        time_in_system = 0.0
+        queue_time = 0.0
+        last_event_time = 0.0
+        jobs_still_in_system = []
+
+        while True:
+            arrival_units = last_arrival + np.cumsum(time_resolution.durations_to_units(arrival_distribution.sample_many(LINDLEY_BLOCK_SIZE)))
+            arrival_times = time_resolution.units_to_times(arrival_units)
+            number_of_arrivals = int(np.searchsorted(arrival_times, end_time, side='left'))
+
+            if number_of_arrivals == 0:
+                break
+
+            arrival_units = arrival_units[:number_of_arrivals]
+            arrival_times = arrival_times[:number_of_arrivals]
+            service_units = time_resolution.durations_to_units(service_distribution.sample_many(number_of_arrivals))
+
+            departure_units = lindley_departures(arrival_units, service_units, last_departure)
+            departure_times = time_resolution.units_to_times(departure_units)
+            start_times = time_resolution.units_to_times(departure_units - service_units)
+
+            counted = arrival_times > self.warmup
+            departed = counted & (departure_times <= end_time)
+
+            number_of_departures += int(np.count_nonzero(departed))
+            time_in_system += float(np.sum(departure_times[departed] - arrival_times[departed]))
+            queue_time += float(np.sum(start_times[departed] - arrival_times[departed]))
+            jobs_still_in_system.append(arrival_times[counted & ~departed])
+
+            if counted.any():
+                last_event_time = max(last_event_time, float(arrival_times[counted][-1]))
+            if departed.any():
+                last_event_time = max(last_event_time, float(departure_times[departed][-1]))
+
+            last_arrival = arrival_units[-1]
+            last_departure = departure_units[-1]
+
+            if number_of_arrivals < LINDLEY_BLOCK_SIZE:
+                break
+
+        jobs_still_in_system = np.concatenate(jobs_still_in_system) if jobs_still_in_system else np.empty(0)
+        weighted_sum_number_of_jobs = time_in_system + float(np.sum(last_event_time - jobs_still_in_system))
+
+        for metrics in (self.results.environment_metrics, self.results.server_metrics[0]):
+            metrics.compute_jobs_in_system(weighted_sum_number_of_jobs, len(jobs_still_in_system), last_event_time)
+
+        if number_of_departures > 0:
+            self.results.environment_metrics.compute_departures(number_of_departures, time_in_system, queue_time)
+            self.results.server_metrics[0].compute_environment_departures(number_of_departures, time_in_system, queue_time, number_of_departures)
+            self.results.priority_metrics[0].compute_departures(number_of_departures, time_in_system, queue_time)
+
+        return self.results
@@ -1,128 +1,237 @@
 from collections import defaultdict
 
+from qpy.estimation import BatchMeans, ConfidenceInterval
 from qpy.job import Job
+from qpy.time_resolution import DEFAULT_RESOLUTION, TimeResolution
 from qpy.validation_utils import validate_number_params_not_negative_and_not_none, validate_object_params_not_none
+from typing import Optional
 
 
 class GeneralMetrics:
-    def __init__(self, total_simulation_time: float):
+    """
+    With `batch_means`, every mean also feeds a BatchMeans estimator (see qpy.estimation), so its get_*_confidence_interval() method returns
+    a confidence interval from this single run. `overlapping_batches` makes the estimators use overlapping batch means.
+    """
+    def __init__(self, total_simulation_time: float, checked: bool = True, time_resolution: TimeResolution = DEFAULT_RESOLUTION, batch_means: bool = False, overlapping_batches: bool = False):
         self.total_simulation_time = total_simulation_time
         self.total_number_of_processed_jobs_in_system = 0
         self.current_number_of_jobs = 0
         self.weighted_sum_number_of_jobs = 0
         self.current_time = 0
         self.cumulative_queue_times = 0
+        self._checked = checked
+        self._time_resolution = time_resolution
+        self._batch_means = batch_means or overlapping_batches
+        self._overlapping_batches = overlapping_batches
+        self._last_departure_time = None
+        self.queue_time_batches = self._new_batch_means()
+        self.number_of_jobs_batches = self._new_batch_means()
+        self.throughput_batches = self._new_batch_means()
+
+    def _new_batch_means(self) -> Optional[BatchMeans]:
+        return BatchMeans(overlapping=self._overlapping_batches) if self._batch_means else None
+
+    def _elapsed_since_last_departure(self, time: float, first_arrival_time: float) -> float:
+        """Time since the previous departure (since the arrival of the first job for the first one), used as weight of time averages."""
+        elapsed = time - (self._last_departure_time if self._last_departure_time is not None else first_arrival_time)
+        self._last_departure_time = time
+
+        return elapsed
     
     def _count_number_of_jobs(self, time: float, event: str):
-        self.weighted_sum_number_of_jobs += round(self.current_number_of_jobs * (time - self.current_time), 4)
-        self.current_time = round(time, 4)
+        elapsed = time - self.current_time
+
+        # The empty period before the first measured job (e.g. the warm-up) is left out of the batches
+        if self.number_of_jobs_batches is not None and elapsed > 0 and (self.current_number_of_jobs > 0 or self.number_of_jobs_batches.number_of_observations > 0):
+            self.number_of_jobs_batches.add(self.current_number_of_jobs * elapsed, elapsed)
+
+        self.weighted_sum_number_of_jobs += self.current_number_of_jobs * elapsed
+        self.current_time = time
 
         if event == 'arrival':
             self.current_number_of_jobs += 1
         else:
             self.current_number_of_jobs -= 1
 
+    def compute_jobs_in_system(self, weighted_sum_number_of_jobs: float, current_number_of_jobs: int, time: float):
+        self.weighted_sum_number_of_jobs += weighted_sum_number_of_jobs
+        self.current_number_of_jobs = current_number_of_jobs
+        self.current_time = time
+
     def compute_arrival(self, time: float):
-        validate_number_params_not_negative_and_not_none(function_name='compute_arrival', time=time)
+        if self._checked:
+            validate_number_params_not_negative_and_not_none(function_name='compute_arrival', time=time)
 
-        if time < self.current_time:
-            raise ValueError('Provided time smaller than already registered time.')
+            if time < self.current_time:
+                raise ValueError('Provided time smaller than already registered time.')
 
         self._count_number_of_jobs(time, 'arrival')
 
     def get_number_of_processed_jobs(self) -> int:
-        return round(self.total_number_of_processed_jobs_in_system, 4)
+        return self._time_resolution.round_result(self.total_number_of_processed_jobs_in_system)
     
     def get_mean_queue_time(self) -> float:
-        return (round(self.cumulative_queue_times / self.total_number_of_processed_jobs_in_system, 4)) if self.total_number_of_processed_jobs_in_system > 0 else 0
+        return (self._time_resolution.round_result(self.cumulative_queue_times / self.total_number_of_processed_jobs_in_system)) if self.total_number_of_processed_jobs_in_system > 0 else 0
 
     def get_mean_number_of_jobs_in_system(self) -> float:
-        return (round(self.weighted_sum_number_of_jobs / self.total_simulation_time, 4)) if self.total_simulation_time > 0 else 0
+        return (self._time_resolution.round_result(self.weighted_sum_number_of_jobs / self.total_simulation_time)) if self.total_simulation_time > 0 else 0
 
     def get_throughput(self) -> float:
-        return (round(self.total_number_of_processed_jobs_in_system / self.total_simulation_time, 4)) if self.total_simulation_time > 0 else 0
+        return (self._time_resolution.round_result(self.total_number_of_processed_jobs_in_system / self.total_simulation_time)) if self.total_simulation_time > 0 else 0
+
+    def _round_confidence_interval(self, batches: Optional[BatchMeans], confidence: float) -> Optional[ConfidenceInterval]:
+        confidence_interval = batches.confidence_interval(confidence) if batches is not None else None
+
+        return ConfidenceInterval(*(self._time_resolution.round_result(value) for value in confidence_interval)) if confidence_interval else None
+
+    def get_queue_time_confidence_interval(self, confidence: float = 0.95) -> Optional[ConfidenceInterval]:
+        return self._round_confidence_interval(self.queue_time_batches, confidence)
+
+    def get_number_of_jobs_in_system_confidence_interval(self, confidence: float = 0.95) -> Optional[ConfidenceInterval]:
+        return self._round_confidence_interval(self.number_of_jobs_batches, confidence)
+
+    def get_throughput_confidence_interval(self, confidence: float = 0.95) -> Optional[ConfidenceInterval]:
+        return self._round_confidence_interval(self.throughput_batches, confidence)
 
 class EnvironmentMetrics(GeneralMetrics):
-    def __init__(self, total_simulation_time: float):
-        super().__init__(total_simulation_time)
+    def __init__(self, total_simulation_time: float, checked: bool = True, time_resolution: TimeResolution = DEFAULT_RESOLUTION, batch_means: bool = False, overlapping_batches: bool = False):
+        super().__init__(total_simulation_time, checked, time_resolution, batch_means, overlapping_batches)
         self.cumulative_time_in_system = 0
+        self.time_in_system_batches = self._new_batch_means()
     
     def compute_departure(self, job: Job, time: float):
-        validate_number_params_not_negative_and_not_none(function_name='compute_departure', time=time)
-        validate_object_params_not_none(function_name='compute_departure', job=job)
+        if self._checked:
+            validate_number_params_not_negative_and_not_none(function_name='compute_departure', time=time)
+            validate_object_params_not_none(function_name='compute_departure', job=job)
 
-        if time < self.current_time:
-            raise ValueError('Provided time smaller than already registered time.')
+            if time < self.current_time:
+                raise ValueError('Provided time smaller than already registered time.')
 
         self._count_number_of_jobs(time, 'departure')
 
         self.total_number_of_processed_jobs_in_system += 1
         self.cumulative_time_in_system += (time - job.arrival_time)
-        self.cumulative_queue_times += sum(job.queue_times_per_server.values())
+        self.cumulative_queue_times += job.total_queue_time
+
+        if self.time_in_system_batches is not None:
+            self.time_in_system_batches.add(time - job.arrival_time)
+            self.queue_time_batches.add(job.total_queue_time)
+            self.throughput_batches.add(1, self._elapsed_since_last_departure(time, job.arrival_time))
+
+    def compute_departures(self, number_of_jobs: int, time_in_system: float, queue_time: float):
+        self.total_number_of_processed_jobs_in_system += number_of_jobs
+        self.cumulative_time_in_system += time_in_system
+        self.cumulative_queue_times += queue_time
 
     def get_mean_time_in_system(self) -> float:
-        return (round(self.cumulative_time_in_system / self.total_number_of_processed_jobs_in_system, 4)) if self.total_number_of_processed_jobs_in_system > 0 else 0
+        return (self._time_resolution.round_result(self.cumulative_time_in_system / self.total_number_of_processed_jobs_in_system)) if self.total_number_of_processed_jobs_in_system > 0 else 0
+
+    def get_time_in_system_confidence_interval(self, confidence: float = 0.95) -> Optional[ConfidenceInterval]:
+        """
+        Batch-means confidence interval of E[T]. None unless the simulation kept batch means and enough jobs left the system. The other
+        get_*_confidence_interval() methods work the same way for the metric they name.
+        """
+        return self._round_confidence_interval(self.time_in_system_batches, confidence)
 
 class ServerMetrics(GeneralMetrics):
-    def __init__(self, server_id: int, total_simulation_time: float):
-        super().__init__(total_simulation_time)
+    def __init__(self, server_id: int, total_simulation_time: float, checked: bool = True, time_resolution: TimeResolution = DEFAULT_RESOLUTION, batch_means: bool = False, overlapping_batches: bool = False):
+        super().__init__(total_simulation_time, checked, time_resolution, batch_means, overlapping_batches)
         self.server_id = server_id
         self.cumulative_time_in_server = 0
         self.cumulative_server_busy_time = 0
         self.cumulative_visits_per_job = 0
+        self.time_in_server_batches = self._new_batch_means()
+        self.utilization_batches = self._new_batch_means()
     
     def compute_departure(self, time: float):
-        validate_number_params_not_negative_and_not_none(function_name='compute_departure', time=time)
+        if self._checked:
+            validate_number_params_not_negative_and_not_none(function_name='compute_departure', time=time)
 
-        if time < self.current_time:
-            raise ValueError('Provided time smaller than already registered time.')
+            if time < self.current_time:
+                raise ValueError('Provided time smaller than already registered time.')
 
         self._count_number_of_jobs(time, 'departure')
 
-    def compute_environment_departure(self, job: Job):
-        validate_object_params_not_none(function_name='compute_environment_departure', job=job)
-
-        self.total_number_of_processed_jobs_in_system += 1
-
-        self.cumulative_queue_times += job.queue_times_per_server[self.server_id]
-        self.cumulative_time_in_server += job.total_time_per_server[self.server_id]
-        self.cumulative_server_busy_time += job.total_time_per_server[self.server_id] - job.queue_times_per_server[self.server_id]
-
-        self.cumulative_visits_per_job += job.total_visits_per_server[self.server_id]
+    def compute_visit(self, queue_time: float, time_in_server: float):
+        if self._checked:
+            validate_number_params_not_negative_and_not_none(function_name='compute_visit', queue_time=queue_time, time_in_server=time_in_server)
+
+        self.cumulative_queue_times += queue_time
+        self.cumulative_time_in_server += time_in_server
+        self.cumulative_server_busy_time += time_in_server - queue_time
+        self.cumulative_visits_per_job += 1
+
+        if self.utilization_batches is not None:
+            # Each visit weighs the time since the previous one, so a batch mean is the busy fraction of the time the batch spans
+            elapsed = self._elapsed_since_last_departure(self.current_time, self.current_time - time_in_server)
+
+            self.utilization_batches.add(time_in_server - queue_time, elapsed)
+            self.throughput_batches.add(1, elapsed)
+            self.time_in_server_batches.add(time_in_server)
+            self.queue_time_batches.add(queue_time)
+
+    def compute_environment_departures(self, number_of_jobs: int, time_in_server: float, queue_time: float, visits: int):
+        self.total_number_of_processed_jobs_in_system += number_of_jobs
+        self.cumulative_queue_times += queue_time
+        self.cumulative_time_in_server += time_in_server
+        self.cumulative_server_busy_time += time_in_server - queue_time
+        self.cumulative_visits_per_job += visits
     
     def get_number_of_processed_jobs(self) -> int:
-        return round(self.cumulative_visits_per_job, 4)
+        return self._time_resolution.round_result(self.cumulative_visits_per_job)
 
     def get_mean_time_in_server(self) -> float:
-        return round(self.cumulative_time_in_server / self.cumulative_visits_per_job, 4) if self.cumulative_visits_per_job > 0 else 0
+        return self._time_resolution.round_result(self.cumulative_time_in_server / self.cumulative_visits_per_job) if self.cumulative_visits_per_job > 0 else 0
+
+    def get_time_in_server_confidence_interval(self, confidence: float = 0.95) -> Optional[ConfidenceInterval]:
+        return self._round_confidence_interval(self.time_in_server_batches, confidence)
 
     def get_mean_visits_per_job(self) -> float:
-        return round(self.cumulative_visits_per_job / self.total_number_of_processed_jobs_in_system, 4) if self.total_number_of_processed_jobs_in_system > 0 else 0
+        return self._time_resolution.round_result(self.cumulative_visits_per_job / self.total_number_of_processed_jobs_in_system) if self.total_number_of_processed_jobs_in_system > 0 else 0
 
     def get_server_utilization(self) -> float:
-        return round(self.cumulative_server_busy_time / self.total_simulation_time, 4) if self.total_simulation_time > 0 else 0
+        return self._time_resolution.round_result(self.cumulative_server_busy_time / self.total_simulation_time) if self.total_simulation_time > 0 else 0
+
+    def get_server_utilization_confidence_interval(self, confidence: float = 0.95) -> Optional[ConfidenceInterval]:
+        """Batch-means confidence interval of the utilization. None unless the simulation kept batch means and the server had enough visits."""
+        return self._round_confidence_interval(self.utilization_batches, confidence)
 
     def get_throughput(self) -> float:
-        return round(self.cumulative_visits_per_job / self.total_simulation_time, 4) if self.total_simulation_time > 0 else 0
+        return self._time_resolution.round_result(self.cumulative_visits_per_job / self.total_simulation_time) if self.total_simulation_time > 0 else 0
     
     def get_demand(self) -> float:
-        return round((self.cumulative_time_in_server - self.cumulative_queue_times) / self.total_number_of_processed_jobs_in_system, 4) if self.total_number_of_processed_jobs_in_system > 0 else 0
+        return self._time_resolution.round_result((self.cumulative_time_in_server - self.cumulative_queue_times) / self.total_number_of_processed_jobs_in_system) if self.total_number_of_processed_jobs_in_system > 0 else 0
 
 class PriorityMetrics(GeneralMetrics):
-    def __init__(self, total_simulation_time: float):
-        super().__init__(total_simulation_time)
+    def __init__(self, total_simulation_time: float, checked: bool = True, time_resolution: TimeResolution = DEFAULT_RESOLUTION, batch_means: bool = False, overlapping_batches: bool = False):
+        super().__init__(total_simulation_time, checked, time_resolution, batch_means, overlapping_batches)
         self.cumulative_time_in_system = 0
+        self.time_in_system_batches = self._new_batch_means()
     
     def get_mean_time_in_system(self) -> float:
-        return round(self.cumulative_time_in_system / self.total_number_of_processed_jobs_in_system, 4) if self.total_number_of_processed_jobs_in_system > 0 else 0
+        return self._time_resolution.round_result(self.cumulative_time_in_system / self.total_number_of_processed_jobs_in_system) if self.total_number_of_processed_jobs_in_system > 0 else 0
+
+    def get_time_in_system_confidence_interval(self, confidence: float = 0.95) -> Optional[ConfidenceInterval]:
+        return self._round_confidence_interval(self.time_in_system_batches, confidence)
+
+    def compute_departures(self, number_of_jobs: int, time_in_system: float, queue_time: float):
+        self.total_number_of_processed_jobs_in_system += number_of_jobs
+        self.cumulative_time_in_system += time_in_system
+        self.cumulative_queue_times += queue_time
     
     def compute_departure(self, job: Job, time: float):
-        validate_number_params_not_negative_and_not_none(function_name='compute_departure', time=time)
-        validate_object_params_not_none(function_name='compute_departure', job=job)
+        if self._checked:
+            validate_number_params_not_negative_and_not_none(function_name='compute_departure', time=time)
+            validate_object_params_not_none(function_name='compute_departure', job=job)
 
-        if time < job.arrival_time:
-            raise ValueError('Provided time smaller than already registered time.')
+            if time < job.arrival_time:
+                raise ValueError('Provided time smaller than already registered time.')
 
         self.total_number_of_processed_jobs_in_system += 1
         self.cumulative_time_in_system += (time - job.arrival_time)
-        self.cumulative_queue_times += sum(job.queue_times_per_server.values())
\ No newline at end of file
+        self.cumulative_queue_times += job.total_queue_time
+
+        if self.time_in_system_batches is not None:
+            self.time_in_system_batches.add(time - job.arrival_time)
+            self.queue_time_batches.add(job.total_queue_time)
+            self.throughput_batches.add(1, self._elapsed_since_last_departure(time, job.arrival_time))
\ No newline at end of file
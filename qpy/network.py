@@ -1,7 +1,12 @@
 from .distribution import IDistribution
+from .event import Event
+from .event_list import IEventList
+from .plan import ExecutionPlan, compile_entry_points, compile_terminals
 from .server import Server
+from .spec import priorities_to_spec, routes_to_spec
 from .queue_discipline import IQueue, QueueDiscipline
-from .utils import generate_arrivals, generate_new_job_closed_network, transform_input_closed_network, validate_priority_input
+from .time_resolution import DEFAULT_RESOLUTION, TimeResolution
+from .utils import generate_next_arrival, generate_new_job_closed_network, validate_priority_input
 from .validation_utils import validate_number_params_not_negative_and_not_none, validate_object_params_not_none
 from abc import ABC, abstractmethod
 from collections import defaultdict
@@ -22,16 +27,66 @@ class INetwork(ABC):
         return
 
     @abstractmethod
-    def finish_job(self, event_queue: list, time: float, event_count: int) -> int:
+    def finish_job(self, event_queue: IEventList, time: float, event_count: int, finished_event: Optional[Event] = None) -> int:
+        return
+
+    @abstractmethod
+    def next_arrival(self, event_queue: IEventList, time: float, entry_point: int, event_count: int) -> int:
         return
 
 class BaseNetwork(INetwork):
     def __init__(self):
         self.servers = []
+        self.checked = True
+        self.time_resolution = DEFAULT_RESOLUTION
+        self._plan = None
+        self._loaded_plan = None
+
+    def reset_servers(self, checked: bool = True, time_resolution: TimeResolution = DEFAULT_RESOLUTION):
+        self.checked = checked
+        self.time_resolution = time_resolution
+
+        for server in self.servers:
+            server.reset_configuration(checked, time_resolution)
+
+    def _invalidate_plan(self):
+        self._plan = None
+        self._loaded_plan = None
+
+    def _compile_parts(self) -> tuple:
+        return (), None
+
+    def compile(self, time_resolution: TimeResolution = DEFAULT_RESOLUTION) -> ExecutionPlan:
+        if self._plan is None or self._plan.time_resolution is not time_resolution:
+            self.validate()
+
+            entry_points, terminals = self._compile_parts()
+            self._plan = ExecutionPlan(tuple(server.compile() for server in self.servers), entry_points, terminals, time_resolution)
 
-    def reset_servers(self):
+        return self._plan
+
+    def load_plan(self, plan: ExecutionPlan, checked: bool = True):
+        self.reset_servers(checked, plan.time_resolution)
+        self._loaded_plan = plan
+
+        for server, server_plan in zip(self.servers, plan.servers):
+            server.bind(server_plan)
+
+    def to_spec(self) -> dict:
+        return {'servers': [server.to_spec() for server in self.servers]}
+
+    def _validate_server_id(self, server_id, origin: str):
+        if not isinstance(server_id, int) or server_id < 0 or server_id >= len(self.servers):
+            raise ValueError(f'{origin} references server {server_id}, but only {len(self.servers)} servers were created (Index starts at 0).')
+
+    def validate(self):
         for server in self.servers:
-            server.reset_configuration()
+            validate_object_params_not_none(function_name='validate', service_distribution=server.server_execution.service_distribution, queue_discipline=server.server_execution.queue)
+
+            for destination, probability in server.destinations.items():
+                if destination != 'end':
+                    self._validate_server_id(destination, f'Routing from server {server.id}')
+                validate_number_params_not_negative_and_not_none(function_name='validate', routing_probability=probability)
 
     def add_server(self, service_distribution: IDistribution, queue_discipline: Optional[IQueue] = None) -> int:        
         if not queue_discipline:
@@ -39,6 +94,7 @@ class BaseNetwork(INetwork):
         
         server_id = len(self.servers)
         self.servers.append(Server(server_id, service_distribution, queue_discipline))
+        self._invalidate_plan()
 
         return server_id
 
@@ -49,6 +105,7 @@ class BaseNetwork(INetwork):
 
         if origin_server_id < number_of_servers and destination_server_id < number_of_servers:
             self.servers[origin_server_id].add_destination(destination_server_id, routing_probability)
+            self._invalidate_plan()
         
         else:
             raise ValueError(f'Provided server id is not valid. Received {origin_server_id if origin_server_id >= number_of_servers else destination_server_id} when only {number_of_servers} were created (Index starts at 0).')
@@ -56,13 +113,18 @@ class BaseNetwork(INetwork):
     def generate_jobs(self, time_limit: float): 
         return
 
-    def finish_job(self, event_queue: list, time: float, event_count: int):
+    def finish_job(self, event_queue: IEventList, time: float, event_count: int, finished_event: Optional[Event] = None):
+        return event_count
+
+    def next_arrival(self, event_queue: IEventList, time: float, entry_point: int, event_count: int) -> int:
         return event_count
 
 class OpenNetwork(BaseNetwork):
     def __init__(self):
-        self.arrivals = defaultdict(lambda: [])
-        self.priorities = defaultdict(lambda: None)
+        self.arrivals = defaultdict(list)
+        self.priorities = defaultdict(type(None))
+        self.time_limit = 0
+        self._entry_points = []
 
         super().__init__()
 
@@ -76,6 +138,8 @@ class OpenNetwork(BaseNetwork):
             if priority_distribution:
                 self.priorities[server_id] = priority_distribution
 
+            self._invalidate_plan()
+
             return
 
         raise ValueError("The provided server id is not valid.")
@@ -86,14 +150,49 @@ class OpenNetwork(BaseNetwork):
         event_queue = []
         event_count = 0
 
-        for server in self.arrivals.keys():
-            for distribution in self.arrivals[server]:
-                generate_arrivals(event_queue, event_count, time_limit, server, distribution, self.priorities[server])
+        self.time_limit = time_limit
+        self._entry_points = self._loaded_plan.entry_points if self._loaded_plan else self._compile_parts()[0]
+
+        for entry_point in range(len(self._entry_points)):
+            first_arrival = self._generate_arrival(0, entry_point, event_count)
+
+            if first_arrival:
+                event_queue.append(first_arrival)
+                event_count += 1
 
-                event_count = len(event_queue)
         return event_queue
 
-    def finish_job(self, event_queue: Optional[list] = None, time: Optional[float] = None, event_count: Optional[int] = None) -> int:
+    def _generate_arrival(self, time: float, entry_point: int, event_count: int) -> Optional[tuple]:
+        return generate_next_arrival(event_count, time, self.time_limit, entry_point, self._entry_points[entry_point], self.checked, self.time_resolution)
+
+    def _compile_parts(self) -> tuple:
+        return compile_entry_points(self.arrivals, self.priorities), None
+
+    def to_spec(self) -> dict:
+        # Entry points keep the order they were compiled in, so each one keeps its random stream
+        entry_points = [{'server': server, 'arrival': distribution.to_spec(), 'priorities': priorities_to_spec(self.priorities.get(server))} for server, distributions in self.arrivals.items() for distribution in distributions]
+
+        return {**super().to_spec(), 'entry_points': entry_points, 'terminals': None}
+
+    def validate(self):
+        super().validate()
+
+        for server, distributions in self.arrivals.items():
+            self._validate_server_id(server, 'Entry point')
+
+            for distribution in distributions:
+                validate_object_params_not_none(function_name='validate', arrival_distribution=distribution)
+
+    def finish_job(self, event_queue: Optional[IEventList] = None, time: Optional[float] = None, event_count: Optional[int] = None, finished_event: Optional[Event] = None) -> int:
+        return event_count
+
+    def next_arrival(self, event_queue: IEventList, time: float, entry_point: int, event_count: int) -> int:
+        next_arrival = self._generate_arrival(time, entry_point, event_count)
+
+        if next_arrival:
+            event_queue.push(next_arrival)
+            return event_count + 1
+
         return event_count
     
 
@@ -101,7 +200,7 @@ class OpenNetwork(BaseNetwork):
 class ClosedNetwork(BaseNetwork):
     def __init__(self, think_time_distribution: IDistribution, number_of_terminals: int):
         self.priorities = {}
-        self.entry_point_routing = defaultdict(lambda: 0)
+        self.entry_point_routing = defaultdict(int)
         self.think_time_distribution = think_time_distribution
         self.number_of_terminals = number_of_terminals
 
@@ -111,6 +210,7 @@ class ClosedNetwork(BaseNetwork):
 
     def add_priorities(self, priorities: dict):
         self.priorities = validate_priority_input(priorities)
+        self._invalidate_plan()
 
     def add_terminals_routing_probability(self, destination_server_id: int, probability: float):
         validate_number_params_not_negative_and_not_none(function_name='add_terminals_routing_probability', destination_server_id=destination_server_id, probability=probability)
@@ -123,21 +223,43 @@ class ClosedNetwork(BaseNetwork):
         if destination_server_id >= 0 and destination_server_id < len(self.servers):
             self.entry_point_routing["end"] -= probability
             self.entry_point_routing[destination_server_id] += probability
+            self._invalidate_plan()
 
             return
 
         raise ValueError("A server with the provided id was not found")
     
+    def validate(self):
+        super().validate()
+
+        validate_number_params_not_negative_and_not_none(function_name='validate', number_of_terminals=self.number_of_terminals)
+        validate_object_params_not_none(function_name='validate', think_time_distribution=self.think_time_distribution)
+
+        if self.entry_point_routing.get('end', 0) >= 1:
+            raise ValueError('Closed network need to have at least one route from terminals')
+
+        for destination in self.entry_point_routing.keys():
+            if destination != 'end':
+                self._validate_server_id(destination, 'Terminal routing')
+
+    def to_spec(self) -> dict:
+        terminals = {'number_of_terminals': self.number_of_terminals, 'think_time': self.think_time_distribution.to_spec(), 'routing': routes_to_spec(self.entry_point_routing), 'priorities': priorities_to_spec(self.priorities)}
+
+        return {**super().to_spec(), 'entry_points': [], 'terminals': terminals}
+
+    def _compile_parts(self) -> tuple:
+        return (), compile_terminals(self.number_of_terminals, self.think_time_distribution, self.entry_point_routing, self.priorities)
+
     def generate_jobs(self, time_limit: Optional[float] = None) -> list: 
         event_queue = []
-        self.entry_point_routing = transform_input_closed_network(self.entry_point_routing)
+        self._terminals = self._loaded_plan.terminals if self._loaded_plan else self._compile_parts()[1]
 
         for i in range(self.number_of_terminals):
-            generate_new_job_closed_network(event_queue, i, 0, self.think_time_distribution, self.entry_point_routing, self.priorities)
+            event_queue.append(generate_new_job_closed_network(i, 0, self._terminals, self.checked, self.time_resolution))
         
         return event_queue
 
-    def finish_job(self, event_queue: list, time: float, event_count: int) -> int:
-        generate_new_job_closed_network(event_queue, event_count, time, self.think_time_distribution, self.entry_point_routing, self.priorities)
+    def finish_job(self, event_queue: IEventList, time: float, event_count: int, finished_event: Optional[Event] = None) -> int:
+        event_queue.push(generate_new_job_closed_network(event_count, time, self._terminals, self.checked, self.time_resolution, finished_event))
 
         return event_count + 1
\ No newline at end of file
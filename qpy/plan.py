@@ -0,0 +1,180 @@
+import copy, numpy as np, random
+
+
+from .distribution import IDistribution, UniformDistribution
+from .queue_discipline import Discipline
+from .time_resolution import TimeResolution
+from typing import Callable, NamedTuple, Optional
+
+
+def _build_alias_table(probabilities: np.ndarray) -> tuple:
+    size = len(probabilities)
+    scaled = probabilities * size / probabilities.sum()
+    acceptance = np.ones(size)
+    aliases = np.arange(size)
+    small = [index for index in range(size) if scaled[index] < 1]
+    large = [index for index in range(size) if scaled[index] >= 1]
+
+    while small and large:
+        less, more = small.pop(), large.pop()
+
+        acceptance[less] = scaled[less]
+        aliases[less] = more
+        scaled[more] += scaled[less] - 1
+
+        (small if scaled[more] < 1 else large).append(more)
+
+    return acceptance, aliases
+
+class DiscreteSampler:
+    """
+    Draws one of `values` with the given probabilities in O(1) through a Walker alias table.
+
+    A single uniform picks a column and decides between the column's own value and its alias, however many values there are. The CDF
+    and the alias table are kept as read-only NumPy arrays for consumers that work on whole arrays, and as lists for scalar draws, which
+    index much faster on Python floats than on NumPy scalars.
+    """
+    def __init__(self, values: tuple, probabilities: tuple):
+        probabilities = np.asarray(list(probabilities), dtype=float)
+
+        self.values = tuple(values)
+        self.probabilities = probabilities
+        self.cdf = np.cumsum(probabilities)
+        self.acceptance, self.aliases = _build_alias_table(probabilities) if len(self.values) > 0 else (np.empty(0), np.empty(0, dtype=int))
+
+        for array in (self.probabilities, self.cdf, self.acceptance, self.aliases):
+            array.flags.writeable = False
+
+        self._size = len(self.values)
+        self._acceptance = self.acceptance.tolist()
+        self._alias_values = [self.values[alias] for alias in self.aliases.tolist()]
+        self._uniform = random.random
+        self._uniforms = None
+
+    def with_stream(self, generator: np.random.Generator) -> 'DiscreteSampler':
+        uniforms = UniformDistribution(0, 1)
+        uniforms.reset(generator)
+
+        sampler = copy.copy(self)
+        sampler._uniform = uniforms.sample
+        sampler._uniforms = uniforms
+
+        return sampler
+
+    def draw_many(self, size: int) -> np.ndarray:
+        """Draws `size` values at once and returns their indexes in `values`."""
+        uniforms = (self._uniforms or UniformDistribution(0, 1)).sample_many(size)
+        columns = uniforms * self._size
+        indexes = columns.astype(np.int64)
+
+        return np.where(columns - indexes < self.acceptance[indexes], indexes, self.aliases[indexes])
+
+    def draw(self):
+        if self._size == 0:
+            return None
+
+        column = self._uniform() * self._size
+        index = int(column)
+
+        if column - index < self._acceptance[index]:
+            return self.values[index]
+
+        return self._alias_values[index]
+
+SERVICE_STREAM = 0
+ROUTING_STREAM = 1
+ARRIVAL_STREAM = 2
+PRIORITY_STREAM = 3
+THINK_TIME_STREAM = 4
+TERMINAL_ROUTING_STREAM = 5
+TERMINAL_PRIORITY_STREAM = 6
+
+
+def _stream(entropy: int, stream: int, site: int) -> np.random.Generator:
+    return np.random.default_rng(np.random.SeedSequence(entropy, spawn_key=(stream, site)))
+
+def _distribution_with_stream(distribution: IDistribution, generator: np.random.Generator) -> IDistribution:
+    site_distribution = copy.copy(distribution)
+    site_distribution.reset(generator)
+
+    return site_distribution
+
+def _sampler_with_stream(sampler: Optional[DiscreteSampler], generator: np.random.Generator) -> Optional[DiscreteSampler]:
+    return sampler.with_stream(generator) if sampler is not None else None
+
+class ServerPlan(NamedTuple):
+    server_id: int
+    service_distribution: IDistribution
+    sample_service: Callable[[], float]
+    discipline: int
+    preemptive: bool
+    preemption_time: Optional[float]
+    routing: DiscreteSampler
+
+class EntryPointPlan(NamedTuple):
+    server_id: int
+    arrival_distribution: IDistribution
+    sample_arrival: Callable[[], float]
+    priorities: Optional[DiscreteSampler]
+
+class TerminalPlan(NamedTuple):
+    number_of_terminals: int
+    think_time_distribution: IDistribution
+    sample_think_time: Callable[[], float]
+    routing: DiscreteSampler
+    priorities: Optional[DiscreteSampler]
+
+class ExecutionPlan(NamedTuple):
+    servers: tuple
+    entry_points: tuple
+    terminals: Optional[TerminalPlan]
+    time_resolution: TimeResolution
+
+    def with_streams(self, seed: int) -> 'ExecutionPlan':
+        """
+        Returns a copy of the plan where every random site draws from its own stream, derived from `seed` through a SeedSequence keyed on
+        the kind of site and its index: the service and the routing of each server, the arrivals and the priorities of each entry point and
+        the think time, routing and priorities of the terminals. Distributions shared by several sites are copied, so each site keeps its
+        own stream, and the streams of a site don't move when other sites are added.
+        """
+        servers = []
+
+        for index, server in enumerate(self.servers):
+            service_distribution = _distribution_with_stream(server.service_distribution, _stream(seed, SERVICE_STREAM, index))
+            servers.append(server._replace(service_distribution=service_distribution, sample_service=service_distribution.sample, routing=server.routing.with_stream(_stream(seed, ROUTING_STREAM, index))))
+
+        entry_points = []
+
+        for index, entry_point in enumerate(self.entry_points):
+            arrival_distribution = _distribution_with_stream(entry_point.arrival_distribution, _stream(seed, ARRIVAL_STREAM, index))
+            entry_points.append(entry_point._replace(arrival_distribution=arrival_distribution, sample_arrival=arrival_distribution.sample, priorities=_sampler_with_stream(entry_point.priorities, _stream(seed, PRIORITY_STREAM, index))))
+
+        terminals = self.terminals
+
+        if terminals is not None:
+            think_time_distribution = _distribution_with_stream(terminals.think_time_distribution, _stream(seed, THINK_TIME_STREAM, 0))
+            terminals = terminals._replace(think_time_distribution=think_time_distribution, sample_think_time=think_time_distribution.sample, routing=terminals.routing.with_stream(_stream(seed, TERMINAL_ROUTING_STREAM, 0)), priorities=_sampler_with_stream(terminals.priorities, _stream(seed, TERMINAL_PRIORITY_STREAM, 0)))
+
+        return self._replace(servers=tuple(servers), entry_points=tuple(entry_points), terminals=terminals)
+
+def _priority_sampler(priorities: Optional[dict]) -> Optional[DiscreteSampler]:
+    if not priorities:
+        return None
+
+    return DiscreteSampler(priorities.keys(), priorities.values())
+
+def compile_server(server_id: int, service_distribution, queue, destinations: dict) -> ServerPlan:
+    discipline = queue.discipline
+    preemptive = queue.with_preemption() and discipline in (Discipline.SRT, Discipline.PRIORITY)
+    preemption_time = queue.preemption_time if discipline == Discipline.RR else None
+
+    return ServerPlan(server_id, service_distribution, service_distribution.sample, discipline.value, preemptive, preemption_time, DiscreteSampler(destinations.keys(), destinations.values()))
+
+def compile_entry_points(arrivals: dict, priorities: dict) -> tuple:
+    return tuple(EntryPointPlan(server, distribution, distribution.sample, _priority_sampler(priorities.get(server))) for server in arrivals.keys() for distribution in arrivals[server])
+
+def compile_terminals(number_of_terminals: int, think_time_distribution, routing: dict, priorities: Optional[dict]) -> TerminalPlan:
+    destinations = [destination for destination in routing.keys() if destination != 'end']
+    margin = 1 - routing.get('end', 0)
+
+    return TerminalPlan(number_of_terminals, think_time_distribution, think_time_distribution.sample, DiscreteSampler(destinations, [routing[destination] / margin for destination in destinations]), _priority_sampler(priorities))
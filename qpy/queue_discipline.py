@@ -27,6 +27,10 @@ class IQueue(ABC):
     def first_in_line(self):
         pass
 
+    def to_spec(self) -> dict:
+        """The factory of QueueDiscipline that builds this discipline and its parameters, see QueueDiscipline.from_spec."""
+        raise ValueError(f'{type(self).__name__} has no spec: only the disciplines built by QueueDiscipline can be described by one.')
+
     @abstractmethod
     def clear(self):
         pass
@@ -58,6 +62,9 @@ class FirstComeFirstServed(IQueue):
     def with_preemption(self):
         return False
 
+    def to_spec(self) -> dict:
+        return {'discipline': 'fcfs'}
+
 class LastComeFirstServed(IQueue):
     def __init__(self):
         self._queue = deque()
@@ -81,6 +88,9 @@ class LastComeFirstServed(IQueue):
     def with_preemption(self):
         return False
 
+    def to_spec(self) -> dict:
+        return {'discipline': 'lcfs'}
+
 class ShortestRemainingTime(IQueue):
     def __init__(self, with_preemption: bool = False):
         self._queue = []
@@ -107,6 +117,9 @@ class ShortestRemainingTime(IQueue):
     def with_preemption(self):
         return self._preemption
 
+    def to_spec(self) -> dict:
+        return {'discipline': 'srt', 'with_preemption': bool(self._preemption)}
+
 class RoundRobin(IQueue):
     def __init__(self, preemption_time: float):
         self._queue = deque()
@@ -131,6 +144,9 @@ class RoundRobin(IQueue):
     def with_preemption(self):
         return True
 
+    def to_spec(self) -> dict:
+        return {'discipline': 'round_robin', 'preemption_time': float(self.preemption_time)}
+
 class PriorityQueue(IQueue):
     def __init__(self, with_preemption: bool = False):
         self._queue = []
@@ -157,6 +173,9 @@ class PriorityQueue(IQueue):
     def with_preemption(self):
         return self._preemption
 
+    def to_spec(self) -> dict:
+        return {'discipline': 'priority_queue', 'with_preemption': bool(self._preemption)}
+
 class QueueDiscipline():
     def __new__(cls, *args, **kwargs):
         if cls is QueueDiscipline:
@@ -219,4 +238,24 @@ class QueueDiscipline():
         with_preemption : bool - Optional
             If True, enables preemption based on job priority. A job in service may be preempted by a higher-priority job. Default is False.
         """
-        return PriorityQueue(with_preemption)
\ No newline at end of file
+        return PriorityQueue(with_preemption)
+
+    @staticmethod
+    @validate_call
+    def from_spec(spec: dict):
+        """
+        Returns the queue discipline described by `spec`, as given by the to_spec() method of a discipline.
+
+        Parameters
+        ----------
+        spec : dict - Required
+            The name of the factory under 'discipline' and its parameters, e.g. {'discipline': 'round_robin', 'preemption_time': 0.5}.
+        """
+        factories = {'fcfs': QueueDiscipline.fcfs, 'lcfs': QueueDiscipline.lcfs, 'srt': QueueDiscipline.srt, 'round_robin': QueueDiscipline.round_robin, 'priority_queue': QueueDiscipline.priority_queue}
+        parameters = {key: value for key, value in spec.items() if key != 'discipline'}
+
+        if spec.get('discipline') not in factories:
+            raise ValueError(f'Queue discipline not allowed in a spec: {spec.get("discipline")}')
+
+        return factories[spec['discipline']](**parameters)
+
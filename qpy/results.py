@@ -1,5 +1,7 @@
 from collections import defaultdict
+from .estimation import PRECISION_MINIMUM_OBSERVATIONS, replication_statistics
 from .metrics import EnvironmentMetrics, PriorityMetrics, ServerMetrics
+from .time_resolution import DEFAULT_RESOLUTION
 from .validation_utils import validate_number_params_not_negative_and_not_none, validate_object_params_not_none
 
 
@@ -32,23 +34,92 @@ class PriorityResults:
         self.mean_queue_time = mean_queue_time
 
 
+class EventListStatistics:
+    def __init__(self):
+        self.canceled_events = 0
+        self.compactions = 0
+        self.max_dead_event_ratio = 0
+
+    def compute_cancellation(self, dead_events: int, queue_size: int):
+        self.canceled_events += 1
+
+        if queue_size > 0:
+            self.max_dead_event_ratio = max(self.max_dead_event_ratio, dead_events / queue_size)
+
+
+def _half_width(confidence_interval, scale = 1):
+    return f' ± {confidence_interval.half_width * scale}' if confidence_interval else ''
+
+
 class SimulationResults:
-    def __init__(self, number_of_servers, total_simulation_time, time_unit):
-        self.environment_metrics = EnvironmentMetrics(total_simulation_time)
-        self.server_metrics = [ServerMetrics(i, total_simulation_time) for i in range(number_of_servers)]
-        self.priority_metrics = defaultdict(lambda: PriorityMetrics(total_simulation_time))
-        self.jobs = defaultdict(lambda: None)
+    def __init__(self, number_of_servers, total_simulation_time, time_unit, checked = True, time_resolution = DEFAULT_RESOLUTION, trace = None, warmup_time = 0, batch_means = False, overlapping_batches = False):
+        self.total_simulation_time = total_simulation_time
+        self.environment_metrics = EnvironmentMetrics(total_simulation_time, checked, time_resolution, batch_means, overlapping_batches)
+        self.server_metrics = [ServerMetrics(i, total_simulation_time, checked, time_resolution, batch_means, overlapping_batches) for i in range(number_of_servers)]
+        # A bound method instead of a lambda keeps the results picklable, so they can come back from a worker process
+        self.priority_metrics = defaultdict(self._new_priority_metrics)
+        self.trace = trace
+        self.warmup_time = warmup_time
+        # With an 'auto' warm-up, the MSER truncation point: measuring starts later, at warmup_time, when the transient was detected
+        self.warmup_truncation_time = None
+        self.event_list_statistics = EventListStatistics()
         self.time_unit = time_unit
+        self._checked = checked
+        self._time_resolution = time_resolution
+        self._batch_means = batch_means
+        self._overlapping_batches = overlapping_batches
+        self._pending_server_departures = 0
+
+    def _new_priority_metrics(self) -> PriorityMetrics:
+        return PriorityMetrics(self.total_simulation_time, self._checked, self._time_resolution, self._batch_means, self._overlapping_batches)
     
-    def _add_job_to_result(self, job):
-        self.jobs[job.id] = job
-    
-    def _compute_servers_departure(self, job, time):
-        for server_id in range(len(self.server_metrics)):
-            self.server_metrics[server_id].compute_environment_departure(job)
+    @property
+    def jobs(self) -> dict:
+        """The departed jobs kept by the trace, by id. Empty unless a trace that keeps records was given to the simulation."""
+        return {record.id: record for record in self.trace} if self.trace is not None else {}
+
+    def compute_servers_departures(self):
+        """
+        Every job leaving the system counts as processed for all servers. Instead of touching each server on every departure, departures
+        are counted once in the environment metrics and handed to the servers here, when the execution ends.
+        """
+        for server_metrics in self.server_metrics:
+            server_metrics.compute_environment_departures(self._pending_server_departures, 0, 0, 0)
+
+        self._pending_server_departures = 0
+
+    def compute_total_simulation_time(self, total_simulation_time):
+        """Sets the measured time when the simulation stops before its horizon, so time averages are taken over the time actually run."""
+        self.total_simulation_time = total_simulation_time
+        self.environment_metrics.total_simulation_time = total_simulation_time
+
+        for metrics in self.server_metrics + list(self.priority_metrics.values()):
+            metrics.total_simulation_time = total_simulation_time
+
+    def has_reached_precision(self, relative_half_width, confidence):
+        """
+        Whether the batch-means confidence intervals of E[T] and of the utilization of every visited server are all within
+        `relative_half_width` of their means. Only evaluated when a batch of departures completes, once PRECISION_MINIMUM_OBSERVATIONS
+        departures were measured and the batches were merged at least once (so each batch holds several departures).
+        """
+        batches = self.environment_metrics.time_in_system_batches
+
+        if not batches.batch_completed or batches.number_of_observations < PRECISION_MINIMUM_OBSERVATIONS or batches.batch_size == 1:
+            return False
+
+        estimators = [batches] + [server.utilization_batches for server in self.server_metrics if server.utilization_batches.number_of_observations > 0]
+
+        for estimator in estimators:
+            confidence_interval = estimator.confidence_interval(confidence)
+
+            if confidence_interval is None or confidence_interval.relative_half_width > relative_half_width:
+                return False
+
+        return True
 
     def compute_arrival(self, current_time, server_id, should_update_environemnt = False):
-        validate_number_params_not_negative_and_not_none(function_name='compute_arrival', current_time=current_time, server_id=server_id)
+        if self._checked:
+            validate_number_params_not_negative_and_not_none(function_name='compute_arrival', current_time=current_time, server_id=server_id)
 
         self.server_metrics[server_id].compute_arrival(current_time)
 
@@ -56,43 +127,115 @@ class SimulationResults:
             self.environment_metrics.compute_arrival(current_time)
 
     def reroute(self, current_time, origin_server, destination_server):
-        validate_number_params_not_negative_and_not_none(function_name='reroute', current_time=current_time, origin_server=origin_server)
+        if self._checked:
+            validate_number_params_not_negative_and_not_none(function_name='reroute', current_time=current_time, origin_server=origin_server)
 
         self.server_metrics[origin_server].compute_departure(current_time)
 
+    def compute_visit(self, server_id, queue_time, time_in_server):
+        self.server_metrics[server_id].compute_visit(queue_time, time_in_server)
+
     def compute_departure(self, job, current_time):
-        validate_number_params_not_negative_and_not_none(function_name='compute_departure', current_time=current_time)
-        validate_object_params_not_none(function_name='compute_departure', job=job)
+        if self._checked:
+            validate_number_params_not_negative_and_not_none(function_name='compute_departure', current_time=current_time)
+            validate_object_params_not_none(function_name='compute_departure', job=job)
+
+        if self.trace is not None:
+            self.trace.record(job, current_time)
 
-        self._add_job_to_result(job)
         self.environment_metrics.compute_departure(job, current_time)
         self.priority_metrics[job.priority].compute_departure(job, current_time)
-        
-        self._compute_servers_departure(job, current_time)
+
+        self._pending_server_departures += 1
     
+    def get_environment_results(self) -> EnvironmentResults:
+        environment = self.environment_metrics
+
+        return EnvironmentResults(environment.get_number_of_processed_jobs(), environment.get_mean_time_in_system(), environment.get_mean_queue_time(), environment.get_mean_number_of_jobs_in_system(), environment.get_throughput(), max(server.get_demand() for server in self.server_metrics))
+
+    def get_server_results(self) -> list:
+        return [ServerResults(server.get_number_of_processed_jobs(), server.get_mean_time_in_server(), server.get_mean_queue_time(), server.get_mean_number_of_jobs_in_system(), server.get_mean_visits_per_job(), server.get_server_utilization(), server.get_throughput(), server.get_demand()) for server in self.server_metrics]
+
+    def get_priority_results(self) -> dict:
+        return {priority: PriorityResults(metrics.get_number_of_processed_jobs(), metrics.get_mean_time_in_system(), metrics.get_mean_queue_time()) for priority, metrics in self.priority_metrics.items()}
+
     def show_simulation_metrics(self):
         print('\n====================  Environment Metrics ====================\n')
         print(f'Total number of processed jobs: {self.environment_metrics.get_number_of_processed_jobs()}')
-        print(f'E[T]: {self.environment_metrics.get_mean_time_in_system()} {self.time_unit} per job')
-        print(f'E[Tq]: {self.environment_metrics.get_mean_queue_time()} {self.time_unit} per job')
-        print(f'E[N]: {self.environment_metrics.get_mean_number_of_jobs_in_system()} jobs')
-        print(f'X: {self.environment_metrics.get_throughput()} jobs per {self.time_unit}')
+        print(f'E[T]: {self.environment_metrics.get_mean_time_in_system()}{_half_width(self.environment_metrics.get_time_in_system_confidence_interval())} {self.time_unit} per job')
+        print(f'E[Tq]: {self.environment_metrics.get_mean_queue_time()}{_half_width(self.environment_metrics.get_queue_time_confidence_interval())} {self.time_unit} per job')
+        print(f'E[N]: {self.environment_metrics.get_mean_number_of_jobs_in_system()}{_half_width(self.environment_metrics.get_number_of_jobs_in_system_confidence_interval())} jobs')
+        print(f'X: {self.environment_metrics.get_throughput()}{_half_width(self.environment_metrics.get_throughput_confidence_interval())} jobs per {self.time_unit}')
         print(f'Dmax: {max(s.get_demand() for s in self.server_metrics)} {self.time_unit} per job')
 
         for server in self.server_metrics:
             print(f'\n==================== Server {server.server_id+1} Metrics ====================\n')
             print(f'Total number of processed jobs: {server.get_number_of_processed_jobs()}')
-            print(f'E[T]: {server.get_mean_time_in_server()} {self.time_unit} per job')
-            print(f'E[Tq]: {server.get_mean_queue_time()} {self.time_unit} per job')
-            print(f'E[N]: {server.get_mean_number_of_jobs_in_system()} jobs')
+            print(f'E[T]: {server.get_mean_time_in_server()}{_half_width(server.get_time_in_server_confidence_interval())} {self.time_unit} per job')
+            print(f'E[Tq]: {server.get_mean_queue_time()}{_half_width(server.get_queue_time_confidence_interval())} {self.time_unit} per job')
+            print(f'E[N]: {server.get_mean_number_of_jobs_in_system()}{_half_width(server.get_number_of_jobs_in_system_confidence_interval())} jobs')
             print(f'E[V]: {server.get_mean_visits_per_job()} visits per job')
-            print(f'Utilization: {server.get_server_utilization() * 100}%')
-            print(f'X: {server.get_throughput()} jobs per {self.time_unit}')
+            print(f'Utilization: {server.get_server_utilization() * 100}{_half_width(server.get_server_utilization_confidence_interval(), 100)}%')
+            print(f'X: {server.get_throughput()}{_half_width(server.get_throughput_confidence_interval())} jobs per {self.time_unit}')
             print(f'D: {server.get_demand()} {self.time_unit} per job')
         
         if len(self.priority_metrics.keys()) > 1:
             for key, value in sorted(self.priority_metrics.items()):
                 print(f'\n==================== Priority {key} Metrics ====================\n')
                 print(f'Total number of processed jobs: {value.get_number_of_processed_jobs()}')
-                print(f'E[T]: {value.get_mean_time_in_system()} {self.time_unit} per job')
-                print(f'E[Tq]: {value.get_mean_queue_time()} {self.time_unit} per job')
\ No newline at end of file
+                print(f'E[T]: {value.get_mean_time_in_system()}{_half_width(value.get_time_in_system_confidence_interval())} {self.time_unit} per job')
+                print(f'E[Tq]: {value.get_mean_queue_time()}{_half_width(value.get_queue_time_confidence_interval())} {self.time_unit} per job')
+
+
+def _aggregate(results_class, snapshots: list, confidence: float):
+    return results_class(**{field: replication_statistics([getattr(snapshot, field) for snapshot in snapshots], confidence) for field in vars(snapshots[0])})
+
+
+class ReplicationResults:
+    """
+    Metrics of independent replications of the same simulation. `environment`, `servers` and `priorities` have the fields of
+    EnvironmentResults, ServerResults and PriorityResults, each one a ReplicationStatistics (mean, standard deviation and Student's t
+    half-width at `confidence` over the replications). The results of each replication are kept in `replications`.
+    """
+    def __init__(self, replications: list, confidence: float = 0.95):
+        self.replications = replications
+        self.confidence = confidence
+        self.time_unit = replications[0].time_unit
+        self.environment = _aggregate(EnvironmentResults, [results.get_environment_results() for results in replications], confidence)
+        self.servers = [_aggregate(ServerResults, list(snapshots), confidence) for snapshots in zip(*(results.get_server_results() for results in replications))]
+
+        priorities = [results.get_priority_results() for results in replications]
+        # A priority missing from a replication had no job leaving the system in it, so it is aggregated over the others
+        self.priorities = {priority: _aggregate(PriorityResults, [snapshot[priority] for snapshot in priorities if priority in snapshot], confidence) for priority in sorted({priority for snapshot in priorities for priority in snapshot})}
+
+    def show_simulation_metrics(self):
+        print(f'\n====================  Environment Metrics ({len(self.replications)} replications, {self.confidence * 100}% CI) ====================\n')
+        print(f'Total number of processed jobs: {_statistics(self.environment.number_of_processed_jobs)}')
+        print(f'E[T]: {_statistics(self.environment.mean_time_in_system)} {self.time_unit} per job')
+        print(f'E[Tq]: {_statistics(self.environment.mean_queue_time)} {self.time_unit} per job')
+        print(f'E[N]: {_statistics(self.environment.mean_number_of_jobs_in_system)} jobs')
+        print(f'X: {_statistics(self.environment.throughput)} jobs per {self.time_unit}')
+        print(f'Dmax: {_statistics(self.environment.max_demand)} {self.time_unit} per job')
+
+        for server_id, server in enumerate(self.servers):
+            print(f'\n==================== Server {server_id+1} Metrics ====================\n')
+            print(f'Total number of processed jobs: {_statistics(server.number_of_processed_jobs)}')
+            print(f'E[T]: {_statistics(server.mean_time_in_server)} {self.time_unit} per job')
+            print(f'E[Tq]: {_statistics(server.mean_queue_time)} {self.time_unit} per job')
+            print(f'E[N]: {_statistics(server.mean_number_of_jobs_in_server)} jobs')
+            print(f'E[V]: {_statistics(server.mean_visits_per_job)} visits per job')
+            print(f'Utilization: {_statistics(server.server_utilization, 100)}%')
+            print(f'X: {_statistics(server.throughput)} jobs per {self.time_unit}')
+            print(f'D: {_statistics(server.demand)} {self.time_unit} per job')
+
+        if len(self.priorities) > 1:
+            for key, value in self.priorities.items():
+                print(f'\n==================== Priority {key} Metrics ====================\n')
+                print(f'Total number of processed jobs: {_statistics(value.number_of_processed_jobs)}')
+                print(f'E[T]: {_statistics(value.mean_time_in_system)} {self.time_unit} per job')
+                print(f'E[Tq]: {_statistics(value.mean_queue_time)} {self.time_unit} per job')
+
+
+def _statistics(statistics, scale = 1) -> str:
+    return f'{statistics.mean * scale} ± {statistics.half_width * scale}'
+
@@ -2,18 +2,40 @@ from typing import Optional, Union
 from .distribution import IDistribution
 from .event import Event
 from .job import Job
+from .plan import ServerPlan, compile_server
 from .queue_discipline import Discipline, IQueue
-from .utils import randomly_draw_from_dictionary
+from .spec import routes_to_spec
+from .time_resolution import DEFAULT_RESOLUTION, TimeResolution
 from .validation_utils import validate_object_params_not_none, validate_number_params_not_negative_and_not_none
 
 
+SRT = Discipline.SRT.value
+PRIORITY = Discipline.PRIORITY.value
+
+
 class ServerExecution:
     def __init__(self, service_distribution: IDistribution, queue: IQueue):
-        self.MIN_SERVICE_TIME = 0.0001
-        self.service_distribution = service_distribution
         self.queue = queue
+        self.service_distribution = service_distribution
+        self._checked = True
+        self._time_resolution = DEFAULT_RESOLUTION
 
         self._reset_execution_configuration()
+
+    @property
+    def service_distribution(self) -> IDistribution:
+        return self._service_distribution
+
+    @service_distribution.setter
+    def service_distribution(self, service_distribution: IDistribution):
+        self._service_distribution = service_distribution
+        self.bind(compile_server(None, service_distribution, self.queue, {}))
+
+    def bind(self, server_plan: ServerPlan):
+        self._sample_service = server_plan.sample_service
+        self._discipline = server_plan.discipline
+        self._preemptive = server_plan.preemptive
+        self._preemption_time = server_plan.preemption_time
     
     def _reset_execution_configuration(self):
         self.current_job_being_executed = None
@@ -21,51 +43,49 @@ class ServerExecution:
         self.time_current_execution_started = 0
 
     def _execute_new_job(self, job: Job, size: float, time: float):
-        validate_object_params_not_none(function_name='execute_new_job', job=job)
-        validate_number_params_not_negative_and_not_none(function_name='execute_new_job', size=size, time=time)
+        if self._checked:
+            validate_object_params_not_none(function_name='execute_new_job', job=job)
+            validate_number_params_not_negative_and_not_none(function_name='execute_new_job', size=size, time=time)
 
         self.current_job_being_executed = job
         self.current_job_size = size
         self.time_current_execution_started = time
 
     def _remaining_time_for_current_job(self, time: float) -> float:
-        validate_number_params_not_negative_and_not_none(function_name='remaining_time_for_current_job', time=time)
+        if self._checked:
+            validate_number_params_not_negative_and_not_none(function_name='remaining_time_for_current_job', time=time)
 
-        if time < self.time_current_execution_started:
-            raise ValueError(f'Job can\'t have negative reimaining time.\nCurrent time: {time} | Time execution started: {self.time_current_execution_started}')
+            if time < self.time_current_execution_started:
+                raise ValueError(f'Job can\'t have negative reimaining time.\nCurrent time: {time} | Time execution started: {self.time_current_execution_started}')
 
         return self.current_job_size - (time - self.time_current_execution_started)
 
     def _should_preempt(self, new_job: Job, new_job_size: float, time: float):
-        validate_object_params_not_none(function_name='should_preempt', new_job=new_job)
-        validate_number_params_not_negative_and_not_none('should_preempt', new_job_size=new_job_size, time=time)
+        if self._checked:
+            validate_object_params_not_none(function_name='should_preempt', new_job=new_job)
+            validate_number_params_not_negative_and_not_none('should_preempt', new_job_size=new_job_size, time=time)
 
-        if self.queue.discipline == Discipline.SRT:
+        if self._discipline == SRT:
             return new_job_size < self._remaining_time_for_current_job(time)
-        if self.queue.discipline == Discipline.PRIORITY:
+        if self._discipline == PRIORITY:
             return new_job.priority > self.current_job_being_executed.priority
         
         return False
 
-    def reset_configuration(self):
+    def reset_configuration(self, checked: bool = True, time_resolution: TimeResolution = DEFAULT_RESOLUTION):
         self.queue.clear()
+        self._checked = checked
+        self._time_resolution = time_resolution
         self._reset_execution_configuration()
 
     def is_next_event_departure(self) -> bool:
-        if self.queue.discipline == Discipline.RR:
-            if self.current_job_size > self.queue.preemption_time:
-                return False
-        
-        return True
+        return self._preemption_time is None or self.current_job_size <= self._preemption_time
     
     def get_preemption_time(self) -> float:
-        if self.queue.discipline == Discipline.RR:
-            return self.queue.preemption_time
-        return None
+        return self._preemption_time
 
     def job_arrival(self, event: Event) -> Optional[float]:
-        job_size = self.service_distribution.sample()
-        job_size = job_size if job_size > 0 else self.MIN_SERVICE_TIME
+        job_size = self._time_resolution.duration(self._sample_service())
         job = event.job
         time = event.current_time
         
@@ -74,10 +94,10 @@ class ServerExecution:
 
             return job_size
         
-        if self.queue.with_preemption() and (self.queue.discipline == Discipline.SRT or self.queue.discipline == Discipline.PRIORITY):
+        if self._preemptive:
             if self._should_preempt(job, job_size, time):
+                self.current_job_being_executed.requeue(time)
                 self.queue.insert(self.current_job_being_executed, self._remaining_time_for_current_job(time))
-                event.canceled = True
 
                 self._execute_new_job(job, job_size, time)
 
@@ -94,11 +114,12 @@ class ServerExecution:
 
             self._execute_new_job(new_job, new_job_size, time)
 
-            return next_job_in_line if self.is_next_event_departure() else (self.queue.preemption_time, new_job)
+            return next_job_in_line if self.is_next_event_departure() else (self._preemption_time, new_job)
         
         self._reset_execution_configuration()
     
     def preempt(self, time: float) -> tuple:
+        self.current_job_being_executed.requeue(time)
         next_job = self.queue.first_in_line()
 
         if next_job:
@@ -109,11 +130,11 @@ class ServerExecution:
 
             self._execute_new_job(new_job, new_job_size, time)
 
-            return next_job if self.is_next_event_departure() else (self.queue.preemption_time, new_job)
+            return next_job if self.is_next_event_departure() else (self._preemption_time, new_job)
 
         self._execute_new_job(self.current_job_being_executed, self._remaining_time_for_current_job(time), time)
 
-        return (self._remaining_time_for_current_job(time) if self.is_next_event_departure() else self.queue.preemption_time, self.current_job_being_executed)
+        return (self._remaining_time_for_current_job(time) if self.is_next_event_departure() else self._preemption_time, self.current_job_being_executed)
 
 class Server:
     def __init__(self, id: int, service_distribution: IDistribution, queue: IQueue):
@@ -121,6 +142,18 @@ class Server:
         self.server_execution = ServerExecution(service_distribution, queue)
         self.destinations = {"end": 1.0}
         self.job_count = 0
+        self._routing = self.compile().routing
+
+    def compile(self) -> ServerPlan:
+        return compile_server(self.id, self.server_execution.service_distribution, self.server_execution.queue, self.destinations)
+
+    def bind(self, server_plan: ServerPlan):
+        self._routing = server_plan.routing
+        self.server_execution.bind(server_plan)
+
+    def to_spec(self) -> dict:
+        # Routes keep the order they were added in, which is the order of the routing draw
+        return {'service': self.server_execution.service_distribution.to_spec(), 'queue': self.server_execution.queue.to_spec(), 'routing': routes_to_spec(self.destinations)}
     
     def add_destination(self, destination_server_id: int, probability: float):
         validate_number_params_not_negative_and_not_none(function_name='add_destination', destination_server_id=destination_server_id, probability=probability)
@@ -132,12 +165,13 @@ class Server:
         
         self.destinations["end"] -= probability
         self.destinations[destination_server_id] = probability
+        self._routing = self.compile().routing
     
-    def reset_configuration(self):
-        self.server_execution.reset_configuration()
+    def reset_configuration(self, checked: bool = True, time_resolution: TimeResolution = DEFAULT_RESOLUTION):
+        self.server_execution.reset_configuration(checked, time_resolution)
 
     def route_job(self) -> Union[int, str]:
-        return randomly_draw_from_dictionary(self.destinations)
+        return self._routing.draw()
     
     def is_next_event_departure(self) -> bool:
         return self.server_execution.is_next_event_departure()
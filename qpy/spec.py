@@ -0,0 +1,27 @@
+import hashlib
+import json
+
+
+from typing import Optional
+
+
+SPEC_VERSION = 1
+
+
+def routes_to_spec(destinations: dict) -> list:
+    """Routes of a routing dict, without the 'end' route (it is whatever probability is left)."""
+    return [{'server': destination, 'probability': float(probability)} for destination, probability in destinations.items() if destination != 'end']
+
+def priorities_to_spec(priorities: Optional[dict]) -> Optional[list]:
+    return [{'priority': priority, 'probability': float(probability)} for priority, probability in priorities.items()] if priorities else None
+
+def priorities_from_spec(priorities: Optional[list]) -> Optional[dict]:
+    return {priority['priority']: priority['probability'] for priority in priorities} if priorities else None
+
+def canonical_json(spec: dict) -> str:
+    """The spec as JSON with sorted keys and no whitespace, so equal specs always give the same text."""
+    return json.dumps(spec, sort_keys=True, separators=(',', ':'), allow_nan=False)
+
+def spec_hash(spec: dict) -> str:
+    """SHA-256 of the canonical JSON of the spec, in hexadecimal."""
+    return hashlib.sha256(canonical_json(spec).encode()).hexdigest()
@@ -0,0 +1,225 @@
+import itertools
+import json
+import numpy as np
+import os
+import random
+
+
+from .environment import Environment
+from .results import SimulationResults
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pydantic import PositiveInt, validate_call
+from typing import Callable, Literal, Optional, Union
+
+
+class SweepDesign:
+    """
+    Points of a parameter sweep. Each point is a dict of parameter values that run_sweep passes as keyword arguments to the model
+    factory. Build it with one of the designs below. To persist the sweep, the values must be JSON values (numbers, strings, booleans),
+    e.g. the name of a queue discipline rather than the discipline itself.
+    """
+    def __init__(self, points: list):
+        self.points = points
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    @staticmethod
+    @validate_call
+    def grid(**parameters: list):
+        """
+        Every combination of the given values (full factorial), the last parameter varying fastest.
+
+        Parameters
+        ----------
+        **parameters : list - Required
+            The values of each parameter, e.g. arrival_rate=[1, 2, 3], discipline=['fcfs', 'lcfs'].
+        """
+        names = list(parameters.keys())
+
+        return SweepDesign([dict(zip(names, values)) for values in itertools.product(*parameters.values())])
+
+    @staticmethod
+    @validate_call
+    def latin_hypercube(number_of_points: PositiveInt, seed: Optional[int] = None, **parameters: Union[tuple[float, float], list]):
+        """
+        Latin hypercube sample: the range of each parameter is split in `number_of_points` strata of equal probability and every stratum
+        is sampled exactly once, in an independent random order per parameter, so few points still cover every range evenly.
+
+        Parameters
+        ----------
+        number_of_points : int - Required
+            The number of points of the design.
+
+        seed : int - Optional
+            Seed of the sample. If not provided, the design changes from call to call.
+
+        **parameters : tuple | list - Required
+            A (low, high) tuple samples the parameter uniformly in that interval; a list samples one of its values, each one taking the
+            same share of the strata, e.g. service_time=(0.5, 0.9), discipline=['fcfs', 'lcfs'].
+        """
+        rng = np.random.default_rng(seed)
+        columns = {}
+
+        for name, values in parameters.items():
+            strata = (rng.permutation(number_of_points) + rng.random(number_of_points)) / number_of_points
+
+            if isinstance(values, tuple):
+                columns[name] = [float(values[0] + stratum * (values[1] - values[0])) for stratum in strata]
+            else:
+                columns[name] = [values[int(stratum * len(values))] for stratum in strata]
+
+        return SweepDesign([{name: column[point] for name, column in columns.items()} for point in range(number_of_points)])
+
+
+class SweepResults:
+    """
+    Columnar table of a sweep, one row per point in the order of the design: the 'point' index, the 'seed' of its run, one column per
+    parameter and one per metric. Environment metrics keep their names (see EnvironmentResults), server and priority metrics are
+    prefixed with 'server_<id>_' and 'priority_<priority>_'. A metric missing from a point (e.g. a server its model doesn't have) is NaN.
+    """
+    def __init__(self, rows: list, parameters: list):
+        rows = sorted(rows, key=lambda row: row['point'])
+        metrics = list(dict.fromkeys(metric for row in rows for metric in row['metrics']))
+
+        self.parameters = parameters
+        self.metrics = metrics
+        self.columns = {'point': np.array([row['point'] for row in rows], dtype=int), 'seed': np.array([row['seed'] for row in rows], dtype=object)}
+
+        for name in parameters:
+            self.columns[name] = np.array([row['parameters'][name] for row in rows])
+        for name in metrics:
+            self.columns[name] = np.array([row['metrics'].get(name, np.nan) for row in rows], dtype=float)
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.columns[column]
+
+    def __len__(self) -> int:
+        return len(self.columns['point'])
+
+
+def _flatten_metrics(results: SimulationResults) -> dict:
+    metrics = {name: float(value) for name, value in vars(results.get_environment_results()).items()}
+
+    for server_id, server in enumerate(results.get_server_results()):
+        metrics.update({f'server_{server_id}_{name}': float(value) for name, value in vars(server).items()})
+    for priority, metrics_of_priority in sorted(results.get_priority_results().items()):
+        metrics.update({f'priority_{priority}_{name}': float(value) for name, value in vars(metrics_of_priority).items()})
+
+    return metrics
+
+def _simulate_point(model: Callable[..., Environment], parameters: dict, time_in_seconds: float, warmup_time: Union[float, Literal['auto']], seed: int, event_list: str, engine: str) -> dict:
+    # Only the flattened metrics go back to the parent process, not the whole results
+    return _flatten_metrics(model(**parameters).simulate(time_in_seconds, warmup_time, event_list=event_list, seed=seed, engine=engine))
+
+def _load_rows(path: str, points: list, settings: dict) -> list:
+    """
+    Rows already written to `path` by an interrupted run of the same sweep, i.e. the same points run with the same settings. A last line
+    cut in the middle of its write is dropped.
+    """
+    if not os.path.exists(path):
+        return []
+
+    with open(path) as file:
+        lines = file.read().splitlines()
+
+    rows = []
+
+    for line_number, line in enumerate(lines):
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            if line_number != len(lines) - 1:
+                raise ValueError(f'Line {line_number + 1} of {path} is not a sweep result.')
+
+            with open(path, 'w') as file:
+                file.writelines(f'{line}\n' for line in lines[:-1])
+            break
+
+        if row['point'] >= len(points) or row['parameters'] != json.loads(json.dumps(points[row['point']])):
+            raise ValueError(f'{path} was written by a different sweep: point {row["point"]} has other parameters.')
+        if row.get('settings') != settings:
+            raise ValueError(f'{path} was written by a different sweep: point {row["point"]} was run with other settings ({row.get("settings")}).')
+
+        rows.append(row)
+
+    return rows
+
+@validate_call(config=dict(arbitrary_types_allowed=True))
+def run_sweep(model: Callable[..., Environment], design: SweepDesign, time_in_seconds: float, warmup_time: Union[float, Literal['auto']], workers: Optional[PositiveInt] = None, seed: Optional[int] = None, path: Optional[str] = None, event_list: Literal['heap', 'calendar'] = 'heap', engine: Literal['auto', 'event', 'lindley', 'feed_forward'] = 'auto') -> SweepResults:
+    """
+    Simulates the model at every point of the design, in parallel processes, and returns the metrics of all points as a table.
+
+    Parameters
+    ----------
+    model : Callable - Required
+        Called with the parameters of a point as keyword arguments, returns the Environment to simulate. It runs in the worker processes,
+        so it must be picklable: a module-level function (or a functools.partial of one), not a lambda.
+
+    design : SweepDesign - Required
+        The points of the sweep, e.g. SweepDesign.grid(arrival_rate=[1, 2], discipline=['fcfs', 'lcfs']).
+
+    time_in_seconds : float - Required
+        The simulation time of each point, excluding the warm-up period.
+
+    warmup_time : float | str - Required
+        The warm-up period of each point, or 'auto' (see Environment.simulate).
+
+    workers : int - Optional
+        The number of worker processes. If not provided, one per CPU. With 1, the points run one after the other in this process.
+
+    seed : int - Optional
+        Seed from which the 64-bit seed of every point is generated with NumPy's SeedSequence, by its position in the design. With the
+        same seed, a point always gets the same run, whatever the number of workers and even across a resumed sweep. If not provided, it
+        is drawn from the random module.
+
+    path : str - Optional
+        JSON Lines file where each point is appended as soon as it finishes. If the file already has points of the same design (from an
+        interrupted run), they are loaded and only the missing points are simulated. Each row also records the run settings
+        (time_in_seconds, warmup_time, event_list, engine and seed), and resuming with other settings raises a ValueError: pass the same
+        seed to resume a sweep.
+
+    event_list : str - Optional
+        The event list of each point (see Environment.simulate).
+
+    engine : str - Optional
+        The engine of each point (see Environment.simulate).
+
+    Returns
+    -------
+    SweepResults
+        One row per point of the design, with its parameters and metrics.
+    """
+    if seed is None:
+        seed = random.getrandbits(128)
+
+    seeds = [int(point_seed) for point_seed in np.random.SeedSequence(seed).generate_state(len(design), np.uint64)]
+    settings = {'time_in_seconds': time_in_seconds, 'warmup_time': warmup_time, 'event_list': event_list, 'engine': engine, 'seed': seed}
+    rows = _load_rows(path, design.points, settings) if path is not None else []
+    done = {row['point'] for row in rows}
+    pending = [point for point in range(len(design)) if point not in done]
+    output = open(path, 'a') if path is not None else None
+
+    def add_row(point: int, metrics: dict):
+        row = {'point': point, 'seed': seeds[point], 'parameters': design.points[point], 'settings': settings, 'metrics': metrics}
+        rows.append(row)
+
+        if output is not None:
+            output.write(json.dumps(row) + '\n')
+            output.flush()
+
+    try:
+        if workers == 1:
+            for point in pending:
+                add_row(point, _simulate_point(model, design.points[point], time_in_seconds, warmup_time, seeds[point], event_list, engine))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(_simulate_point, model, design.points[point], time_in_seconds, warmup_time, seeds[point], event_list, engine): point for point in pending}
+
+                for future in as_completed(futures):
+                    add_row(futures[future], future.result())
+    finally:
+        if output is not None:
+            output.close()
+
+    return SweepResults(rows, list(design.points[0].keys()) if design.points else [])
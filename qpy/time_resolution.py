@@ -0,0 +1,73 @@
+import math, numpy as np
+
+
+from typing import Optional
+
+
+DEFAULT_TIME_RESOLUTION = 0.0001
+FLOAT_MODE_MIN_DURATION = 1e-12
+FLOAT_MODE_CALENDAR_TICK = 1e-9
+MIN_REPORTING_DIGITS = 4
+
+
+def _decimal_places(tick: float) -> Optional[int]:
+    digits = -math.log10(tick)
+
+    if digits >= 0 and math.isclose(digits, round(digits)) and round(tick, round(digits)) == tick:
+        return round(digits)
+
+class TimeResolution:
+    """
+    Granularity of the simulated clock.
+
+    With a tick, every event time and every sampled duration is snapped to an integer number of ticks and durations are at least one
+    tick long. Without a tick (float mode) times keep full float precision and the engine never rounds them.
+    """
+    def __init__(self, tick: Optional[float] = DEFAULT_TIME_RESOLUTION):
+        if tick is not None and tick <= 0:
+            raise ValueError('Time resolution must be greater than zero.')
+
+        self.tick = tick
+        self._digits = _decimal_places(tick) if tick is not None else None
+
+    def is_float_mode(self) -> bool:
+        return self.tick is None
+
+    def quantize(self, time: float) -> float:
+        if self.tick is None:
+            return time
+        if self._digits is not None:
+            return round(time, self._digits)
+
+        return round(time / self.tick) * self.tick
+
+    def duration(self, sample: float) -> float:
+        if self.tick is None:
+            return sample if sample > 0 else FLOAT_MODE_MIN_DURATION
+
+        return max(self.quantize(sample), self.tick)
+
+    def durations_to_units(self, samples: np.ndarray) -> np.ndarray:
+        if self.tick is None:
+            return np.where(samples > 0, samples, FLOAT_MODE_MIN_DURATION)
+
+        return np.maximum(np.rint(samples / self.tick), 1).astype(np.int64)
+
+    def units_to_times(self, units: np.ndarray) -> np.ndarray:
+        if self.tick is None:
+            return units
+        if self._digits is not None:
+            return np.round(units * self.tick, self._digits)
+
+        return units * self.tick
+
+    def calendar_tick(self) -> float:
+        return self.tick if self.tick is not None else FLOAT_MODE_CALENDAR_TICK
+
+    def round_result(self, value: float) -> float:
+        if self.tick is None:
+            return value
+
+        return round(value, max(MIN_REPORTING_DIGITS, self._digits or math.ceil(-math.log10(self.tick))))
+
+DEFAULT_RESOLUTION = TimeResolution()
@@ -0,0 +1,89 @@
+from .job import Job
+from collections import deque
+from pydantic import PositiveInt, validate_call
+from typing import Callable, NamedTuple, Optional
+
+
+class JobRecord(NamedTuple):
+    id: int
+    priority: int
+    arrival_time: float
+    departure_time: float
+    queue_time: float
+
+class JobTrace:
+    """
+    Opt-in record of the jobs that leave the system during the measured period. Each departure is stored as an immutable JobRecord, so
+    the trace never keeps the jobs themselves alive. Build it with one of the policies below and pass it to Environment.simulate().
+    """
+    def __init__(self, every: int = 1, maximum_number_of_jobs: Optional[int] = None, sink: Optional[Callable[[JobRecord], None]] = None):
+        self.every = every
+        self.sink = sink
+        self._records = deque(maxlen=maximum_number_of_jobs)
+        self._departures = 0
+
+    @staticmethod
+    @validate_call
+    def last(number_of_jobs: PositiveInt):
+        """
+        Keeps the last `number_of_jobs` departed jobs in a ring buffer.
+
+        Parameters
+        ----------
+        number_of_jobs : int - Required
+            Size of the ring buffer.
+        """
+        return JobTrace(maximum_number_of_jobs=number_of_jobs)
+
+    @staticmethod
+    @validate_call
+    def sample(every: PositiveInt, maximum_number_of_jobs: Optional[PositiveInt] = None):
+        """
+        Keeps one of every `every` departed jobs (the 1st, the (every+1)th, ...).
+
+        Parameters
+        ----------
+        every : int - Required
+            Sampling interval, in departures.
+
+        maximum_number_of_jobs : int - Optional
+            Keeps only the most recent sampled jobs. Without it the trace grows by one record every `every` departures.
+        """
+        return JobTrace(every, maximum_number_of_jobs)
+
+    @staticmethod
+    @validate_call
+    def sink(callback: Callable[[JobRecord], None]):
+        """
+        Hands every departed job to `callback` (e.g. to write it to a file) and keeps nothing in memory.
+
+        Parameters
+        ----------
+        callback : Callable - Required
+            Called with the JobRecord of each departure, in departure order.
+        """
+        return JobTrace(maximum_number_of_jobs=0, sink=callback)
+
+    def record(self, job: Job, departure_time: float):
+        departure = self._departures
+        self._departures += 1
+
+        if departure % self.every != 0:
+            return
+
+        record = JobRecord(job.id, job.priority, job.arrival_time, departure_time, job.total_queue_time)
+
+        if self.sink is not None:
+            self.sink(record)
+        else:
+            self._records.append(record)
+
+    @property
+    def records(self) -> tuple:
+        return tuple(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self):
+        return iter(self._records)
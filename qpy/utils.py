@@ -1,50 +1,15 @@
-import random
-import heapq
-
-
-from .distribution import IDistribution
-from .event import Event
+from .event import Event, EventType
 from .job import Job
-from .validation_utils import validate_object_params_not_none
-from collections import defaultdict
+from .plan import EntryPointPlan, TerminalPlan
+from .time_resolution import DEFAULT_RESOLUTION, TimeResolution
 from typing import Optional
 
 
 def _randomize_priority(priorities):
   if priorities:
-    return randomly_draw_from_dictionary(priorities)
+    return priorities.draw()
   return 0
 
-def randomly_draw_from_dictionary(probabilities):
-  validate_object_params_not_none(function_name='randomly_draw_from_dictionary', probabilities=probabilities)
-
-  probability = random.random()
-  probability_sum = 0
-
-  for possible_value in probabilities.keys():
-    probability_sum += probabilities[possible_value]
-
-    if probability <= probability_sum:
-        return possible_value
-
-def transform_input_closed_network(input):
-  validate_object_params_not_none(function_name='transform_input_closed_network', input=input)
-
-  if 'end' not in input:
-    return input
-  
-  if input['end'] == 1:
-    raise ValueError('Closed network need to have at least one route from terminals')
-
-  margin = 1 - input['end']
-
-  new_dict = defaultdict(lambda: 0)
-  for key in input.keys():
-    if key != 'end':
-      new_dict[key] = round(input[key] / margin, 4)
-
-  return new_dict
-
 def validate_priority_input(input, with_priority = True):
   if not input or not with_priority:
     return
@@ -66,30 +31,31 @@ def validate_priority_input(input, with_priority = True):
     raise ValueError("Wrong priority distribution. Input has to be dictionary containing integer (priority) as keys and double (probability) as value. Higher piorities will be executed first.")
 
 
-def generate_new_job_closed_network(queue: list, event_count: int, time: float, think_time_distribution: IDistribution, routing_probabilities: dict, priorities: Optional[dict] = None):
-  routing = 'end'
-  think_time = 0
+def generate_new_job_closed_network(event_count: int, time: float, terminals: TerminalPlan, checked: bool = True, time_resolution: TimeResolution = DEFAULT_RESOLUTION, finished_event: Optional[Event] = None) -> tuple:
+  # compile_terminals folds the 'end' route into the other destinations, so a terminal always takes one think time and one routing draw
+  think_time = time_resolution.duration(terminals.sample_think_time())
+  routing = terminals.routing.draw()
+
+  arrival_time = time_resolution.quantize(time + think_time)
+  priority = _randomize_priority(terminals.priorities)
 
-  while routing == 'end':
-    think_time += think_time_distribution.sample()
-    routing = randomly_draw_from_dictionary(routing_probabilities)
+  if finished_event is None:
+    return (arrival_time, event_count, Event(arrival_time, event_count, EventType.ARRIVAL, Job(event_count, arrival_time, routing, priority, checked), routing))
 
-  new_job = Job(event_count, round(time + think_time, 4), routing, _randomize_priority(priorities))
+  # The population of a closed network is fixed, so the job that just left (and its departure event) becomes the terminal's next job
+  finished_event.job.restart(event_count, arrival_time, routing, priority)
+  finished_event.restart(arrival_time, event_count, EventType.ARRIVAL, finished_event.job, routing)
 
-  heapq.heappush(queue, (round(time + think_time, 4), event_count, Event(round(time + think_time, 4), event_count, 'arrival', new_job, routing)))
-  event_count += 1
+  return (arrival_time, event_count, finished_event)
     
 
-def generate_arrivals(queue: list, event_count: int, delta: float, server: int, arrival_distribution: IDistribution, priorities: Optional[dict] = None):
-  time = 0
+def generate_next_arrival(event_count: int, time: float, time_limit: float, entry_point: int, entry_point_plan: EntryPointPlan, checked: bool = True, time_resolution: TimeResolution = DEFAULT_RESOLUTION) -> Optional[tuple]:
+  new_arrival_time = time_resolution.quantize(time + time_resolution.duration(entry_point_plan.sample_arrival()))
 
-  while time < delta:
-      new_arrival_time = round((time + arrival_distribution.sample()), 4)
+  if new_arrival_time >= time_limit:
+    return
 
-      if new_arrival_time < delta:
-          new_job = Job(event_count, new_arrival_time, server, _randomize_priority(priorities))
-          
-          heapq.heappush(queue, (new_arrival_time, event_count, Event(new_arrival_time, event_count, 'arrival', new_job, server)))
+  server = entry_point_plan.server_id
+  new_job = Job(event_count, new_arrival_time, server, _randomize_priority(entry_point_plan.priorities), checked)
 
-      time = new_arrival_time
-      event_count += 1
\ No newline at end of file
+  return (new_arrival_time, event_count, Event(new_arrival_time, event_count, EventType.ARRIVAL, new_job, server, entry_point))
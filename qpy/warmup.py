@@ -0,0 +1,76 @@
+import numpy as np
+
+
+MSER_BATCH_SIZE = 5
+MSER_MINIMUM_BATCHES = 40
+MSER_CHECK_GROWTH = 1.1
+
+
+def mser_truncation(batch_means) -> int:
+    """
+    Marginal Standard Error Rule: returns the number d of leading batches whose removal minimizes sum((Z[i] - mean)^2) / (n - d)^2 over
+    the remaining batch means Z, i.e. the squared standard error of their mean. At least two batches are always kept.
+    """
+    means = np.asarray(batch_means, dtype=float)
+    means = means - means.mean()
+    kept = np.arange(len(means), 1, -1)
+    sums = np.cumsum(means[::-1])[::-1][:-1]
+    squares = np.cumsum((means ** 2)[::-1])[::-1][:-1]
+
+    return int(np.argmin((squares - sums ** 2 / kept) / kept ** 2))
+
+class MSERWarmupDetector:
+    """
+    Finds the end of the initial transient with MSER-5 while the simulation runs. The response time of every job leaving the system and
+    the number of jobs it leaves behind are averaged in batches of 5 departures. Every time the number of batches grows by 10% the MSER
+    truncation of both series is recomputed, and the transient is over once both truncations fall in the first half of the batches
+    (a truncation in the second half means the series is still drifting). The truncation point, i.e. the time of the last departure of
+    the truncated batches, is kept in truncation_time.
+    """
+    def __init__(self):
+        self.jobs_in_system = 0
+        self.truncated_batches = None
+        self.truncation_time = None
+        self.response_time_means = []
+        self.jobs_in_system_means = []
+        self.batch_end_times = []
+        self._response_time_sum = 0.0
+        self._jobs_in_system_sum = 0
+        self._departures = 0
+        self._next_check = MSER_MINIMUM_BATCHES
+
+    def compute_arrival(self):
+        self.jobs_in_system += 1
+
+    def compute_departure(self, response_time: float, departure_time: float) -> bool:
+        """Records a job leaving the system at `departure_time`. Returns True once the transient is over."""
+        self.jobs_in_system -= 1
+        self._response_time_sum += response_time
+        self._jobs_in_system_sum += self.jobs_in_system
+        self._departures += 1
+
+        if self._departures < MSER_BATCH_SIZE:
+            return False
+
+        self.response_time_means.append(self._response_time_sum / MSER_BATCH_SIZE)
+        self.jobs_in_system_means.append(self._jobs_in_system_sum / MSER_BATCH_SIZE)
+        self.batch_end_times.append(departure_time)
+        self._response_time_sum = 0.0
+        self._jobs_in_system_sum = 0
+        self._departures = 0
+
+        number_of_batches = len(self.response_time_means)
+
+        if number_of_batches < self._next_check:
+            return False
+
+        truncation = max(mser_truncation(self.response_time_means), mser_truncation(self.jobs_in_system_means))
+
+        if 2 * truncation <= number_of_batches:
+            self.truncated_batches = truncation
+            self.truncation_time = self.batch_end_times[truncation - 1] if truncation > 0 else 0.0
+            return True
+
+        self._next_check = int(number_of_batches * MSER_CHECK_GROWTH) + 1
+
+        return False
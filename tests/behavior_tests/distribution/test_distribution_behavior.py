@@ -1,4 +1,8 @@
-from qpy.distribution import Distribution
+import random
+
+
+from qpy.distribution import SAMPLE_BLOCK_SIZE, Distribution, IDistribution
+from qpy.environment import Environment
 
 
 DELTA_PERCENTAGE = 0.05 # 5% margin of error
@@ -9,6 +13,7 @@ LOWER_BOUND_UNIFORM = 0
 UPPER_BOUND_UNIFORM = 4
 MU_NORMAL = 10
 SIGMA_NORMAL = 2
+SEED = 42
 
 
 def value_within_range(expected: float, actual: float, delta: float):
@@ -60,4 +65,62 @@ def test_normal_distribution_samples():
     for _ in range(NUMBER_OF_EXECUTIONS):
         sample_sum += distribution.sample()
     
-    assert value_within_range(MU_NORMAL, sample_sum / NUMBER_OF_EXECUTIONS, DELTA_PERCENTAGE)
\ No newline at end of file
+    assert value_within_range(MU_NORMAL, sample_sum / NUMBER_OF_EXECUTIONS, DELTA_PERCENTAGE)
+def test_exponential_distribution_sample_many():
+    distribution = Distribution.exponential(lambda_value=LAMBDA_VALUE_EXPONENTIAL)
+
+    samples = distribution.sample_many(NUMBER_OF_EXECUTIONS)
+
+    assert len(samples) == NUMBER_OF_EXECUTIONS
+    assert value_within_range(LAMBDA_VALUE_EXPONENTIAL, samples.mean(), DELTA_PERCENTAGE)
+
+def test_normal_distribution_sample_many_should_not_return_negative_values():
+    distribution = Distribution.normal(mu=0, sigma=SIGMA_NORMAL)
+
+    assert distribution.sample_many(NUMBER_OF_EXECUTIONS).min() >= 0
+
+def test_distribution_samples_should_be_python_floats():
+    distribution = Distribution.uniform(lower_bound=LOWER_BOUND_UNIFORM, upper_bound=UPPER_BOUND_UNIFORM)
+
+    assert type(distribution.sample()) is float
+
+def test_distribution_samples_should_be_reproducible_with_random_seed():
+    def draw_after_seed():
+        random.seed(SEED)
+        distribution = Distribution.exponential(lambda_value=LAMBDA_VALUE_EXPONENTIAL)
+
+        return [distribution.sample() for _ in range(SAMPLE_BLOCK_SIZE + 1)]
+
+    assert draw_after_seed() == draw_after_seed()
+
+def test_distribution_reset_should_discard_buffered_samples():
+    distribution = Distribution.exponential(lambda_value=LAMBDA_VALUE_EXPONENTIAL)
+
+    random.seed(SEED)
+    first_sample = distribution.sample()
+
+    random.seed(SEED)
+    distribution.reset()
+
+    assert distribution.sample() == first_sample
+
+class CustomConstantDistribution(IDistribution):
+    def sample(self) -> float:
+        return CONSTANT_VALUE
+
+def test_custom_distribution_with_only_sample_should_fill_blocks_from_it():
+    distribution = CustomConstantDistribution()
+
+    samples = distribution.sample_many(SAMPLE_BLOCK_SIZE + 1)
+
+    assert len(samples) == SAMPLE_BLOCK_SIZE + 1
+    assert (samples == CONSTANT_VALUE).all()
+
+def test_custom_distribution_with_only_sample_should_be_simulated():
+    env = Environment()
+    server = env.add_server(CustomConstantDistribution())
+    env.add_entry_point(server, Distribution.constant(2 * CONSTANT_VALUE))
+
+    results = env.simulate(time_in_seconds=100, warmup_time=0)
+
+    assert results.environment_metrics.get_mean_time_in_system() == CONSTANT_VALUE
@@ -1,15 +1,19 @@
+import gc
 import pytest
-import heapq
+import random
+import warnings
 
 
 from unittest.mock import MagicMock
 from qpy.distribution import Distribution
-from qpy.execution import Execution
-from qpy.event import Event
+from qpy.environment import Environment
+from qpy.execution import COMPACTION_DEAD_EVENT_RATIO, COMPACTION_MIN_QUEUE_SIZE, Execution
+from qpy.event import Event, EventType
 from qpy.job import Job
 from qpy.network import OpenNetwork
 from qpy.results import SimulationResults
 from qpy.queue_discipline import QueueDiscipline
+from qpy.trace import JobTrace
 
 
 TIME = 10
@@ -33,6 +37,10 @@ EVENT_ID = 0
 SERVICE_TIME = 2
 
 PREEMPTION_TIME = 1
+EVENT_LIST_SEED = 7
+MICROSECOND_SERVICE_TIME = 0.000002
+TRACED_JOBS = 10
+CLOSED_NETWORK_TERMINALS = 5
 
 
 @pytest.fixture
@@ -71,18 +79,18 @@ def execution_with_priority_test_object(mock_network_priority):
 def execution_with_round_robin_test_object(mock_network_round_robin):
     queue = []
 
-    return Execution(time=TIME, warmup=WARMUP, queue=queue, network_configuration=mock_network_round_robin, time_unit=TIME_UNIT)
+    return Execution(time=TIME, warmup=WARMUP, queue=queue, network_configuration=mock_network_round_robin, time_unit=TIME_UNIT, trace=JobTrace.last(TRACED_JOBS))
 
 
 """Testando preempção quando caso é prioridade"""
 def test_execute_behavior_when_queue_is_priority(execution_with_priority_test_object, job_test_object_1, job_test_object_2, job_test_object_3):
-    event = Event(JOB_ARRIVAL_TIME, EVENT_ID, 'arrival', job_test_object_1, SERVER_ID)
-    second_event = Event(JOB_ARRIVAL_TIME_2, EVENT_ID + 1, 'arrival', job_test_object_2, SERVER_ID)
-    third_event = Event(JOB_ARRIVAL_TIME_3, EVENT_ID + 2, 'arrival', job_test_object_3, SERVER_ID)
+    event = Event(JOB_ARRIVAL_TIME, EVENT_ID, EventType.ARRIVAL, job_test_object_1, SERVER_ID)
+    second_event = Event(JOB_ARRIVAL_TIME_2, EVENT_ID + 1, EventType.ARRIVAL, job_test_object_2, SERVER_ID)
+    third_event = Event(JOB_ARRIVAL_TIME_3, EVENT_ID + 2, EventType.ARRIVAL, job_test_object_3, SERVER_ID)
 
-    heapq.heappush(execution_with_priority_test_object.event_queue, (JOB_ARRIVAL_TIME, EVENT_ID, event))
-    heapq.heappush(execution_with_priority_test_object.event_queue, (JOB_ARRIVAL_TIME_2, EVENT_ID + 1, second_event))
-    heapq.heappush(execution_with_priority_test_object.event_queue, (JOB_ARRIVAL_TIME_3, EVENT_ID + 2, third_event))
+    execution_with_priority_test_object.event_queue.push((JOB_ARRIVAL_TIME, EVENT_ID, event))
+    execution_with_priority_test_object.event_queue.push((JOB_ARRIVAL_TIME_2, EVENT_ID + 1, second_event))
+    execution_with_priority_test_object.event_queue.push((JOB_ARRIVAL_TIME_3, EVENT_ID + 2, third_event))
 
     results = execution_with_priority_test_object.execute()
 
@@ -94,22 +102,148 @@ def test_execute_behavior_when_queue_is_priority(execution_with_priority_test_ob
 
 """Testando round robin quando há preempção"""
 def test_execute_behavior_when_queue_is_round_robin(execution_with_round_robin_test_object, job_test_object_1, job_test_object_2, job_test_object_3):
-    event = Event(JOB_ARRIVAL_TIME, EVENT_ID, 'arrival', job_test_object_1, SERVER_ID)
-    second_event = Event(JOB_ARRIVAL_TIME_2, EVENT_ID + 1, 'arrival', job_test_object_2, SERVER_ID)
-    third_event = Event(JOB_ARRIVAL_TIME_3, EVENT_ID + 2, 'arrival', job_test_object_3, SERVER_ID)
+    event = Event(JOB_ARRIVAL_TIME, EVENT_ID, EventType.ARRIVAL, job_test_object_1, SERVER_ID)
+    second_event = Event(JOB_ARRIVAL_TIME_2, EVENT_ID + 1, EventType.ARRIVAL, job_test_object_2, SERVER_ID)
+    third_event = Event(JOB_ARRIVAL_TIME_3, EVENT_ID + 2, EventType.ARRIVAL, job_test_object_3, SERVER_ID)
     execution_with_round_robin_test_object.event_count = 3
 
-    heapq.heappush(execution_with_round_robin_test_object.event_queue, (JOB_ARRIVAL_TIME, EVENT_ID, event))
-    heapq.heappush(execution_with_round_robin_test_object.event_queue, (JOB_ARRIVAL_TIME_2, EVENT_ID + 1, second_event))
-    heapq.heappush(execution_with_round_robin_test_object.event_queue, (JOB_ARRIVAL_TIME_3, EVENT_ID + 2, third_event))
+    execution_with_round_robin_test_object.event_queue.push((JOB_ARRIVAL_TIME, EVENT_ID, event))
+    execution_with_round_robin_test_object.event_queue.push((JOB_ARRIVAL_TIME_2, EVENT_ID + 1, second_event))
+    execution_with_round_robin_test_object.event_queue.push((JOB_ARRIVAL_TIME_3, EVENT_ID + 2, third_event))
 
     results = execution_with_round_robin_test_object.execute()
 
-    assert results.jobs[JOB_ID].queue_times_per_server[SERVER_ID] == 2
-    assert results.jobs[JOB_ID].total_time_per_server[SERVER_ID] == 4
+    assert results.jobs[JOB_ID].queue_time == 2
+    assert results.jobs[JOB_ID_2].queue_time == 2.5
+    assert results.jobs[JOB_ID_3].queue_time == 3
 
-    assert results.jobs[JOB_ID_2].queue_times_per_server[SERVER_ID] == 2.5
-    assert results.jobs[JOB_ID_2].total_time_per_server[SERVER_ID] == 4.5
+    assert results.server_metrics[SERVER_ID].cumulative_queue_times == 2 + 2.5 + 3
+    assert results.server_metrics[SERVER_ID].cumulative_time_in_server == 4 + 4.5 + 5
 
-    assert results.jobs[JOB_ID_3].queue_times_per_server[SERVER_ID] == 3
-    assert results.jobs[JOB_ID_3].total_time_per_server[SERVER_ID] == 5
\ No newline at end of file
+"""Testando que eventos cancelados por preempção não se acumulam na fila de eventos"""
+def test_execute_behavior_when_srt_with_preemption_is_overloaded_should_keep_dead_events_bounded():
+    network = OpenNetwork()
+    network.add_server(Distribution.exponential(1), QueueDiscipline.srt(with_preemption=True))
+    network.add_entry_point(SERVER_ID, Distribution.exponential(0.8))
+
+    execution = Execution(time=2000, warmup=WARMUP, queue=network.generate_jobs(2000), network_configuration=network, time_unit=TIME_UNIT)
+    results = execution.execute()
+
+    assert results.event_list_statistics.canceled_events > 0
+    assert execution.dead_events <= max(COMPACTION_MIN_QUEUE_SIZE, COMPACTION_DEAD_EVENT_RATIO * len(execution.event_queue))
+def simulate_seeded_network(seed: int = EVENT_LIST_SEED, **simulate_options) -> SimulationResults:
+    env = Environment()
+    first = env.add_server(Distribution.exponential(1), QueueDiscipline.srt(with_preemption=True))
+    second = env.add_server(Distribution.uniform(0.5, 1.5), QueueDiscipline.round_robin(preemption_time=PREEMPTION_TIME))
+    env.add_entry_point(first, Distribution.exponential(1.5))
+    env.add_servers_connection(first, second, 0.5)
+
+    return env.simulate(time_in_seconds=2000, warmup_time=100, seed=seed, **simulate_options)
+
+"""Testando que a fila calendário produz exatamente a mesma simulação que o heap"""
+def test_simulate_behavior_when_event_list_is_calendar_should_match_heap():
+    heap_results = simulate_seeded_network(event_list='heap')
+    calendar_results = simulate_seeded_network(event_list='calendar')
+
+    assert calendar_results.environment_metrics.get_number_of_processed_jobs() == heap_results.environment_metrics.get_number_of_processed_jobs()
+    assert calendar_results.environment_metrics.get_mean_time_in_system() == heap_results.environment_metrics.get_mean_time_in_system()
+    assert calendar_results.server_metrics[1].get_mean_queue_time() == heap_results.server_metrics[1].get_mean_queue_time()
+
+"""Testando que o modo debug, com validações a cada evento, produz a mesma simulação que o caminho rápido"""
+def test_simulate_behavior_when_debug_is_enabled_should_match_fast_path():
+    fast_results = simulate_seeded_network()
+    debug_results = simulate_seeded_network(debug=True)
+
+    assert debug_results.environment_metrics.get_number_of_processed_jobs() == fast_results.environment_metrics.get_number_of_processed_jobs()
+    assert debug_results.environment_metrics.get_mean_time_in_system() == fast_results.environment_metrics.get_mean_time_in_system()
+    assert debug_results.server_metrics[0].get_mean_queue_time() == fast_results.server_metrics[0].get_mean_queue_time()
+
+"""Testando que o modo float preserva tempos menores que a resolução padrão"""
+def test_simulate_behavior_when_time_resolution_is_none_should_keep_microsecond_service_times():
+    env = Environment(time_unit='seconds', time_resolution=None)
+    server = env.add_server(Distribution.constant(MICROSECOND_SERVICE_TIME))
+    env.add_entry_point(server, Distribution.constant(4 * MICROSECOND_SERVICE_TIME))
+
+    results = env.simulate(time_in_seconds=0.01, warmup_time=0)
+
+    assert results.environment_metrics.get_mean_time_in_system() == pytest.approx(MICROSECOND_SERVICE_TIME)
+
+"""Testando que a mesma semente reproduz a simulação e sementes diferentes não"""
+def test_simulate_behavior_when_seed_is_provided_should_be_reproducible():
+    first_results = simulate_seeded_network(seed=EVENT_LIST_SEED)
+    second_results = simulate_seeded_network(seed=EVENT_LIST_SEED)
+    other_results = simulate_seeded_network(seed=EVENT_LIST_SEED + 1)
+
+    assert second_results.environment_metrics.get_mean_time_in_system() == first_results.environment_metrics.get_mean_time_in_system()
+    assert second_results.server_metrics[1].get_number_of_processed_jobs() == first_results.server_metrics[1].get_number_of_processed_jobs()
+    assert other_results.environment_metrics.get_mean_time_in_system() != first_results.environment_metrics.get_mean_time_in_system()
+
+"""Testando que a semente não depende do estado global do módulo random"""
+def test_simulate_behavior_when_seed_is_provided_should_ignore_global_random_state():
+    random.seed(EVENT_LIST_SEED)
+    first_results = simulate_seeded_network()
+
+    random.seed(EVENT_LIST_SEED + 1)
+    second_results = simulate_seeded_network()
+
+    assert second_results.environment_metrics.get_mean_time_in_system() == first_results.environment_metrics.get_mean_time_in_system()
+
+"""Testando que desligar o coletor de lixo não altera a simulação e que ele é religado ao final"""
+def test_simulate_behavior_when_gc_is_disabled_should_match_and_restore_collector():
+    enabled_results = simulate_seeded_network()
+    disabled_results = simulate_seeded_network(disable_gc=True)
+
+    assert gc.isenabled()
+    assert disabled_results.environment_metrics.get_mean_time_in_system() == enabled_results.environment_metrics.get_mean_time_in_system()
+
+"""Testando que a preempção do round robin numa rede fechada não cria jobs além dos terminais"""
+def test_simulate_behavior_when_closed_network_uses_round_robin_should_keep_population():
+    env = Environment(number_of_terminals=CLOSED_NETWORK_TERMINALS, think_time_distribution=Distribution.exponential(1))
+    env.add_server(Distribution.exponential(2), QueueDiscipline.round_robin(preemption_time=PREEMPTION_TIME / 4))
+    env.add_terminals_routing_probability(0, 1)
+
+    departed_jobs = []
+
+    results = env.simulate(time_in_seconds=500, warmup_time=0, seed=EVENT_LIST_SEED, trace=JobTrace.sink(departed_jobs.append))
+
+    assert len({record.id for record in departed_jobs}) == len(departed_jobs) == results.environment_metrics.get_number_of_processed_jobs()
+    assert results.environment_metrics.current_number_of_jobs <= CLOSED_NETWORK_TERMINALS
+
+"""Testando que o warm-up automático descarta o transiente e mede o tempo pedido a partir dele"""
+def test_simulate_behavior_when_warmup_is_auto_should_measure_after_detected_transient():
+    env = Environment()
+    env.add_server(Distribution.exponential(1))
+    env.add_entry_point(0, Distribution.exponential(1 / 0.9))
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        results = env.simulate(time_in_seconds=20000, warmup_time='auto', seed=EVENT_LIST_SEED)
+
+    assert 0 < results.warmup_time < 20000
+    assert 0 <= results.warmup_truncation_time <= results.warmup_time
+    assert results.environment_metrics.get_mean_time_in_system() == pytest.approx(10, rel=0.2)
+
+"""Testando que o warm-up automático de um sistema instável é limitado ao tempo simulado"""
+def test_simulate_behavior_when_warmup_is_auto_and_system_is_unstable_should_warn():
+    env = Environment()
+    env.add_server(Distribution.exponential(1))
+    env.add_entry_point(0, Distribution.exponential(1 / 1.2))
+
+    with pytest.warns(RuntimeWarning):
+        results = env.simulate(time_in_seconds=500, warmup_time='auto', seed=EVENT_LIST_SEED)
+
+    assert results.warmup_time == 500
+
+"""Testando que um job roteado para um servidor com preempção não deixa para trás a partida do job preemptado"""
+def test_simulate_behavior_when_job_is_routed_to_preemptive_server_should_depart_once():
+    env = Environment()
+    first = env.add_server(Distribution.exponential(0.5))
+    second = env.add_server(Distribution.exponential(1), QueueDiscipline.srt(with_preemption=True))
+    env.add_entry_point(first, Distribution.exponential(1 / 0.8))
+    env.add_servers_connection(first, second, 1)
+
+    departed_jobs = []
+    env.simulate(time_in_seconds=2000, warmup_time=0, seed=EVENT_LIST_SEED, trace=JobTrace.sink(lambda record: departed_jobs.append(record.id)))
+
+    assert len(departed_jobs) > 0
+    assert len(departed_jobs) == len(set(departed_jobs))
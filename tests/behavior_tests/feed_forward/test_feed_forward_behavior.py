@@ -0,0 +1,77 @@
+import pytest
+
+from qpy.distribution import Distribution
+from qpy.environment import Environment
+from qpy.queue_discipline import QueueDiscipline
+
+
+SEED = 5
+SIMULATION_TIME = 2000
+WARMUP_TIME = 200
+
+
+def build_tandem(time_resolution) -> Environment:
+    env = Environment(time_resolution=time_resolution)
+
+    for mean in (0.6, 0.7, 0.5):
+        env.add_server(Distribution.exponential(mean), QueueDiscipline.fcfs())
+
+    env.add_servers_connection(0, 1, 1)
+    env.add_servers_connection(1, 2, 1)
+    env.add_entry_point(0, Distribution.exponential(1))
+
+    return env
+
+def build_fork_join(time_resolution) -> Environment:
+    env = Environment(time_resolution=time_resolution)
+
+    env.add_server(Distribution.exponential(0.4), QueueDiscipline.fcfs())
+    env.add_server(Distribution.uniform(0.5, 1.5), QueueDiscipline.fcfs())
+    env.add_server(Distribution.exponential(1.2), QueueDiscipline.fcfs())
+    env.add_server(Distribution.normal(0.5, 0.1), QueueDiscipline.fcfs())
+
+    env.add_servers_connection(0, 1, 0.5)
+    env.add_servers_connection(0, 2, 0.3)
+    env.add_servers_connection(1, 3, 1)
+    env.add_servers_connection(2, 3, 0.5)
+    env.add_entry_point(0, Distribution.exponential(1.5))
+    env.add_entry_point(2, Distribution.exponential(4))
+
+    return env
+
+def assert_same_results(event_results, feed_forward_results):
+    for event_metrics, feed_forward_metrics in ((event_results.environment_metrics, feed_forward_results.environment_metrics), (event_results.priority_metrics[0], feed_forward_results.priority_metrics[0])):
+        assert feed_forward_metrics.get_number_of_processed_jobs() == event_metrics.get_number_of_processed_jobs()
+        assert feed_forward_metrics.get_mean_time_in_system() == pytest.approx(event_metrics.get_mean_time_in_system())
+        assert feed_forward_metrics.get_mean_queue_time() == pytest.approx(event_metrics.get_mean_queue_time())
+
+    assert feed_forward_results.environment_metrics.get_mean_number_of_jobs_in_system() == pytest.approx(event_results.environment_metrics.get_mean_number_of_jobs_in_system())
+
+    for event_server, feed_forward_server in zip(event_results.server_metrics, feed_forward_results.server_metrics):
+        assert feed_forward_server.get_number_of_processed_jobs() == event_server.get_number_of_processed_jobs()
+        assert feed_forward_server.get_mean_time_in_server() == pytest.approx(event_server.get_mean_time_in_server())
+        assert feed_forward_server.get_mean_visits_per_job() == pytest.approx(event_server.get_mean_visits_per_job())
+        assert feed_forward_server.get_server_utilization() == pytest.approx(event_server.get_server_utilization())
+        assert feed_forward_server.get_mean_number_of_jobs_in_system() == pytest.approx(event_server.get_mean_number_of_jobs_in_system())
+
+def simulate(build, time_resolution, engine: str):
+    return build(time_resolution).simulate(time_in_seconds=SIMULATION_TIME, warmup_time=WARMUP_TIME, seed=SEED, engine=engine)
+
+"""Testando que o motor feed-forward reproduz o motor de eventos numa rede em série em modo float"""
+def test_feed_forward_when_network_is_tandem_should_match_event_engine():
+    assert_same_results(simulate(build_tandem, None, 'event'), simulate(build_tandem, None, 'feed_forward'))
+
+"""Testando que o motor feed-forward reproduz o motor de eventos numa rede com bifurcação e junção em modo float"""
+def test_feed_forward_when_network_forks_and_joins_should_match_event_engine():
+    assert_same_results(simulate(build_fork_join, None, 'event'), simulate(build_fork_join, None, 'feed_forward'))
+
+"""Testando que o modo automático escolhe o motor feed-forward para redes acíclicas"""
+def test_simulate_when_engine_is_auto_and_network_is_acyclic_should_not_keep_jobs():
+    results = build_tandem(0.0001).simulate(time_in_seconds=SIMULATION_TIME, warmup_time=WARMUP_TIME, seed=SEED)
+
+    assert len(results.jobs) == 0
+    assert results.environment_metrics.get_number_of_processed_jobs() > 0
+
+"""Testando que o motor feed-forward reproduz o motor de eventos com a resolução padrão"""
+def test_feed_forward_when_time_resolution_is_default_should_match_event_engine():
+    assert_same_results(simulate(build_fork_join, 0.0001, 'event'), simulate(build_fork_join, 0.0001, 'feed_forward'))
@@ -0,0 +1,52 @@
+import pytest
+
+from qpy.distribution import Distribution
+from qpy.environment import Environment
+from qpy.queue_discipline import QueueDiscipline
+
+
+SEED = 3
+SIMULATION_TIME = 5000
+WARMUP_TIME = 500
+
+
+def simulate(engine: str, time_resolution, arrival_distribution, service_distribution):
+    env = Environment(time_resolution=time_resolution)
+    server = env.add_server(service_distribution, QueueDiscipline.fcfs())
+    env.add_entry_point(server, arrival_distribution)
+
+    return env.simulate(time_in_seconds=SIMULATION_TIME, warmup_time=WARMUP_TIME, seed=SEED, engine=engine)
+
+def assert_same_results(event_results, lindley_results):
+    for event_metrics, lindley_metrics in ((event_results.environment_metrics, lindley_results.environment_metrics), (event_results.priority_metrics[0], lindley_results.priority_metrics[0])):
+        assert lindley_metrics.get_number_of_processed_jobs() == event_metrics.get_number_of_processed_jobs()
+        assert lindley_metrics.get_mean_time_in_system() == pytest.approx(event_metrics.get_mean_time_in_system())
+        assert lindley_metrics.get_mean_queue_time() == pytest.approx(event_metrics.get_mean_queue_time())
+
+    assert lindley_results.environment_metrics.get_mean_number_of_jobs_in_system() == pytest.approx(event_results.environment_metrics.get_mean_number_of_jobs_in_system())
+    assert lindley_results.environment_metrics.get_throughput() == pytest.approx(event_results.environment_metrics.get_throughput())
+
+    event_server, lindley_server = event_results.server_metrics[0], lindley_results.server_metrics[0]
+
+    assert lindley_server.get_mean_time_in_server() == pytest.approx(event_server.get_mean_time_in_server())
+    assert lindley_server.get_server_utilization() == pytest.approx(event_server.get_server_utilization())
+    assert lindley_server.get_mean_number_of_jobs_in_system() == pytest.approx(event_server.get_mean_number_of_jobs_in_system())
+    assert lindley_server.get_demand() == pytest.approx(event_server.get_demand())
+
+"""Testando que o kernel de Lindley reproduz o motor de eventos numa fila M/M/1 com a resolução padrão"""
+def test_lindley_when_model_is_mm1_should_match_event_engine():
+    arguments = (0.0001, Distribution.exponential(1.25), Distribution.exponential(1))
+
+    assert_same_results(simulate('event', *arguments), simulate('lindley', *arguments))
+
+"""Testando que o kernel de Lindley reproduz o motor de eventos em modo float"""
+def test_lindley_when_time_resolution_is_none_should_match_event_engine():
+    arguments = (None, Distribution.exponential(1.25), Distribution.uniform(0.5, 1.5))
+
+    assert_same_results(simulate('event', *arguments), simulate('lindley', *arguments))
+
+"""Testando que o kernel de Lindley reproduz o motor de eventos com a fila sobrecarregada"""
+def test_lindley_when_queue_is_overloaded_should_match_event_engine():
+    arguments = (0.25, Distribution.exponential(1), Distribution.normal(1.2, 0.3))
+
+    assert_same_results(simulate('event', *arguments), simulate('lindley', *arguments))
@@ -3,7 +3,7 @@ import pytest
 
 from unittest.mock import MagicMock
 from qpy.distribution import Distribution
-from qpy.event import Event
+from qpy.event import Event, EventType
 from qpy.job import Job
 from qpy.server import Server
 from qpy.queue_discipline import QueueDiscipline
@@ -70,9 +70,9 @@ def srt_without_preemption_test_object():
 
 """Testando preempção Round Robin"""
 def test_round_robin_preemption_when_three_jobs_in_server_should_switch_jobs(round_robin_test_object, job_test_object_1, job_test_object_2, job_test_object_3):
-    event = Event(TIME, EVENT_ID, 'arrival', job_test_object_1, SERVER_ID)
-    second_event = Event(SECOND_TIME, EVENT_ID + 1, 'arrival', job_test_object_2, SERVER_ID)
-    third_event = Event(THIRD_TIME, EVENT_ID + 2, 'arrival', job_test_object_3, SERVER_ID)
+    event = Event(TIME, EVENT_ID, EventType.ARRIVAL, job_test_object_1, SERVER_ID)
+    second_event = Event(SECOND_TIME, EVENT_ID + 1, EventType.ARRIVAL, job_test_object_2, SERVER_ID)
+    third_event = Event(THIRD_TIME, EVENT_ID + 2, EventType.ARRIVAL, job_test_object_3, SERVER_ID)
 
     round_robin_test_object.job_arrival(event=event)
     round_robin_test_object.job_arrival(event=second_event)
@@ -86,9 +86,9 @@ def test_round_robin_preemption_when_three_jobs_in_server_should_switch_jobs(rou
 
 """Testando fila de prioridade com preempção"""
 def test_priority_preemption_when_second_job_has_higher_priority_should_switch(priority_with_preemption_test_object, job_test_object_1, job_test_object_2, job_test_object_3):
-    event = Event(TIME, EVENT_ID, 'arrival', job_test_object_1, SERVER_ID)
-    second_event = Event(SECOND_TIME, EVENT_ID + 1, 'arrival', job_test_object_2, SERVER_ID)
-    third_event = Event(THIRD_TIME, EVENT_ID + 2, 'arrival', job_test_object_3, SERVER_ID)
+    event = Event(TIME, EVENT_ID, EventType.ARRIVAL, job_test_object_1, SERVER_ID)
+    second_event = Event(SECOND_TIME, EVENT_ID + 1, EventType.ARRIVAL, job_test_object_2, SERVER_ID)
+    third_event = Event(THIRD_TIME, EVENT_ID + 2, EventType.ARRIVAL, job_test_object_3, SERVER_ID)
 
     priority_with_preemption_test_object.job_arrival(event=event)
     priority_with_preemption_test_object.job_arrival(event=second_event)
@@ -100,9 +100,9 @@ def test_priority_preemption_when_second_job_has_higher_priority_should_switch(p
 
 """Tetando fila de prioridade sem preempção"""
 def test_priority_without_preemption_when_second_job_has_higher_priority_should_not_switch(priority_without_preemption_test_object, job_test_object_1, job_test_object_2, job_test_object_3):
-    event = Event(TIME, EVENT_ID, 'arrival', job_test_object_1, SERVER_ID)
-    second_event = Event(SECOND_TIME, EVENT_ID + 1, 'arrival', job_test_object_2, SERVER_ID)
-    third_event = Event(THIRD_TIME, EVENT_ID + 2, 'arrival', job_test_object_3, SERVER_ID)
+    event = Event(TIME, EVENT_ID, EventType.ARRIVAL, job_test_object_1, SERVER_ID)
+    second_event = Event(SECOND_TIME, EVENT_ID + 1, EventType.ARRIVAL, job_test_object_2, SERVER_ID)
+    third_event = Event(THIRD_TIME, EVENT_ID + 2, EventType.ARRIVAL, job_test_object_3, SERVER_ID)
 
     priority_without_preemption_test_object.job_arrival(event=event)
     priority_without_preemption_test_object.job_arrival(event=second_event)
@@ -115,9 +115,9 @@ def test_priority_without_preemption_when_second_job_has_higher_priority_should_
 
 """Testando SRT com preempção"""
 def test_srt_with_preemption_when_second_job_has_smaller_time_should_preempt(srt_with_preemption_test_object, job_test_object_1, job_test_object_2, job_test_object_3):
-    event = Event(TIME, EVENT_ID, 'arrival', job_test_object_1, SERVER_ID)
-    second_event = Event(SECOND_TIME, EVENT_ID + 1, 'arrival', job_test_object_2, SERVER_ID)
-    third_event = Event(THIRD_TIME, EVENT_ID + 2, 'arrival', job_test_object_3, SERVER_ID)
+    event = Event(TIME, EVENT_ID, EventType.ARRIVAL, job_test_object_1, SERVER_ID)
+    second_event = Event(SECOND_TIME, EVENT_ID + 1, EventType.ARRIVAL, job_test_object_2, SERVER_ID)
+    third_event = Event(THIRD_TIME, EVENT_ID + 2, EventType.ARRIVAL, job_test_object_3, SERVER_ID)
 
     srt_with_preemption_test_object.server_execution.service_distribution = MagicMock()
 
@@ -138,9 +138,9 @@ def test_srt_with_preemption_when_second_job_has_smaller_time_should_preempt(srt
 
 """Testando SRT sem preempção"""
 def test_srt_without_preemption_when_second_job_has_smaller_time_should_not_preempt(srt_without_preemption_test_object, job_test_object_1, job_test_object_2, job_test_object_3):
-    event = Event(TIME, EVENT_ID, 'arrival', job_test_object_1, SERVER_ID)
-    second_event = Event(SECOND_TIME, EVENT_ID + 1, 'arrival', job_test_object_2, SERVER_ID)
-    third_event = Event(THIRD_TIME, EVENT_ID + 2, 'arrival', job_test_object_3, SERVER_ID)
+    event = Event(TIME, EVENT_ID, EventType.ARRIVAL, job_test_object_1, SERVER_ID)
+    second_event = Event(SECOND_TIME, EVENT_ID + 1, EventType.ARRIVAL, job_test_object_2, SERVER_ID)
+    third_event = Event(THIRD_TIME, EVENT_ID + 2, EventType.ARRIVAL, job_test_object_3, SERVER_ID)
 
     srt_without_preemption_test_object.server_execution.service_distribution = MagicMock()
 
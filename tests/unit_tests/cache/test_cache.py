@@ -0,0 +1,82 @@
+import pickle
+import pytest
+
+
+from qpy.cache import ResultCache
+from qpy.results import SimulationResults
+
+
+NUMBER_OF_SERVERS = 2
+SIMULATION_TIME = 100
+TIME_UNIT = 'seconds'
+SPEC = {'version': 1, 'servers': []}
+PARAMETERS = {'time_in_seconds': SIMULATION_TIME, 'seed': 1}
+
+
+@pytest.fixture
+def results_object():
+    return SimulationResults(NUMBER_OF_SERVERS, SIMULATION_TIME, TIME_UNIT)
+
+@pytest.fixture
+def results_size(results_object):
+    return len(pickle.dumps(results_object, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+"""
+Particionamento do espaço de entrada para função key() da classe ResultCache utilizando Each Choice Coverage:
+    parameters: Iguais | Diferentes
+"""
+
+"""parameters Iguais (Válido)"""
+def test_key_when_parameters_are_equal_should_not_depend_on_their_order():
+    assert ResultCache.key(SPEC, PARAMETERS) == ResultCache.key(SPEC, dict(reversed(PARAMETERS.items())))
+
+"""parameters Diferentes (Válido)"""
+def test_key_when_parameters_differ_should_differ():
+    assert ResultCache.key(SPEC, PARAMETERS) != ResultCache.key(SPEC, {**PARAMETERS, 'seed': 2})
+
+
+"""
+Particionamento do espaço de entrada para funções get() e put() da classe ResultCache utilizando Each Choice Coverage:
+    key: Armazenada | Não armazenada
+    tamanho: Dentro do limite | Acima do limite
+"""
+
+"""key Armazenada | tamanho Dentro do limite (Válido)"""
+def test_get_when_key_was_stored_should_return_results(tmp_path, results_object):
+    cache = ResultCache(str(tmp_path / 'cache.sqlite'))
+
+    cache.put('key', results_object)
+    results = ResultCache(str(tmp_path / 'cache.sqlite')).get('key')
+
+    assert isinstance(results, SimulationResults)
+    assert len(results.server_metrics) == NUMBER_OF_SERVERS
+
+"""key Não armazenada (Válido)"""
+def test_get_when_key_was_not_stored_should_return_none(tmp_path):
+    cache = ResultCache(str(tmp_path / 'cache.sqlite'))
+
+    assert cache.get('key') is None
+    assert (cache.hits, cache.misses) == (0, 1)
+
+"""key Armazenada | tamanho Acima do limite (Válido)"""
+def test_put_when_cache_is_full_should_evict_least_recently_used(tmp_path, results_object, results_size):
+    cache = ResultCache(str(tmp_path / 'cache.sqlite'), maximum_size_in_bytes=2 * results_size)
+
+    cache.put('first', results_object)
+    cache.put('second', results_object)
+    cache.get('first')
+    cache.put('third', results_object)
+
+    assert len(cache) == 2
+    assert cache.get('second') is None
+    assert cache.get('first') is not None
+    assert cache.size() == 2 * results_size
+
+"""tamanho Maior que o cache (Válido)"""
+def test_put_when_results_are_larger_than_cache_should_not_store_them(tmp_path, results_object, results_size):
+    cache = ResultCache(str(tmp_path / 'cache.sqlite'), maximum_size_in_bytes=results_size - 1)
+
+    cache.put('key', results_object)
+
+    assert len(cache) == 0
@@ -1,10 +1,16 @@
+import json
+import pickle
 import pytest
 
 
 from pydantic_core import ValidationError
+from qpy.cache import ResultCache
 from qpy.distribution import Distribution
 from qpy.environment import Environment
+from qpy.estimation import PRECISION_MINIMUM_OBSERVATIONS
 from qpy.network import ClosedNetwork, OpenNetwork
+from qpy.queue_discipline import QueueDiscipline
+from qpy.trace import JobTrace
 
 
 VALID_DISTRIBUTION = Distribution.constant(value=10)
@@ -12,6 +18,8 @@ VALID_INTEGER = 10
 ZERO_VALUE = 0
 NEGATIVE_VALUE = -5
 STRING_OBJECT = "teste"
+TIME_RESOLUTION = 0.5
+TERMINAL_ROUTING_PROBABILITY = 0.5
 
 
 """
@@ -52,4 +60,319 @@ def test_init_when_think_time_distribution_is_none_should_create_open_network():
 """number_of_terminals > 0 | think_time_distribution Inválido (Inválido)"""
 def test_init_when_think_time_distribution_is_invalid_should_raise_exception():
     with pytest.raises(ValidationError):
-        env = Environment(number_of_terminals=VALID_INTEGER, think_time_distribution=STRING_OBJECT)
\ No newline at end of file
+        env = Environment(number_of_terminals=VALID_INTEGER, think_time_distribution=STRING_OBJECT)
+
+
+"""
+Particionamento do espaço de entrada para a função __init__() da classe Environment utilizando Each Choice Coverage
+    time_resolution: None | > 0 | <= 0
+"""
+
+"""time_resolution None (Válido)"""
+def test_init_when_time_resolution_is_none_should_use_float_mode():
+    env = Environment(time_resolution=None)
+
+    assert env._time_resolution.is_float_mode()
+
+"""time_resolution > 0 (Válido)"""
+def test_init_when_time_resolution_is_positive_should_use_ticks():
+    env = Environment(time_resolution=TIME_RESOLUTION)
+
+    assert env._time_resolution.tick == TIME_RESOLUTION
+
+"""time_resolution <= 0 (Inválido)"""
+def test_init_when_time_resolution_is_not_positive_should_raise_exception():
+    with pytest.raises(ValueError):
+        Environment(time_resolution=ZERO_VALUE)
+
+
+"""
+Particionamento do espaço de entrada para a função compile() da classe Environment utilizando Each Choice Coverage
+    environment: Sem alterações | Alterado depois da compilação
+"""
+
+"""environment Sem alterações (Válido)"""
+def test_compile_when_environment_did_not_change_should_reuse_plan():
+    env = Environment()
+    server = env.add_server(VALID_DISTRIBUTION)
+    env.add_entry_point(server, VALID_DISTRIBUTION)
+
+    assert env.compile() is env.compile()
+
+"""environment Alterado depois da compilação (Válido)"""
+def test_compile_when_environment_changed_should_rebuild_plan():
+    env = Environment()
+    server = env.add_server(VALID_DISTRIBUTION)
+    env.add_entry_point(server, VALID_DISTRIBUTION)
+    plan = env.compile()
+
+    env.add_server(VALID_DISTRIBUTION)
+
+    assert env.compile() is not plan
+    assert len(env.compile().servers) == 2
+
+"""Testando que simular uma rede fechada não altera o roteamento dos terminais"""
+def test_simulate_when_network_is_closed_should_not_change_terminal_routing():
+    env = Environment(number_of_terminals=VALID_INTEGER, think_time_distribution=VALID_DISTRIBUTION)
+    server = env.add_server(VALID_DISTRIBUTION)
+    env.add_terminals_routing_probability(server, TERMINAL_ROUTING_PROBABILITY)
+
+    first_results = env.simulate(time_in_seconds=VALID_INTEGER * 100, warmup_time=ZERO_VALUE)
+    second_results = env.simulate(time_in_seconds=VALID_INTEGER * 100, warmup_time=ZERO_VALUE)
+
+    assert env._network.entry_point_routing['end'] == 1 - TERMINAL_ROUTING_PROBABILITY
+    assert second_results.environment_metrics.get_number_of_processed_jobs() == first_results.environment_metrics.get_number_of_processed_jobs()
+
+
+"""
+Particionamento do espaço de entrada para função simulate() da classe Environment utilizando Each Choice Coverage:
+    trace: None | JobTrace
+    engine: auto | lindley
+    warmup_time: Número | auto
+    target_relative_half_width: None | Válido
+    batch_means: False | True | Sobrepostos
+"""
+
+"""trace None | engine auto (Válido)"""
+def test_simulate_when_trace_is_not_provided_should_not_keep_jobs():
+    env = Environment()
+    env.add_server(Distribution.exponential(1), QueueDiscipline.lcfs())
+    env.add_entry_point(0, Distribution.exponential(2))
+
+    assert env.simulate(time_in_seconds=100, warmup_time=0).jobs == {}
+
+"""trace JobTrace | engine auto (Válido)"""
+def test_simulate_when_trace_is_provided_should_keep_last_jobs():
+    env = Environment()
+    env.add_server(Distribution.exponential(1), QueueDiscipline.fcfs())
+    env.add_entry_point(0, Distribution.exponential(2))
+
+    results = env.simulate(time_in_seconds=100, warmup_time=0, trace=JobTrace.last(5))
+
+    assert len(results.jobs) == 5
+
+"""trace JobTrace | engine lindley (Inválido)"""
+def test_simulate_when_trace_is_provided_to_vectorized_engine_should_raise_exception():
+    env = Environment()
+    env.add_server(Distribution.exponential(1), QueueDiscipline.fcfs())
+    env.add_entry_point(0, Distribution.exponential(2))
+
+    with pytest.raises(ValueError):
+        env.simulate(time_in_seconds=100, warmup_time=0, engine='lindley', trace=JobTrace.last(5))
+
+"""warmup_time auto | engine auto (Válido)"""
+def test_simulate_when_warmup_is_auto_should_report_detected_warmup():
+    env = Environment()
+    env.add_server(Distribution.exponential(1), QueueDiscipline.fcfs())
+    env.add_entry_point(0, Distribution.exponential(2))
+
+    results = env.simulate(time_in_seconds=2000, warmup_time='auto', seed=VALID_INTEGER)
+
+    assert 0 < results.warmup_time <= 2000
+    assert results.environment_metrics.get_number_of_processed_jobs() > 0
+
+"""warmup_time auto | engine lindley (Inválido)"""
+def test_simulate_when_warmup_is_auto_and_engine_is_vectorized_should_raise_exception():
+    env = Environment()
+    env.add_server(Distribution.exponential(1), QueueDiscipline.fcfs())
+    env.add_entry_point(0, Distribution.exponential(2))
+
+    with pytest.raises(ValueError):
+        env.simulate(time_in_seconds=100, warmup_time='auto', engine='lindley')
+
+"""target_relative_half_width Válido | engine auto (Válido)"""
+def test_simulate_when_precision_is_reached_should_stop_before_horizon():
+    env = Environment()
+    env.add_server(Distribution.exponential(1), QueueDiscipline.fcfs())
+    env.add_entry_point(0, Distribution.exponential(2))
+
+    results = env.simulate(time_in_seconds=100000, warmup_time=100, seed=VALID_INTEGER, target_relative_half_width=0.1)
+    confidence_interval = results.environment_metrics.get_time_in_system_confidence_interval()
+
+    assert results.total_simulation_time < 100000
+    assert confidence_interval.relative_half_width <= 0.1
+    assert results.server_metrics[0].get_server_utilization_confidence_interval().relative_half_width <= 0.1
+
+"""target_relative_half_width Válido | engine auto | sistema congestionado (Válido)"""
+def test_simulate_when_precision_is_reached_should_cover_analytic_mean():
+    env = Environment()
+    env.add_server(Distribution.exponential(0.9), QueueDiscipline.fcfs())
+    env.add_entry_point(0, Distribution.exponential(1))
+
+    results = env.simulate(time_in_seconds=1000000, warmup_time=1000, seed=VALID_INTEGER, target_relative_half_width=0.1)
+    confidence_interval = results.environment_metrics.get_time_in_system_confidence_interval()
+
+    # M/M/1 with rho = 0.9: E[T] = 1 / (mu - lambda) = 9
+    assert results.environment_metrics.get_number_of_processed_jobs() >= PRECISION_MINIMUM_OBSERVATIONS
+    assert abs(confidence_interval.mean - 9) <= confidence_interval.half_width
+
+"""target_relative_half_width Válido | engine lindley (Inválido)"""
+def test_simulate_when_precision_is_targeted_and_engine_is_vectorized_should_raise_exception():
+    env = Environment()
+    env.add_server(Distribution.exponential(1), QueueDiscipline.fcfs())
+    env.add_entry_point(0, Distribution.exponential(2))
+
+    with pytest.raises(ValueError):
+        env.simulate(time_in_seconds=100, warmup_time=0, engine='lindley', target_relative_half_width=0.1)
+
+"""batch_means True | engine auto (Válido)"""
+def test_simulate_when_batch_means_are_enabled_should_report_confidence_intervals():
+    env = Environment()
+    env.add_server(Distribution.exponential(1), QueueDiscipline.fcfs())
+    env.add_entry_point(0, Distribution.exponential(2))
+
+    results = env.simulate(time_in_seconds=20000, warmup_time=100, seed=VALID_INTEGER, batch_means=True)
+
+    assert results.environment_metrics.get_time_in_system_confidence_interval().mean == pytest.approx(2, rel=0.1)
+    assert results.server_metrics[0].get_server_utilization_confidence_interval().mean == pytest.approx(0.5, rel=0.1)
+    assert results.priority_metrics[0].get_time_in_system_confidence_interval() is not None
+
+"""batch_means Sobrepostos | engine auto (Válido)"""
+def test_simulate_when_batches_overlap_should_report_confidence_intervals():
+    env = Environment()
+    env.add_server(Distribution.exponential(1), QueueDiscipline.fcfs())
+    env.add_entry_point(0, Distribution.exponential(2))
+
+    results = env.simulate(time_in_seconds=20000, warmup_time=100, seed=VALID_INTEGER, overlapping_batches=True)
+
+    assert results.environment_metrics.time_in_system_batches.overlapping
+    assert results.environment_metrics.get_number_of_jobs_in_system_confidence_interval().mean == pytest.approx(1, rel=0.1)
+
+
+"""
+Particionamento do espaço de entrada para função simulate_replications() da classe Environment utilizando Each Choice Coverage:
+    number_of_replications: >= 2 | < 2
+    workers: 1 | > 1
+"""
+
+"""number_of_replications >= 2 | workers > 1 (Válido)"""
+def test_simulate_replications_should_not_depend_on_number_of_workers():
+    env = Environment()
+    env.add_server(Distribution.exponential(1), QueueDiscipline.fcfs())
+    env.add_entry_point(0, Distribution.exponential(2), {0: 0.5, 1: 0.5})
+
+    parallel = env.simulate_replications(4, time_in_seconds=1000, warmup_time=100, workers=2, seed=VALID_INTEGER)
+    sequential = env.simulate_replications(4, time_in_seconds=1000, warmup_time=100, workers=1, seed=VALID_INTEGER)
+
+    assert len(parallel.replications) == 4
+    assert len({results.environment_metrics.get_number_of_processed_jobs() for results in parallel.replications}) > 1
+    assert vars(parallel.environment) == vars(sequential.environment)
+    assert [vars(server) for server in parallel.servers] == [vars(server) for server in sequential.servers]
+    assert {priority: vars(metrics) for priority, metrics in parallel.priorities.items()} == {priority: vars(metrics) for priority, metrics in sequential.priorities.items()}
+
+"""number_of_replications >= 2 | workers 1 (Válido)"""
+def test_simulate_replications_should_cover_expected_time_in_system():
+    env = Environment()
+    env.add_server(Distribution.exponential(1), QueueDiscipline.fcfs())
+    env.add_entry_point(0, Distribution.exponential(2))
+
+    results = env.simulate_replications(10, time_in_seconds=5000, warmup_time=100, workers=1, seed=VALID_INTEGER, confidence=0.99)
+
+    assert abs(results.environment.mean_time_in_system.mean - 2) <= results.environment.mean_time_in_system.half_width
+    assert results.servers[0].server_utilization.mean == pytest.approx(0.5, rel=0.1)
+
+"""number_of_replications < 2 (Inválido)"""
+def test_simulate_replications_when_there_is_one_replication_should_raise_exception():
+    env = Environment()
+    env.add_server(Distribution.exponential(1), QueueDiscipline.fcfs())
+    env.add_entry_point(0, Distribution.exponential(2))
+
+    with pytest.raises(ValidationError):
+        env.simulate_replications(1, time_in_seconds=100, warmup_time=0)
+
+
+@pytest.fixture
+def open_environment():
+    env = Environment(time_resolution=None)
+    env.add_server(Distribution.exponential(0.5), QueueDiscipline.round_robin(0.1))
+    env.add_server(Distribution.uniform(0.1, 0.3), QueueDiscipline.priority_queue(True))
+    env.add_servers_connection(0, 1, 0.4)
+    env.add_servers_connection(1, 0, 0.2)
+    env.add_entry_point(0, Distribution.exponential(1.5), {1: 0.3, 0: 0.7})
+    env.add_entry_point(1, Distribution.constant(4))
+
+    return env
+
+@pytest.fixture
+def closed_environment():
+    env = Environment(number_of_terminals=VALID_INTEGER, think_time_distribution=Distribution.exponential(2))
+    env.add_server(Distribution.exponential(0.3))
+    env.add_server(Distribution.normal(0.3, 0.1), QueueDiscipline.srt(False))
+    env.add_servers_connection(0, 1, 0.5)
+    env.add_terminals_routing_probability(0, 0.6)
+    env.add_terminals_routing_probability(1, 0.4)
+    env.add_priority_closed_network({0: 0.5, 2: 0.5})
+
+    return env
+
+
+"""
+Particionamento do espaço de entrada para funções to_spec() e from_spec() da classe Environment utilizando Each Choice Coverage:
+    network: Aberta | Fechada
+    spec: Versão atual | Outra versão
+"""
+
+"""network Aberta | spec Versão atual (Válido)"""
+def test_from_spec_when_network_is_open_should_round_trip_and_reproduce_runs(open_environment):
+    spec = open_environment.to_spec()
+
+    rebuilt = Environment.from_spec(json.loads(json.dumps(spec)))
+
+    assert rebuilt.to_spec() == spec
+    assert rebuilt.content_hash() == open_environment.content_hash()
+    assert rebuilt.simulate(1000, 10, seed=VALID_INTEGER).environment_metrics.get_mean_time_in_system() == open_environment.simulate(1000, 10, seed=VALID_INTEGER).environment_metrics.get_mean_time_in_system()
+
+"""network Fechada | spec Versão atual (Válido)"""
+def test_from_spec_when_network_is_closed_should_round_trip_and_reproduce_runs(closed_environment):
+    spec = closed_environment.to_spec()
+
+    rebuilt = Environment.from_spec(json.loads(json.dumps(spec)))
+
+    assert rebuilt.to_spec() == spec
+    assert rebuilt.simulate(100, 10, seed=VALID_INTEGER).environment_metrics.get_throughput() == closed_environment.simulate(100, 10, seed=VALID_INTEGER).environment_metrics.get_throughput()
+
+"""spec Outra versão (Inválido)"""
+def test_from_spec_when_version_is_unknown_should_raise_exception(open_environment):
+    spec = open_environment.to_spec()
+    spec['version'] += 1
+
+    with pytest.raises(ValueError):
+        Environment.from_spec(spec)
+
+"""Testando que modelos diferentes têm hashes diferentes"""
+def test_content_hash_when_model_changes_should_change(open_environment):
+    content_hash = open_environment.content_hash()
+
+    open_environment.add_servers_connection(0, 1, 0.5)
+
+    assert open_environment.content_hash() != content_hash
+
+"""Testando que o ambiente pode ser serializado para ir a outro processo"""
+def test_environment_should_be_picklable(closed_environment):
+    copy = pickle.loads(pickle.dumps(closed_environment))
+
+    assert copy.to_spec() == closed_environment.to_spec()
+
+
+"""
+Particionamento do espaço de entrada para função simulate() da classe Environment com cache utilizando Each Choice Coverage:
+    seed: Fornecida | Não fornecida
+"""
+
+"""seed Fornecida (Válido)"""
+def test_simulate_when_cache_is_provided_should_reuse_results_of_same_run(open_environment, tmp_path):
+    cache = ResultCache(str(tmp_path / 'cache.sqlite'))
+
+    first = open_environment.simulate(1000, 10, seed=VALID_INTEGER, cache=cache)
+    second = open_environment.simulate(1000, 10, seed=VALID_INTEGER, cache=cache)
+    other_seed = open_environment.simulate(1000, 10, seed=VALID_INTEGER + 1, cache=cache)
+
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert second.environment_metrics.get_mean_time_in_system() == first.environment_metrics.get_mean_time_in_system()
+    assert other_seed.environment_metrics.get_mean_time_in_system() != first.environment_metrics.get_mean_time_in_system()
+
+"""seed Não fornecida (Inválido)"""
+def test_simulate_when_cache_is_provided_without_seed_should_raise_exception(open_environment, tmp_path):
+    with pytest.raises(ValueError):
+        open_environment.simulate(1000, 10, cache=ResultCache(str(tmp_path / 'cache.sqlite')))
+
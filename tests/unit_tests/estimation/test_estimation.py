@@ -0,0 +1,143 @@
+import numpy as np
+import pytest
+
+
+from qpy.estimation import BatchMeans, ConfidenceInterval, replication_statistics, student_t_quantile
+
+
+SEED = 7
+MAXIMUM_NUMBER_OF_BATCHES = 20
+NUMBER_OF_OBSERVATIONS = 10000
+MEAN = 5
+STANDARD_DEVIATION = 2
+
+
+"""
+Particionamento do espaço de entrada para função student_t_quantile() utilizando Each Choice Coverage:
+    degrees_of_freedom: 1 | 2 | Ímpar > 2 | Par > 2
+"""
+
+"""degrees_of_freedom 1 (Válido)"""
+def test_student_t_quantile_when_there_is_one_degree_of_freedom_should_match_table():
+    assert student_t_quantile(0.975, 1) == pytest.approx(12.706205, abs=1e-6)
+
+"""degrees_of_freedom 2 (Válido)"""
+def test_student_t_quantile_when_there_are_two_degrees_of_freedom_should_match_table():
+    assert student_t_quantile(0.975, 2) == pytest.approx(4.302653, abs=1e-6)
+
+"""degrees_of_freedom Ímpar > 2 (Válido)"""
+def test_student_t_quantile_when_degrees_of_freedom_are_odd_should_match_table():
+    assert student_t_quantile(0.995, 3) == pytest.approx(5.840909, abs=1e-6)
+    assert student_t_quantile(0.975, 19) == pytest.approx(2.093024, abs=1e-6)
+
+"""degrees_of_freedom Par > 2 (Válido)"""
+def test_student_t_quantile_when_degrees_of_freedom_are_even_should_match_table():
+    assert student_t_quantile(0.995, 4) == pytest.approx(4.604095, abs=1e-6)
+    assert student_t_quantile(0.975, 20) == pytest.approx(2.085963, abs=1e-6)
+
+
+"""
+Particionamento do espaço de entrada para função add() da classe BatchMeans utilizando Each Choice Coverage:
+    batches: Incompletos | Completos (junção)
+"""
+
+"""batches Incompletos (Válido)"""
+def test_add_when_batches_are_not_full_should_keep_one_batch_per_observation():
+    batch_means = BatchMeans(MAXIMUM_NUMBER_OF_BATCHES)
+
+    for value in range(MAXIMUM_NUMBER_OF_BATCHES - 1):
+        batch_means.add(value)
+
+    assert (batch_means.batch_size, batch_means.number_of_batches) == (1, MAXIMUM_NUMBER_OF_BATCHES - 1)
+    assert batch_means.batch_completed
+
+"""batches Completos (junção) (Válido)"""
+def test_add_when_batches_are_full_should_merge_them_and_double_batch_size():
+    batch_means = BatchMeans(MAXIMUM_NUMBER_OF_BATCHES)
+
+    for value in range(NUMBER_OF_OBSERVATIONS):
+        batch_means.add(value)
+
+    assert batch_means.number_of_batches <= MAXIMUM_NUMBER_OF_BATCHES
+    assert batch_means.number_of_batches * batch_means.batch_size <= NUMBER_OF_OBSERVATIONS < (batch_means.number_of_batches + 1) * batch_means.batch_size
+
+
+"""
+Particionamento do espaço de entrada para função confidence_interval() da classe BatchMeans utilizando Each Choice Coverage:
+    batches: < metade do máximo | >= metade do máximo | Sempre correlacionados
+    weight: 1 | Tempo decorrido
+    overlapping: False | True
+"""
+
+"""batches < metade do máximo (Válido)"""
+def test_confidence_interval_when_there_are_few_batches_should_return_none():
+    batch_means = BatchMeans(MAXIMUM_NUMBER_OF_BATCHES)
+    batch_means.add(MEAN)
+
+    assert batch_means.confidence_interval() is None
+
+"""batches >= metade do máximo | weight 1 (Válido)"""
+def test_confidence_interval_when_observations_are_independent_should_cover_mean():
+    batch_means = BatchMeans(MAXIMUM_NUMBER_OF_BATCHES)
+
+    for value in np.random.default_rng(SEED).normal(MEAN, STANDARD_DEVIATION, NUMBER_OF_OBSERVATIONS):
+        batch_means.add(value)
+
+    confidence_interval = batch_means.confidence_interval(0.99)
+
+    assert isinstance(confidence_interval, ConfidenceInterval)
+    assert abs(confidence_interval.mean - MEAN) <= confidence_interval.half_width
+    assert confidence_interval.relative_half_width == confidence_interval.half_width / confidence_interval.mean
+
+"""batches >= metade do máximo | weight Tempo decorrido (Válido)"""
+def test_confidence_interval_when_observations_are_weighted_should_return_ratio_of_sums():
+    batch_means = BatchMeans(MAXIMUM_NUMBER_OF_BATCHES)
+
+    for _ in range(MAXIMUM_NUMBER_OF_BATCHES):
+        batch_means.add(1, 4)
+
+    confidence_interval = batch_means.confidence_interval()
+
+    assert (confidence_interval.mean, confidence_interval.variance, confidence_interval.half_width) == (0.25, 0, 0)
+
+"""batches Sempre correlacionados (Válido)"""
+def test_confidence_interval_when_batch_means_stay_correlated_should_return_none():
+    batch_means = BatchMeans(MAXIMUM_NUMBER_OF_BATCHES)
+
+    for value in range(NUMBER_OF_OBSERVATIONS):
+        batch_means.add(value)
+
+    assert batch_means.confidence_interval() is None
+
+"""batches >= metade do máximo | overlapping True (Válido)"""
+def test_confidence_interval_when_batches_overlap_should_cover_mean():
+    batch_means = BatchMeans(MAXIMUM_NUMBER_OF_BATCHES, overlapping=True)
+
+    for value in np.random.default_rng(SEED).normal(MEAN, STANDARD_DEVIATION, NUMBER_OF_OBSERVATIONS):
+        batch_means.add(value)
+
+    confidence_interval = batch_means.confidence_interval(0.99)
+
+    assert batch_means.number_of_batches > MAXIMUM_NUMBER_OF_BATCHES
+    assert abs(confidence_interval.mean - MEAN) <= confidence_interval.half_width
+
+
+"""
+Particionamento do espaço de entrada para função replication_statistics() utilizando Each Choice Coverage:
+    values: Uma replicação | Várias replicações
+"""
+
+"""values Várias replicações (Válido)"""
+def test_replication_statistics_when_there_are_several_replications_should_return_student_t_interval():
+    statistics = replication_statistics([1, 2, 3, 4, 5], 0.95)
+
+    assert statistics.mean == 3
+    assert statistics.standard_deviation == pytest.approx(np.sqrt(2.5))
+    assert statistics.half_width == pytest.approx(2.776445 * np.sqrt(2.5) / np.sqrt(5), abs=1e-6)
+
+"""values Uma replicação (Válido)"""
+def test_replication_statistics_when_there_is_one_replication_should_return_infinite_half_width():
+    statistics = replication_statistics([MEAN])
+
+    assert (statistics.mean, statistics.standard_deviation, statistics.half_width) == (MEAN, 0, np.inf)
+
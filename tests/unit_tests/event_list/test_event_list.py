@@ -0,0 +1,122 @@
+import pytest
+import random
+
+
+from unittest.mock import MagicMock
+from qpy.event_list import CalendarEventList, HeapEventList, create_event_list
+
+
+NUMBER_OF_ENTRIES = 2000
+NUMBER_OF_HOLD_OPERATIONS = 5000
+TIME_STEP = 0.0001
+
+
+def _entry(time: float, entry_id: int) -> tuple:
+    return (time, entry_id, MagicMock(canceled=False))
+
+def _random_entries(number_of_entries: int, seed: int) -> list:
+    generator = random.Random(seed)
+
+    return [_entry(round(generator.expovariate(1), 4), entry_id) for entry_id in range(number_of_entries)]
+
+def _drain(event_list) -> list:
+    return [event_list.pop()[:2] for _ in range(len(event_list))]
+
+
+"""
+Particionamento do espaço de entrada para função create_event_list() utilizando Each Choice Coverage:
+    event_list: 'heap' | 'calendar' | Inválido
+"""
+
+"""event_list = 'heap' (Válido)"""
+def test_create_event_list_when_heap_is_requested_should_return_heap_event_list():
+    assert isinstance(create_event_list('heap'), HeapEventList)
+
+"""event_list = 'calendar' (Válido)"""
+def test_create_event_list_when_calendar_is_requested_should_return_calendar_event_list():
+    assert isinstance(create_event_list('calendar'), CalendarEventList)
+
+"""event_list Inválido (Inválido)"""
+def test_create_event_list_when_name_is_invalid_should_raise_exception():
+    with pytest.raises(ValueError):
+        create_event_list('banana')
+
+
+"""
+Particionamento do espaço de entrada para função pop() das listas de eventos utilizando Each Choice Coverage:
+    lista: Vazia | Entradas com tempos distintos | Entradas com tempos repetidos | Inserções intercaladas com remoções
+"""
+
+"""lista Vazia (Inválido)"""
+@pytest.mark.parametrize('event_list_class', [HeapEventList, CalendarEventList])
+def test_pop_when_event_list_is_empty_should_raise_exception(event_list_class):
+    with pytest.raises(IndexError):
+        event_list_class().pop()
+
+"""lista com tempos distintos (Válido)"""
+@pytest.mark.parametrize('event_list_class', [HeapEventList, CalendarEventList])
+def test_pop_when_entries_are_distinct_should_return_them_in_time_order(event_list_class):
+    entries = _random_entries(NUMBER_OF_ENTRIES, seed=1)
+
+    assert _drain(event_list_class(entries)) == sorted(entry[:2] for entry in entries)
+
+"""lista com tempos repetidos (Válido)"""
+@pytest.mark.parametrize('event_list_class', [HeapEventList, CalendarEventList])
+def test_pop_when_times_are_repeated_should_break_ties_by_id(event_list_class):
+    entries = [_entry(time, entry_id) for entry_id, time in enumerate([3, 1, 1, 2, 1, 3])]
+
+    assert _drain(event_list_class(entries)) == [(1, 1), (1, 2), (1, 4), (2, 3), (3, 0), (3, 5)]
+
+"""inserções intercaladas com remoções (Válido)"""
+def test_pop_when_pushes_and_pops_are_interleaved_should_match_heap_order():
+    generator = random.Random(2)
+    entries = _random_entries(NUMBER_OF_ENTRIES, seed=3)
+    heap = HeapEventList(entries)
+    calendar = CalendarEventList(entries)
+
+    for entry_id in range(NUMBER_OF_ENTRIES, NUMBER_OF_ENTRIES + NUMBER_OF_HOLD_OPERATIONS):
+        heap_entry = heap.pop()
+        assert calendar.pop() == heap_entry
+
+        if generator.random() < 0.6:
+            new_entry = _entry(round(heap_entry[0] + generator.expovariate(1), 4), entry_id)
+            heap.push(new_entry)
+            calendar.push(new_entry)
+
+    assert _drain(calendar) == _drain(heap)
+
+"""inserção anterior ao último evento removido (Válido)"""
+def test_pop_when_entry_is_pushed_before_current_time_should_still_return_it_first():
+    calendar = CalendarEventList([_entry(time, entry_id) for entry_id, time in enumerate([5, 6, 7])])
+    calendar.pop()
+
+    calendar.push(_entry(1, 3))
+
+    assert calendar.pop()[:2] == (1, 3)
+
+
+"""
+Particionamento do espaço de entrada para função remove_canceled() das listas de eventos utilizando Each Choice Coverage:
+    lista: Sem cancelados | Com cancelados
+"""
+
+"""lista Sem cancelados (Válido)"""
+@pytest.mark.parametrize('event_list_class', [HeapEventList, CalendarEventList])
+def test_remove_canceled_when_nothing_is_canceled_should_keep_entries(event_list_class):
+    event_list = event_list_class(_random_entries(10, seed=4))
+
+    event_list.remove_canceled()
+
+    assert len(event_list) == 10
+
+"""lista Com cancelados (Válido)"""
+@pytest.mark.parametrize('event_list_class', [HeapEventList, CalendarEventList])
+def test_remove_canceled_when_entries_are_canceled_should_drop_them_and_keep_order(event_list_class):
+    entries = _random_entries(100, seed=5)
+    for entry in entries[::2]:
+        entry[2].canceled = True
+    event_list = event_list_class(entries)
+
+    event_list.remove_canceled()
+
+    assert _drain(event_list) == sorted(entry[:2] for entry in entries[1::2])
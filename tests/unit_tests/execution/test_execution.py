@@ -1,11 +1,11 @@
-import heapq
 import pytest
 
 
 from unittest.mock import MagicMock
 from qpy.distribution import Distribution
+from qpy.event import EventType
 from qpy.job import Job
-from qpy.execution import Execution
+from qpy.execution import COMPACTION_DEAD_EVENT_RATIO, COMPACTION_MIN_QUEUE_SIZE, Execution
 from qpy.network import OpenNetwork
 
 
@@ -15,8 +15,9 @@ VALID_TIME = 5
 ZERO_VALUE = 0
 EVENT_COUNT = 0
 
-ARRIVAL_EVENT = "arrival"
-DEPARTURE_EVENT = "departure"
+ARRIVAL_EVENT = EventType.ARRIVAL
+DEPARTURE_EVENT = EventType.DEPARTURE
+PREEMPTION_EVENT = EventType.PREEMPTION
 
 CONSTANT_DISTRIBUTION_VALUE = 5
 PREEMPTION_TIME = 2
@@ -26,6 +27,7 @@ DESTINATION_SERVER_ID = 1
 JOB_SERVICE_TIME = 2
 JOB_ARRIVAL_TIME = 1
 MOCK_NEW_JOB_BEING_EXECUTED = (JOB_SERVICE_TIME, MagicMock())
+MOCK_VISIT = (ZERO_VALUE, JOB_SERVICE_TIME)
 
 
 @pytest.fixture
@@ -34,9 +36,10 @@ def mock_event():
     event.canceled = False
     event.current_time = VALID_TIME
     event.server_id = SERVER_ID
+    event.entry_point = None
     event.type = ARRIVAL_EVENT
     event.job = MagicMock()
-    event.server = MagicMock()
+    event.job.reroute.return_value = MOCK_VISIT
 
     return event
 
@@ -51,6 +54,13 @@ def mock_execution_object():
 
     return execution
 
+@pytest.fixture
+def mock_server(mock_execution_object):
+    server = MagicMock()
+    mock_execution_object.network_configuration.servers[SERVER_ID] = server
+
+    return server
+
 
 """
 Particionamento do espaço de entrada para função execute() da classe Execution utilizando Each Choice Coverage:
@@ -78,7 +88,7 @@ def test_execute_when_event_is_canceled_should_ignore(mock_execution_object, moc
     mock_execution_object._case_event_is_arrival = MagicMock()
     mock_execution_object._case_event_is_departure_or_preemption = MagicMock()
 
-    heapq.heappush(mock_execution_object.event_queue, (0, 0, mock_event))
+    mock_execution_object.event_queue.push((0, 0, mock_event))
 
     mock_execution_object.execute()
 
@@ -87,7 +97,7 @@ def test_execute_when_event_is_canceled_should_ignore(mock_execution_object, moc
 
 """current_time <= time | queue Not Empty (Válido)"""
 def test_execute_when_event_is_arrival_should_call_case_arrival(mock_execution_object, mock_event):
-    heapq.heappush(mock_execution_object.event_queue, (0, 0, mock_event))
+    mock_execution_object.event_queue.push((0, 0, mock_event))
     mock_execution_object._case_event_is_arrival = MagicMock()
 
     mock_execution_object.execute()
@@ -98,7 +108,7 @@ def test_execute_when_event_is_arrival_should_call_case_arrival(mock_execution_o
 """current_time <= time | queue Not Empty (Válido)"""
 def test_execute_when_event_is_departure_should_call_case_departure(mock_execution_object, mock_event):
     mock_event.type = DEPARTURE_EVENT
-    heapq.heappush(mock_execution_object.event_queue, (0, 0, mock_event))
+    mock_execution_object.event_queue.push((0, 0, mock_event))
     mock_execution_object._case_event_is_departure_or_preemption = MagicMock()
 
     mock_execution_object.execute()
@@ -114,7 +124,7 @@ Particionamento do espaço de entrada para função _add_next_departure_event()
 
 """event = 'departure' (Válido)"""
 def test_add_next_departure_event_when_event_is_departure_should_serve_job(mock_execution_object, mock_event):
-    mock_execution_object._add_next_departure_event(SERVER_ID, mock_event.job, VALID_TIME, JOB_SERVICE_TIME, event_type='departure')
+    mock_execution_object._add_next_departure_event(SERVER_ID, mock_event.job, VALID_TIME, JOB_SERVICE_TIME, event_type=DEPARTURE_EVENT)
 
     assert mock_execution_object.event_count == EVENT_COUNT + 1
     assert len(mock_execution_object.event_queue) == 1
@@ -125,7 +135,7 @@ def test_add_next_departure_event_when_event_is_preemption_should_serve_job(mock
     mock_execution_object.network_configuration.servers[SERVER_ID].get_preemption_time = MagicMock()
     mock_execution_object.network_configuration.servers[SERVER_ID].get_preemption_time.return_value = PREEMPTION_TIME
 
-    mock_execution_object._add_next_departure_event(SERVER_ID, mock_event.job, VALID_TIME, JOB_SERVICE_TIME, event_type='preemption')
+    mock_execution_object._add_next_departure_event(SERVER_ID, mock_event.job, VALID_TIME, JOB_SERVICE_TIME, event_type=PREEMPTION_EVENT)
 
     assert mock_execution_object.event_count == EVENT_COUNT + 1
     assert len(mock_execution_object.event_queue) == 1
@@ -138,9 +148,9 @@ Particionamento do espaço de entrada para função _route_job_after_event() da
 """
 
 """route = 'end' (Válido)"""
-def test_route_job_after_event_when_route_is_end_should_end_job_and_compute_results(mock_execution_object, mock_event):
-    mock_event.server.route_job = MagicMock()
-    mock_event.server.route_job.return_value = 'end'
+def test_route_job_after_event_when_route_is_end_should_end_job_and_compute_results(mock_execution_object, mock_event, mock_server):
+    mock_server.route_job = MagicMock()
+    mock_server.route_job.return_value = 'end'
     mock_event.job.arrival_time = ZERO_VALUE
     
     mock_execution_object._route_job_after_event(mock_event)
@@ -148,9 +158,9 @@ def test_route_job_after_event_when_route_is_end_should_end_job_and_compute_resu
     mock_event.job.reroute.assert_called_once_with(ZERO_VALUE)
 
 """route != 'end' (Válido)"""
-def test_route_job_after_event_when_route_is_not_end_should_end_job_and_compute_results(mock_execution_object, mock_event):
-    mock_event.server.route_job = MagicMock()
-    mock_event.server.route_job.return_value = DESTINATION_SERVER_ID
+def test_route_job_after_event_when_route_is_not_end_should_end_job_and_compute_results(mock_execution_object, mock_event, mock_server):
+    mock_server.route_job = MagicMock()
+    mock_server.route_job.return_value = DESTINATION_SERVER_ID
     mock_event.job.arrival_time = ZERO_VALUE
     mock_execution_object._add_next_departure_event = MagicMock()
     mock_execution_object.network_configuration.servers[DESTINATION_SERVER_ID] = MagicMock()
@@ -167,9 +177,9 @@ Particionamento do espaço de entrada para função _case_event_is_arrival() da
 """
 
 """service_time None (Válido)"""
-def test_case_event_is_arrival_when_job_is_not_being_executed_should_not_add_departure_event(mock_execution_object, mock_event):
-    mock_event.server.job_arrival = MagicMock()
-    mock_event.server.job_arrival.return_value = None
+def test_case_event_is_arrival_when_job_is_not_being_executed_should_not_add_departure_event(mock_execution_object, mock_event, mock_server):
+    mock_server.job_arrival = MagicMock()
+    mock_server.job_arrival.return_value = None
     mock_event.job.arrival_time = JOB_ARRIVAL_TIME
 
     mock_execution_object._add_next_departure_event = MagicMock()
@@ -180,9 +190,9 @@ def test_case_event_is_arrival_when_job_is_not_being_executed_should_not_add_dep
     mock_execution_object._add_next_departure_event.assert_not_called()
 
 """service_time Not None (Válido)"""
-def test_case_event_is_arrival_when_job_is_being_executed_should_add_departure_event(mock_execution_object, mock_event):
-    mock_event.server.job_arrival = MagicMock()
-    mock_event.server.job_arrival.return_value = JOB_SERVICE_TIME
+def test_case_event_is_arrival_when_job_is_being_executed_should_add_departure_event(mock_execution_object, mock_event, mock_server):
+    mock_server.job_arrival = MagicMock()
+    mock_server.job_arrival.return_value = JOB_SERVICE_TIME
     mock_event.job.arrival_time = JOB_ARRIVAL_TIME
 
     mock_execution_object._add_next_departure_event = MagicMock()
@@ -196,12 +206,14 @@ def test_case_event_is_arrival_when_job_is_being_executed_should_add_departure_e
 """
 Particionamento do espaço de entrada para função _case_event_is_departure_or_preemption() da classe Execution utilizando Each Choice Coverage:
     new_job_being_executed: None | Not None
+    event_type: DEPARTURE | PREEMPTION
 """
 
-"""new_job_being_executed None (Válido)"""
-def test_case_event_is_departure_or_preemption_when_new_job_is_not_being_executed_should_not_add_departure_event(mock_execution_object, mock_event):
-    mock_event.server.finish_execution = MagicMock()
-    mock_event.server.finish_execution.return_value = None
+"""new_job_being_executed None | event_type DEPARTURE (Válido)"""
+def test_case_event_is_departure_or_preemption_when_new_job_is_not_being_executed_should_not_add_departure_event(mock_execution_object, mock_event, mock_server):
+    mock_server.finish_execution = MagicMock()
+    mock_server.finish_execution.return_value = None
+    mock_event.type = DEPARTURE_EVENT
 
     mock_execution_object._add_next_departure_event = MagicMock()
     mock_execution_object._route_job_after_event = MagicMock()
@@ -211,10 +223,11 @@ def test_case_event_is_departure_or_preemption_when_new_job_is_not_being_execute
     mock_execution_object._route_job_after_event.assert_called_once_with(mock_event)
     mock_execution_object._add_next_departure_event.assert_not_called()
 
-"""new_job_being_executed Not None (Válido)"""
-def test_case_event_is_departure_or_preemption_when_new_job_is_being_executed_should_add_departure_event(mock_execution_object, mock_event):
-    mock_event.server.finish_execution = MagicMock()
-    mock_event.server.finish_execution.return_value = MOCK_NEW_JOB_BEING_EXECUTED
+"""new_job_being_executed Not None | event_type DEPARTURE (Válido)"""
+def test_case_event_is_departure_or_preemption_when_new_job_is_being_executed_should_add_departure_event(mock_execution_object, mock_event, mock_server):
+    mock_server.finish_execution = MagicMock()
+    mock_server.finish_execution.return_value = MOCK_NEW_JOB_BEING_EXECUTED
+    mock_event.type = DEPARTURE_EVENT
 
     mock_execution_object._add_next_departure_event = MagicMock()
     mock_execution_object._route_job_after_event = MagicMock()
@@ -222,4 +235,52 @@ def test_case_event_is_departure_or_preemption_when_new_job_is_being_executed_sh
     mock_execution_object._case_event_is_departure_or_preemption(mock_event)
 
     mock_execution_object._route_job_after_event.assert_called_once_with(mock_event)
-    mock_execution_object._add_next_departure_event.assert_called_once()
\ No newline at end of file
+    mock_execution_object._add_next_departure_event.assert_called_once()
+
+"""new_job_being_executed Not None | event_type PREEMPTION (Válido)"""
+def test_case_event_is_departure_or_preemption_when_event_is_preemption_should_not_route_job(mock_execution_object, mock_event, mock_server):
+    mock_server.finish_execution = MagicMock()
+    mock_server.finish_execution.return_value = MOCK_NEW_JOB_BEING_EXECUTED
+    mock_event.type = PREEMPTION_EVENT
+
+    mock_execution_object._add_next_departure_event = MagicMock()
+    mock_execution_object._route_job_after_event = MagicMock()
+
+    mock_execution_object._case_event_is_departure_or_preemption(mock_event)
+
+    mock_execution_object._route_job_after_event.assert_not_called()
+    mock_execution_object._add_next_departure_event.assert_called_once()
+
+
+"""
+Particionamento do espaço de entrada para função _cancel_event() da classe Execution utilizando Each Choice Coverage:
+    fila: < COMPACTION_MIN_QUEUE_SIZE | >= COMPACTION_MIN_QUEUE_SIZE e proporção de eventos cancelados acima do limite
+"""
+
+"""fila < COMPACTION_MIN_QUEUE_SIZE (Válido)"""
+def test_cancel_event_when_queue_is_small_should_only_mark_event(mock_execution_object):
+    events = [MagicMock(canceled=False) for _ in range(2)]
+    for event_id, event in enumerate(events):
+        mock_execution_object.event_queue.push((VALID_TIME, event_id, event))
+
+    mock_execution_object._cancel_event(events[0])
+
+    assert events[0].canceled
+    assert len(mock_execution_object.event_queue) == 2
+    assert mock_execution_object.dead_events == 1
+    assert mock_execution_object.results.event_list_statistics.max_dead_event_ratio == 0.5
+
+"""fila >= COMPACTION_MIN_QUEUE_SIZE e proporção acima do limite (Válido)"""
+def test_cancel_event_when_dead_ratio_exceeds_threshold_should_compact_queue(mock_execution_object):
+    events = [MagicMock(canceled=False) for _ in range(COMPACTION_MIN_QUEUE_SIZE)]
+    for event_id, event in enumerate(events):
+        mock_execution_object.event_queue.push((VALID_TIME, event_id, event))
+
+    number_of_canceled_events = int(COMPACTION_DEAD_EVENT_RATIO * COMPACTION_MIN_QUEUE_SIZE) + 1
+    for event in events[:number_of_canceled_events]:
+        mock_execution_object._cancel_event(event)
+
+    assert len(mock_execution_object.event_queue) == COMPACTION_MIN_QUEUE_SIZE - number_of_canceled_events
+    assert mock_execution_object.dead_events == 0
+    assert mock_execution_object.results.event_list_statistics.compactions == 1
+    assert all(not mock_execution_object.event_queue.pop()[2].canceled for _ in range(len(mock_execution_object.event_queue)))
\ No newline at end of file
@@ -109,4 +109,23 @@ def test_normal_distribution_generation_when_both_parameters_are_valid_should_re
 
     assert isinstance(distribution, NormalDistribution)
     assert distribution._mu == POSITIVE_VALUE
-    assert distribution._sigma == POSITIVE_VALUE
\ No newline at end of file
+    assert distribution._sigma == POSITIVE_VALUE
+
+
+"""
+Particionamento do espaço de entrada para função from_spec() da classe Distribution utilizando Each Choice Coverage:
+    spec: Gerada por to_spec() | Tipo desconhecido
+"""
+
+"""spec Gerada por to_spec() (Válido)"""
+def test_from_spec_when_spec_comes_from_distribution_should_rebuild_it():
+    distribution = Distribution.from_spec(Distribution.uniform(lower_bound=ZERO_VALUE, upper_bound=POSITIVE_VALUE).to_spec())
+
+    assert isinstance(distribution, UniformDistribution)
+    assert distribution.to_spec() == {'type': 'uniform', 'lower_bound': ZERO_VALUE, 'upper_bound': POSITIVE_VALUE}
+
+"""spec Tipo desconhecido (Inválido)"""
+def test_from_spec_when_type_is_unknown_should_raise_exception():
+    with pytest.raises(ValueError):
+        Distribution.from_spec({'type': 'gamma', 'shape': POSITIVE_VALUE})
+
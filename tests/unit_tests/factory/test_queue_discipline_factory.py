@@ -91,4 +91,23 @@ def test_priority_queue_generation_when_preemption_is_false_should_return_proper
 
     assert isinstance(queue, PriorityQueue)
     assert queue.discipline == Discipline.PRIORITY
-    assert queue.with_preemption() == False
\ No newline at end of file
+    assert queue.with_preemption() == False
+
+
+"""
+Particionamento do espaço de entrada para função from_spec() da classe QueueDiscipline utilizando Each Choice Coverage:
+    spec: Gerada por to_spec() | Disciplina desconhecida
+"""
+
+"""spec Gerada por to_spec() (Válido)"""
+def test_from_spec_when_spec_comes_from_discipline_should_rebuild_it():
+    queue = QueueDiscipline.from_spec(QueueDiscipline.round_robin(VALID_PREEMPTION_TIME).to_spec())
+
+    assert isinstance(queue, RoundRobin)
+    assert queue.preemption_time == VALID_PREEMPTION_TIME
+
+"""spec Disciplina desconhecida (Inválido)"""
+def test_from_spec_when_discipline_is_unknown_should_raise_exception():
+    with pytest.raises(ValueError):
+        QueueDiscipline.from_spec({'discipline': 'random'})
+
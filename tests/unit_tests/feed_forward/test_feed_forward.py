@@ -0,0 +1,106 @@
+import pytest
+
+from qpy.distribution import Distribution
+from qpy.environment import Environment
+from qpy.feed_forward import FeedForwardExecution, is_feed_forward_eligible, topological_order
+from qpy.queue_discipline import QueueDiscipline
+
+
+MOCK_DISTRIBUTION = Distribution.constant(value=1)
+ARRIVAL_DISTRIBUTION = Distribution.constant(value=2)
+ROUTING_PROBABILITY = 0.5
+PRIORITIES = {1: 0.5, 2: 0.5}
+TOTAL_TIME = 10
+WARMUP = 0
+TIME_UNIT = 'seconds'
+
+
+def build_tandem(queue_discipline = None, number_of_servers: int = 3) -> Environment:
+    env = Environment()
+
+    for _ in range(number_of_servers):
+        env.add_server(MOCK_DISTRIBUTION, queue_discipline)
+    for server in range(number_of_servers - 1):
+        env.add_servers_connection(server, server + 1, 1)
+
+    env.add_entry_point(0, ARRIVAL_DISTRIBUTION)
+
+    return env
+
+
+"""
+Particionamento do espaço de entrada para função topological_order() utilizando Each Choice Coverage:
+    routing: Acíclico | Com ciclo
+"""
+
+"""routing Acíclico (Válido)"""
+def test_topological_order_when_routing_is_acyclic_should_sort_servers_after_their_sources():
+    env = build_tandem()
+    env.add_server(MOCK_DISTRIBUTION)
+    env.add_servers_connection(3, 0, 1)
+    env.add_entry_point(3, ARRIVAL_DISTRIBUTION)
+
+    assert topological_order(env.compile()) == [3, 0, 1, 2]
+
+"""routing Com ciclo (Válido)"""
+def test_topological_order_when_routing_has_cycle_should_return_none():
+    env = build_tandem()
+    env.add_servers_connection(2, 1, ROUTING_PROBABILITY)
+
+    assert topological_order(env.compile()) is None
+
+
+"""
+Particionamento do espaço de entrada para função is_feed_forward_eligible() utilizando Each Choice Coverage:
+    queue_discipline: FCFS | Outra
+    routing: Acíclico | Com ciclo | Para o próprio servidor
+    priorities: Sem prioridades | Com prioridades
+"""
+
+"""queue_discipline FCFS | routing Acíclico | priorities Sem prioridades (Válido)"""
+def test_is_feed_forward_eligible_when_model_is_fcfs_tandem_should_return_true():
+    assert is_feed_forward_eligible(build_tandem().compile())
+
+"""queue_discipline Outra (Válido)"""
+def test_is_feed_forward_eligible_when_queue_is_not_fcfs_should_return_false():
+    assert not is_feed_forward_eligible(build_tandem(QueueDiscipline.lcfs()).compile())
+
+"""routing Com ciclo (Válido)"""
+def test_is_feed_forward_eligible_when_routing_has_cycle_should_return_false():
+    env = build_tandem()
+    env.add_servers_connection(2, 0, ROUTING_PROBABILITY)
+
+    assert not is_feed_forward_eligible(env.compile())
+
+"""routing Para o próprio servidor (Válido)"""
+def test_is_feed_forward_eligible_when_server_routes_to_itself_should_return_false():
+    env = build_tandem()
+    env.add_servers_connection(2, 2, ROUTING_PROBABILITY)
+
+    assert not is_feed_forward_eligible(env.compile())
+
+"""priorities Com prioridades (Válido)"""
+def test_is_feed_forward_eligible_when_entry_point_has_priorities_should_return_false():
+    env = build_tandem()
+    env.add_entry_point(0, ARRIVAL_DISTRIBUTION, PRIORITIES)
+
+    assert not is_feed_forward_eligible(env.compile())
+
+
+"""
+Particionamento do espaço de entrada para função __init__() da classe FeedForwardExecution utilizando Each Choice Coverage:
+    plan: Elegível | Não elegível
+"""
+
+"""plan Não elegível (Inválido)"""
+def test_init_when_plan_is_not_eligible_should_raise_exception():
+    with pytest.raises(ValueError):
+        FeedForwardExecution(TOTAL_TIME, WARMUP, build_tandem(QueueDiscipline.lcfs()).compile(), TIME_UNIT)
+
+"""plan Não elegível (Inválido)"""
+def test_simulate_when_engine_is_feed_forward_and_model_is_not_eligible_should_raise_exception():
+    env = build_tandem()
+    env.add_servers_connection(2, 0, ROUTING_PROBABILITY)
+
+    with pytest.raises(ValueError):
+        env.simulate(time_in_seconds=TOTAL_TIME, warmup_time=WARMUP, engine='feed_forward')
@@ -6,6 +6,7 @@ from qpy.job import Job
 
 ARRIVAL_TIME = 5
 COMPLETION_TIME = 8
+SERVICE_STARTED_TIME = 6
 INITIAL_SERVER = 2
 JOB_ID = 1
 NEW_SERVER = 3
@@ -26,13 +27,14 @@ Particionamento do espaço de entrada para função serve() da classe Job utiliz
 def test_serve_when_job_waited_in_queue_should_append_queue_time(job_test_object):
     job_test_object.serve(service_started_time=COMPLETION_TIME)
 
-    assert job_test_object.queue_times_per_server[INITIAL_SERVER] == COMPLETION_TIME - ARRIVAL_TIME
+    assert job_test_object.queue_time_at_current_server == COMPLETION_TIME - ARRIVAL_TIME
+    assert job_test_object.total_queue_time == COMPLETION_TIME - ARRIVAL_TIME
 
 """service_started_time = 0 (Válido)"""
 def test_serve_when_job_doesnt_wait_should_remain_with_queue_time_zero(job_test_object):
     job_test_object.serve(service_started_time=ARRIVAL_TIME)
 
-    assert job_test_object.queue_times_per_server[INITIAL_SERVER] == 0
+    assert job_test_object.queue_time_at_current_server == 0
 
 """service_started_time < 0 (Inválido)"""
 def test_serve_when_job_is_executed_before_arrival_should_raise_exception(job_test_object):
@@ -48,17 +50,36 @@ Particionamento do espaço de entrada para função reroute() da classe Job util
 
 """completion_time >= 0 | new_server = None (Válido)"""
 def test_reroute_when_new_server_isnt_provided_should_compute_total_time(job_test_object):
-    job_test_object.reroute(completion_time=COMPLETION_TIME)
+    queue_time, time_in_server = job_test_object.reroute(completion_time=COMPLETION_TIME)
 
-    assert job_test_object.total_time_per_server[INITIAL_SERVER] == COMPLETION_TIME - ARRIVAL_TIME
+    assert queue_time == 0
+    assert time_in_server == COMPLETION_TIME - ARRIVAL_TIME
     assert job_test_object.current_server == INITIAL_SERVER
 
 """completion_time >= 0 | new_server >= 0 (Válido)"""
 def test_reroute_when_new_server_is_provided_should_switch_servers(job_test_object):
-    job_test_object.reroute(completion_time=COMPLETION_TIME, new_server=NEW_SERVER)
+    queue_time, time_in_server = job_test_object.reroute(completion_time=COMPLETION_TIME, new_server=NEW_SERVER)
 
-    assert job_test_object.total_time_per_server[INITIAL_SERVER] == COMPLETION_TIME - ARRIVAL_TIME
+    assert time_in_server == COMPLETION_TIME - ARRIVAL_TIME
     assert job_test_object.current_server == NEW_SERVER
+    assert job_test_object.arrival_time_at_current_server == COMPLETION_TIME
+
+"""completion_time >= 0 | new_server = 0 (Válido)"""
+def test_reroute_when_new_server_is_zero_should_switch_servers(job_test_object):
+    job_test_object.reroute(completion_time=COMPLETION_TIME, new_server=0)
+
+    assert job_test_object.current_server == 0
+
+"""completion_time >= 0 | new_server >= 0 (Válido)"""
+def test_reroute_when_job_waited_should_return_visit_queue_time_and_reset_it(job_test_object):
+    job_test_object.serve(service_started_time=SERVICE_STARTED_TIME)
+
+    queue_time, time_in_server = job_test_object.reroute(completion_time=COMPLETION_TIME, new_server=NEW_SERVER)
+
+    assert queue_time == SERVICE_STARTED_TIME - ARRIVAL_TIME
+    assert time_in_server == COMPLETION_TIME - ARRIVAL_TIME
+    assert job_test_object.queue_time_at_current_server == 0
+    assert job_test_object.total_queue_time == SERVICE_STARTED_TIME - ARRIVAL_TIME
 
 """completion_time < 0 | new_server >= 0 (Inválido)"""
 def test_reroute_when_completion_time_is_invalid_should_raise_exception(job_test_object):
@@ -68,4 +89,37 @@ def test_reroute_when_completion_time_is_invalid_should_raise_exception(job_test
 """completion_time >= 0 | new_server < 0 (Inválido)"""
 def test_reroute_when_new_server_is_invalid_should_raise_exception(job_test_object):
     with pytest.raises(ValueError):
-        job_test_object.reroute(completion_time=COMPLETION_TIME, new_server=NEGATIVE_VALUE)
\ No newline at end of file
+        job_test_object.reroute(completion_time=COMPLETION_TIME, new_server=NEGATIVE_VALUE)
+
+"""
+Particionamento do espaço de entrada para função requeue() da classe Job utilizando Each Choice Coverage:
+    time: >= instante de chegada
+"""
+
+"""time >= instante de chegada (Válido)"""
+def test_requeue_when_job_is_preempted_should_count_only_new_wait_as_queue_time(job_test_object):
+    job_test_object.serve(service_started_time=ARRIVAL_TIME)
+    job_test_object.requeue(time=SERVICE_STARTED_TIME)
+    job_test_object.serve(service_started_time=COMPLETION_TIME)
+
+    assert job_test_object.queue_time_at_current_server == COMPLETION_TIME - SERVICE_STARTED_TIME
+    assert job_test_object.arrival_time_at_current_server == ARRIVAL_TIME
+
+
+"""
+Particionamento do espaço de entrada para função restart() da classe Job utilizando Each Choice Coverage:
+    job: Já atendido
+"""
+
+"""job Já atendido (Válido)"""
+def test_restart_when_job_was_served_should_reset_state_for_new_cycle(job_test_object):
+    job_test_object.serve(service_started_time=SERVICE_STARTED_TIME)
+    job_test_object.reroute(completion_time=COMPLETION_TIME)
+
+    job_test_object.restart(id=JOB_ID + 1, arrival_time=COMPLETION_TIME, current_server=NEW_SERVER, priority=PRIORITY)
+
+    assert job_test_object.id == JOB_ID + 1
+    assert job_test_object.arrival_time == COMPLETION_TIME
+    assert job_test_object.current_server == NEW_SERVER
+    assert job_test_object.total_queue_time == 0
+    assert job_test_object.queue_time_at_current_server == 0
@@ -0,0 +1,78 @@
+import pytest
+
+from qpy.distribution import Distribution
+from qpy.environment import Environment
+from qpy.lindley import LindleyExecution, is_lindley_eligible
+from qpy.queue_discipline import QueueDiscipline
+
+
+MOCK_DISTRIBUTION = Distribution.constant(value=1)
+ARRIVAL_DISTRIBUTION = Distribution.constant(value=2)
+ROUTING_PROBABILITY = 0.5
+PRIORITIES = {1: 0.5, 2: 0.5}
+TOTAL_TIME = 10
+WARMUP = 0
+TIME_UNIT = 'seconds'
+
+
+def build_environment(queue_discipline = None, number_of_servers: int = 1) -> Environment:
+    env = Environment()
+
+    for _ in range(number_of_servers):
+        env.add_server(MOCK_DISTRIBUTION, queue_discipline)
+
+    env.add_entry_point(0, ARRIVAL_DISTRIBUTION)
+
+    return env
+
+
+"""
+Particionamento do espaço de entrada para função is_lindley_eligible() utilizando Each Choice Coverage:
+    queue_discipline: FCFS | Outra
+    servers: Um | Vários
+    routing: Sem roteamento | Com roteamento
+    priorities: Sem prioridades | Com prioridades
+"""
+
+"""queue_discipline FCFS | servers Um | routing Sem roteamento | priorities Sem prioridades (Válido)"""
+def test_is_lindley_eligible_when_model_is_single_fcfs_station_should_return_true():
+    assert is_lindley_eligible(build_environment().compile())
+
+"""queue_discipline Outra (Válido)"""
+def test_is_lindley_eligible_when_queue_is_not_fcfs_should_return_false():
+    assert not is_lindley_eligible(build_environment(QueueDiscipline.lcfs()).compile())
+
+"""servers Vários (Válido)"""
+def test_is_lindley_eligible_when_there_are_many_servers_should_return_false():
+    assert not is_lindley_eligible(build_environment(number_of_servers=2).compile())
+
+"""routing Com roteamento (Válido)"""
+def test_is_lindley_eligible_when_server_routes_back_should_return_false():
+    env = build_environment()
+    env.add_servers_connection(0, 0, ROUTING_PROBABILITY)
+
+    assert not is_lindley_eligible(env.compile())
+
+"""priorities Com prioridades (Válido)"""
+def test_is_lindley_eligible_when_entry_point_has_priorities_should_return_false():
+    env = Environment()
+    env.add_server(MOCK_DISTRIBUTION)
+    env.add_entry_point(0, ARRIVAL_DISTRIBUTION, PRIORITIES)
+
+    assert not is_lindley_eligible(env.compile())
+
+
+"""
+Particionamento do espaço de entrada para função __init__() da classe LindleyExecution utilizando Each Choice Coverage:
+    plan: Elegível | Não elegível
+"""
+
+"""plan Não elegível (Inválido)"""
+def test_init_when_plan_is_not_eligible_should_raise_exception():
+    with pytest.raises(ValueError):
+        LindleyExecution(TOTAL_TIME, WARMUP, build_environment(number_of_servers=2).compile(), TIME_UNIT)
+
+"""plan Não elegível (Inválido)"""
+def test_simulate_when_engine_is_lindley_and_model_is_not_eligible_should_raise_exception():
+    with pytest.raises(ValueError):
+        build_environment(QueueDiscipline.lcfs()).simulate(time_in_seconds=TOTAL_TIME, warmup_time=WARMUP, engine='lindley')
@@ -1,6 +1,7 @@
 import pytest
 
 
+from qpy.estimation import BATCH_MEANS_MAXIMUM_BATCHES
 from qpy.job import Job
 from qpy.metrics import EnvironmentMetrics
 
@@ -42,7 +43,7 @@ def environment_metrics_test_object_with_informations():
 def job_mock_object():
     job = Job(JOB_ID, JOB_ARRIVAL_TIME, JOB_CURRENT_SERVER, JOB_PRIORITY)
 
-    job.queue_times_per_server[JOB_CURRENT_SERVER] = 2
+    job.total_queue_time = 2
 
     return job
 
@@ -57,7 +58,7 @@ Particionamento do espaço de entrada para função compute_departure() da class
 def test_compute_departure_when_time_and_job_are_valid_should_update_metrics(environment_metrics_test_object_with_informations, job_mock_object):
     expected_number_of_processed_jobs = NUMBER_OF_PROCESSED_JOBS + 1
     expected_cumulative_time_in_system = CUMULATIVE_TIME_IN_SYSTEM + (TIME_PARAMETER - job_mock_object.arrival_time)
-    expected_cumulative_queue_times = CUMULATIVE_QUEUE_TIMES + sum(job_mock_object.queue_times_per_server.values())
+    expected_cumulative_queue_times = CUMULATIVE_QUEUE_TIMES + job_mock_object.total_queue_time
     expected_current_number_of_jobs = CURRENT_NUMBER_OF_JOBS - 1
 
     environment_metrics_test_object_with_informations.compute_departure(job_mock_object, time=TIME_PARAMETER)
@@ -102,3 +103,27 @@ def test_get_mean_time_in_system_when_jobs_processed_should_return_mean(environm
     expected_mean = CUMULATIVE_TIME_IN_SYSTEM / NUMBER_OF_PROCESSED_JOBS
     
     assert environment_metrics_test_object_with_informations.get_mean_time_in_system() == expected_mean
+
+
+"""
+Particionamento do espaço de entrada para função get_time_in_system_confidence_interval() da classe EnvironmentMetrics utilizando Each Choice Coverage:
+    batch_means: False | True
+"""
+
+"""batch_means False (Válido)"""
+def test_get_time_in_system_confidence_interval_when_batch_means_are_disabled_should_return_none(environment_metrics_empty_test_object, job_mock_object):
+    environment_metrics_empty_test_object.compute_departure(job=job_mock_object, time=TIME_PARAMETER)
+
+    assert environment_metrics_empty_test_object.get_time_in_system_confidence_interval() is None
+
+"""batch_means True (Válido)"""
+def test_get_time_in_system_confidence_interval_when_batch_means_are_enabled_should_return_interval(job_mock_object):
+    metrics = EnvironmentMetrics(TOTAL_SIMULATION_TIME, batch_means=True)
+
+    for _ in range(BATCH_MEANS_MAXIMUM_BATCHES):
+        metrics.compute_departure(job=job_mock_object, time=TIME_PARAMETER)
+
+    confidence_interval = metrics.get_time_in_system_confidence_interval()
+
+    assert (confidence_interval.mean, confidence_interval.half_width) == (TIME_PARAMETER - JOB_ARRIVAL_TIME, 0)
+
@@ -128,3 +128,26 @@ def test_get_throughput_when_total_time_is_valid_should_return_throughput(genera
     expected_throughput = NUMBER_OF_PROCESSED_JOBS / TOTAL_SIMULATION_TIME
 
     assert general_metrics_test_object_with_informations.get_throughput() == expected_throughput
+
+
+"""
+Particionamento do espaço de entrada para função get_number_of_jobs_in_system_confidence_interval() da classe GeneralMetrics utilizando Each Choice Coverage:
+    batch_means: False | True
+"""
+
+"""batch_means False (Válido)"""
+def test_get_number_of_jobs_in_system_confidence_interval_when_batch_means_are_disabled_should_return_none(general_metrics_empty_test_object):
+    general_metrics_empty_test_object.compute_arrival(TIME_PARAMETER)
+
+    assert general_metrics_empty_test_object.get_number_of_jobs_in_system_confidence_interval() is None
+
+"""batch_means True (Válido)"""
+def test_get_number_of_jobs_in_system_confidence_interval_when_batch_means_are_enabled_should_leave_initial_empty_period_out():
+    metrics = GeneralMetrics(TOTAL_SIMULATION_TIME, batch_means=True)
+
+    for arrival in range(0, NUMBER_OF_PROCESSED_JOBS * 10, 2):
+        metrics.compute_arrival(CURRENT_TIME + arrival)
+        metrics._count_number_of_jobs(CURRENT_TIME + arrival + 1, 'departure')
+
+    assert metrics.get_number_of_jobs_in_system_confidence_interval().mean == 0.5
+
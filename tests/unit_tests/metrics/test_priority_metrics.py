@@ -1,6 +1,7 @@
 import pytest
 
 
+from qpy.estimation import BATCH_MEANS_MAXIMUM_BATCHES
 from qpy.job import Job
 from qpy.metrics import PriorityMetrics
 
@@ -16,7 +17,7 @@ JOB_ID = 1
 JOB_ARRIVAL_TIME = 40
 SERVER_ID = 1
 JOB_PRIORITY = 1
-JOB_QUEUE_TIMES_PER_SERVER = {SERVER_ID: 5}
+JOB_TOTAL_QUEUE_TIME = 5
 
 @pytest.fixture
 def priority_metrics_empty_test_object():
@@ -35,7 +36,7 @@ def priority_metrics_test_object_with_informations():
 @pytest.fixture
 def job_mock_object():
     job = Job(JOB_ID, JOB_ARRIVAL_TIME, SERVER_ID, JOB_PRIORITY)
-    job.queue_times_per_server = JOB_QUEUE_TIMES_PER_SERVER
+    job.total_queue_time = JOB_TOTAL_QUEUE_TIME
     return job
 
 
@@ -49,7 +50,7 @@ Particionamento do espaço de entrada para função compute_departure() da class
 def test_compute_departure_when_time_and_job_are_valid_should_update_metrics(priority_metrics_test_object_with_informations, job_mock_object):
     expected_number_of_processed_jobs = NUMBER_OF_PROCESSED_JOBS + 1
     expected_cumulative_time_in_system = CUMULATIVE_TIME_IN_SYSTEM + (TIME_PARAMETER - JOB_ARRIVAL_TIME)
-    expected_cumulative_queue_times = CUMULATIVE_QUEUE_TIMES + JOB_QUEUE_TIMES_PER_SERVER[SERVER_ID]
+    expected_cumulative_queue_times = CUMULATIVE_QUEUE_TIMES + JOB_TOTAL_QUEUE_TIME
 
     priority_metrics_test_object_with_informations.compute_departure(job=job_mock_object, time=TIME_PARAMETER)
 
@@ -97,3 +98,28 @@ def test_get_mean_time_in_system_when_jobs_were_processed_should_return_mean(pri
     expected_mean = CUMULATIVE_TIME_IN_SYSTEM / NUMBER_OF_PROCESSED_JOBS
 
     assert priority_metrics_test_object_with_informations.get_mean_time_in_system() == expected_mean
+
+
+"""
+Particionamento do espaço de entrada para função get_time_in_system_confidence_interval() da classe PriorityMetrics utilizando Each Choice Coverage:
+    batch_means: False | True
+"""
+
+"""batch_means False (Válido)"""
+def test_get_time_in_system_confidence_interval_when_batch_means_are_disabled_should_return_none(priority_metrics_empty_test_object, job_mock_object):
+    priority_metrics_empty_test_object.compute_departure(job=job_mock_object, time=TIME_PARAMETER)
+
+    assert priority_metrics_empty_test_object.get_time_in_system_confidence_interval() is None
+
+"""batch_means True (Válido)"""
+def test_get_time_in_system_confidence_interval_when_batch_means_are_enabled_should_return_interval(job_mock_object):
+    metrics = PriorityMetrics(TOTAL_SIMULATION_TIME, batch_means=True)
+
+    for departure in range(BATCH_MEANS_MAXIMUM_BATCHES):
+        job_mock_object.arrival_time = JOB_ARRIVAL_TIME + departure
+        metrics.compute_departure(job=job_mock_object, time=TIME_PARAMETER + departure)
+
+    assert metrics.get_time_in_system_confidence_interval() == (TIME_PARAMETER - JOB_ARRIVAL_TIME, 0, 0)
+    assert metrics.get_queue_time_confidence_interval() == (JOB_TOTAL_QUEUE_TIME, 0, 0)
+    assert metrics.get_throughput_confidence_interval().mean == pytest.approx(BATCH_MEANS_MAXIMUM_BATCHES / (TIME_PARAMETER - JOB_ARRIVAL_TIME + BATCH_MEANS_MAXIMUM_BATCHES - 1), abs=1e-4)
+
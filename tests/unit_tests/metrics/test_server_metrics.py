@@ -1,7 +1,7 @@
 import pytest
 
 
-from qpy.job import Job
+from qpy.estimation import BATCH_MEANS_MAXIMUM_BATCHES
 from qpy.metrics import ServerMetrics
 
 
@@ -18,12 +18,8 @@ CUMULATIVE_SERVER_BUSY_TIME = 80
 CUMULATIVE_VISITS_PER_JOB = 5
 ZERO_VALUE = 0
 NEGATIVE_VALUE = -1
-JOB_ID = 1
-JOB_ARRIVAL_TIME = 55
-JOB_PRIORITY = 1
-JOB_QUEUE_TIMES_PER_SERVER = {SERVER_ID: 5}
-JOB_TOTAL_TIME_PER_SERVER = {SERVER_ID: 12}
-JOB_TOTAL_VISITS_PER_SERVER = {SERVER_ID: 2}
+VISIT_QUEUE_TIME = 5
+VISIT_TIME_IN_SERVER = 12
 
 @pytest.fixture
 def server_metrics_empty_test_object():
@@ -45,16 +41,6 @@ def server_metrics_test_object_with_informations():
 
     return metrics
 
-@pytest.fixture
-def job_mock_object():
-    job = Job(JOB_ID, JOB_ARRIVAL_TIME, SERVER_ID, JOB_PRIORITY)
-
-    job.queue_times_per_server = JOB_QUEUE_TIMES_PER_SERVER
-    job.total_time_per_server = JOB_TOTAL_TIME_PER_SERVER
-    job.total_visits_per_server = JOB_TOTAL_VISITS_PER_SERVER
-
-    return job
-
 
 """
 Particionamento do espaço de entrada para função compute_departure() da classe ServerMetrics utilizando Each Choice Coverage:
@@ -88,30 +74,63 @@ def test_compute_departure_when_time_is_none_should_raise_exception(server_metri
 
 
 """
-Particionamento do espaço de entrada para função compute_environment_departure() da classe ServerMetrics utilizando Each Choice Coverage:
-    job: Válido | None
+Particionamento do espaço de entrada para função compute_visit() da classe ServerMetrics utilizando Each Choice Coverage:
+    queue_time: 0 | > 0 | < 0 | None
+    time_in_server: > 0 | < 0
 """
 
-"""job Válido (Válido)"""
-def test_compute_environment_departure_when_job_is_valid_should_update_metrics(server_metrics_test_object_with_informations, job_mock_object):
-    expected_number_of_processed_jobs_in_system = NUMBER_OF_PROCESSED_JOBS + 1
-    expected_cumulative_queue_times = CUMULATIVE_QUEUE_TIMES + job_mock_object.queue_times_per_server[SERVER_ID]
-    expected_cumulative_time_in_server = CUMULATIVE_TIME_IN_SERVER + job_mock_object.total_time_per_server[SERVER_ID]
-    expected_cumulative_server_busy_time = CUMULATIVE_SERVER_BUSY_TIME + (job_mock_object.total_time_per_server[SERVER_ID] - job_mock_object.queue_times_per_server[SERVER_ID])
-    expected_cumulative_visits_per_job = CUMULATIVE_VISITS_PER_JOB + job_mock_object.total_visits_per_server[SERVER_ID]
+"""queue_time > 0 | time_in_server > 0 (Válido)"""
+def test_compute_visit_when_times_are_valid_should_update_metrics(server_metrics_test_object_with_informations):
+    server_metrics_test_object_with_informations.compute_visit(queue_time=VISIT_QUEUE_TIME, time_in_server=VISIT_TIME_IN_SERVER)
 
-    server_metrics_test_object_with_informations.compute_environment_departure(job=job_mock_object)
+    assert server_metrics_test_object_with_informations.total_number_of_processed_jobs_in_system == NUMBER_OF_PROCESSED_JOBS
+    assert server_metrics_test_object_with_informations.cumulative_queue_times == CUMULATIVE_QUEUE_TIMES + VISIT_QUEUE_TIME
+    assert server_metrics_test_object_with_informations.cumulative_time_in_server == CUMULATIVE_TIME_IN_SERVER + VISIT_TIME_IN_SERVER
+    assert server_metrics_test_object_with_informations.cumulative_server_busy_time == CUMULATIVE_SERVER_BUSY_TIME + (VISIT_TIME_IN_SERVER - VISIT_QUEUE_TIME)
+    assert server_metrics_test_object_with_informations.cumulative_visits_per_job == CUMULATIVE_VISITS_PER_JOB + 1
 
-    assert server_metrics_test_object_with_informations.total_number_of_processed_jobs_in_system == expected_number_of_processed_jobs_in_system
-    assert server_metrics_test_object_with_informations.cumulative_queue_times == expected_cumulative_queue_times
-    assert server_metrics_test_object_with_informations.cumulative_time_in_server == expected_cumulative_time_in_server
-    assert server_metrics_test_object_with_informations.cumulative_server_busy_time == expected_cumulative_server_busy_time
-    assert server_metrics_test_object_with_informations.cumulative_visits_per_job == expected_cumulative_visits_per_job
+"""queue_time = 0 (Válido)"""
+def test_compute_visit_when_job_didnt_wait_should_count_whole_visit_as_busy_time(server_metrics_empty_test_object):
+    server_metrics_empty_test_object.compute_visit(queue_time=ZERO_VALUE, time_in_server=VISIT_TIME_IN_SERVER)
+
+    assert server_metrics_empty_test_object.cumulative_server_busy_time == VISIT_TIME_IN_SERVER
+
+"""queue_time < 0 (Inválido)"""
+def test_compute_visit_when_queue_time_is_negative_should_raise_exception(server_metrics_empty_test_object):
+    with pytest.raises(ValueError):
+        server_metrics_empty_test_object.compute_visit(queue_time=NEGATIVE_VALUE, time_in_server=VISIT_TIME_IN_SERVER)
 
-"""job = None (Inválido)"""
-def test_compute_environment_departure_when_job_is_none_should_raise_exception(server_metrics_empty_test_object):
+"""queue_time = None (Inválido)"""
+def test_compute_visit_when_queue_time_is_none_should_raise_exception(server_metrics_empty_test_object):
     with pytest.raises(TypeError):
-        server_metrics_empty_test_object.compute_environment_departure(job=None)
+        server_metrics_empty_test_object.compute_visit(queue_time=None, time_in_server=VISIT_TIME_IN_SERVER)
+
+"""time_in_server < 0 (Inválido)"""
+def test_compute_visit_when_time_in_server_is_negative_should_raise_exception(server_metrics_empty_test_object):
+    with pytest.raises(ValueError):
+        server_metrics_empty_test_object.compute_visit(queue_time=ZERO_VALUE, time_in_server=NEGATIVE_VALUE)
+
+
+"""
+Particionamento do espaço de entrada para função compute_environment_departures() da classe ServerMetrics utilizando Each Choice Coverage:
+    number_of_jobs: 0 | > 0
+"""
+
+"""number_of_jobs > 0 (Válido)"""
+def test_compute_environment_departures_when_jobs_left_the_system_should_only_count_them(server_metrics_test_object_with_informations):
+    server_metrics_test_object_with_informations.compute_environment_departures(number_of_jobs=3, time_in_server=ZERO_VALUE, queue_time=ZERO_VALUE, visits=ZERO_VALUE)
+
+    assert server_metrics_test_object_with_informations.total_number_of_processed_jobs_in_system == NUMBER_OF_PROCESSED_JOBS + 3
+    assert server_metrics_test_object_with_informations.cumulative_time_in_server == CUMULATIVE_TIME_IN_SERVER
+    assert server_metrics_test_object_with_informations.cumulative_visits_per_job == CUMULATIVE_VISITS_PER_JOB
+
+"""number_of_jobs = 0 (Válido)"""
+def test_compute_environment_departures_when_only_visits_are_provided_should_add_them(server_metrics_empty_test_object):
+    server_metrics_empty_test_object.compute_environment_departures(number_of_jobs=ZERO_VALUE, time_in_server=VISIT_TIME_IN_SERVER, queue_time=VISIT_QUEUE_TIME, visits=2)
+
+    assert server_metrics_empty_test_object.total_number_of_processed_jobs_in_system == 0
+    assert server_metrics_empty_test_object.cumulative_server_busy_time == VISIT_TIME_IN_SERVER - VISIT_QUEUE_TIME
+    assert server_metrics_empty_test_object.cumulative_visits_per_job == 2
 
 
 """
@@ -211,4 +230,27 @@ def test_get_demand_when_no_jobs_were_processed_should_return_zero(server_metric
 def test_get_demand_when_jobs_were_processed_should_return_demand(server_metrics_test_object_with_informations):
     expected_demand = (CUMULATIVE_TIME_IN_SERVER - CUMULATIVE_QUEUE_TIMES) / NUMBER_OF_PROCESSED_JOBS
 
-    assert server_metrics_test_object_with_informations.get_demand() == expected_demand
\ No newline at end of file
+    assert server_metrics_test_object_with_informations.get_demand() == expected_demand
+
+
+"""
+Particionamento do espaço de entrada para função get_server_utilization_confidence_interval() da classe ServerMetrics utilizando Each Choice Coverage:
+    batch_means: False | True
+"""
+
+"""batch_means False (Válido)"""
+def test_get_server_utilization_confidence_interval_when_batch_means_are_disabled_should_return_none(server_metrics_empty_test_object):
+    server_metrics_empty_test_object.compute_visit(queue_time=ZERO_VALUE, time_in_server=VISIT_TIME_IN_SERVER)
+
+    assert server_metrics_empty_test_object.get_server_utilization_confidence_interval() is None
+
+"""batch_means True (Válido)"""
+def test_get_server_utilization_confidence_interval_when_batch_means_are_enabled_should_return_busy_fraction():
+    metrics = ServerMetrics(SERVER_ID, TOTAL_SIMULATION_TIME, batch_means=True)
+
+    for visit in range(1, BATCH_MEANS_MAXIMUM_BATCHES + 1):
+        metrics.compute_departure(time=visit * 2 * VISIT_TIME_IN_SERVER)
+        metrics.compute_visit(queue_time=VISIT_TIME_IN_SERVER, time_in_server=2 * VISIT_TIME_IN_SERVER)
+
+    assert metrics.get_server_utilization_confidence_interval().mean == 0.5
+
@@ -84,4 +84,22 @@ def test_add_servers_connection_when_destination_server_id_is_negative_should_ra
 """origin_server_id >= 0 | destination_server_id >= 0 | routing_probability < 0 (Inválido)"""
 def test_add_servers_connection_when_routing_probability_is_negative_should_raise_exception(base_network_with_servers):
     with pytest.raises(ValueError):
-        base_network_with_servers.add_servers_connection(origin_server_id=ORIGIN_SERVER_ID, destination_server_id=DESTINATION_SERVER_ID, routing_probability=NEGATIVE_VALUE)
\ No newline at end of file
+        base_network_with_servers.add_servers_connection(origin_server_id=ORIGIN_SERVER_ID, destination_server_id=DESTINATION_SERVER_ID, routing_probability=NEGATIVE_VALUE)
+
+"""
+Particionamento do espaço de entrada para função validate() da classe BaseNetwork utilizando Each Choice Coverage:
+    destinations: Válido | Inválido
+"""
+
+"""destinations Válido (Válido)"""
+def test_validate_when_connections_are_valid_should_not_raise_exception(base_network_with_servers):
+    base_network_with_servers.add_servers_connection(ORIGIN_SERVER_ID, DESTINATION_SERVER_ID, ROUTING_PROBABILITY)
+
+    base_network_with_servers.validate()
+
+"""destinations Inválido (Inválido)"""
+def test_validate_when_destination_does_not_exist_should_raise_exception(base_network_with_servers):
+    base_network_with_servers.servers[ORIGIN_SERVER_ID].destinations[INVALID_SERVER_ID] = ROUTING_PROBABILITY
+
+    with pytest.raises(ValueError):
+        base_network_with_servers.validate()
@@ -111,4 +111,20 @@ def test_generate_jobs_when_there_are_terminals_should_return_jobs(closed_networ
 
     generated_jobs = closed_network_with_servers.generate_jobs()
 
-    assert len(generated_jobs) == expected_number_of_jobs
\ No newline at end of file
+    assert len(generated_jobs) == expected_number_of_jobs
+
+"""
+Particionamento do espaço de entrada para função validate() da classe ClosedNetwork utilizando Each Choice Coverage:
+    entry_point_routing: Sem rotas | Válido
+"""
+
+"""entry_point_routing Sem rotas (Inválido)"""
+def test_validate_when_there_is_no_terminal_route_should_raise_exception(closed_network_with_servers):
+    with pytest.raises(ValueError):
+        closed_network_with_servers.validate()
+
+"""entry_point_routing Válido (Válido)"""
+def test_validate_when_terminal_routing_is_valid_should_not_raise_exception(closed_network_with_servers):
+    closed_network_with_servers.add_terminals_routing_probability(destination_server_id=VALID_SERVER_ID, probability=PROBABILITY)
+
+    closed_network_with_servers.validate()
@@ -1,5 +1,6 @@
 import pytest
 
+from qpy.event_list import HeapEventList
 from qpy.network import OpenNetwork
 from qpy.distribution import Distribution
 
@@ -86,6 +87,16 @@ def test_generate_jobs_when_arrivals_exist_should_generate_jobs(open_network_wit
 
     assert len(jobs) > 0
 
+"""arrivals Não vazio (duas entradas) | time_limit > 0 (Válido)"""
+def test_generate_jobs_when_arrivals_exist_should_keep_one_pending_arrival_per_entry_point(open_network_with_servers):
+    open_network_with_servers.add_entry_point(VALID_SERVER_ID, arrival_distribution=MOCK_DISTRIBUTION)
+    open_network_with_servers.add_entry_point(VALID_SERVER_ID + 1, arrival_distribution=MOCK_DISTRIBUTION)
+
+    jobs = open_network_with_servers.generate_jobs(time_limit=TIME_LIMIT)
+
+    assert len(jobs) == 2
+    assert sorted(event.entry_point for _, _, event in jobs) == [0, 1]
+
 """arrivals Não vazio | time_limit = 0 (Válido)"""
 def test_generate_jobs_when_time_limit_is_zero_should_return_empty(open_network_with_servers):
     open_network_with_servers.add_entry_point(VALID_SERVER_ID, arrival_distribution=MOCK_DISTRIBUTION)
@@ -99,4 +110,32 @@ def test_generate_jobs_when_time_limit_is_negative_should_raise_exception(open_n
     open_network_with_servers.add_entry_point(VALID_SERVER_ID, arrival_distribution=MOCK_DISTRIBUTION)
 
     with pytest.raises(ValueError):
-        open_network_with_servers.generate_jobs(time_limit=NEGATIVE_VALUE)
\ No newline at end of file
+        open_network_with_servers.generate_jobs(time_limit=NEGATIVE_VALUE)
+
+
+"""
+Particionamento do espaço de entrada para função next_arrival() da classe OpenNetwork utilizando Each Choice Coverage:
+    time: próxima chegada < time_limit | próxima chegada >= time_limit
+"""
+
+"""próxima chegada < time_limit (Válido)"""
+def test_next_arrival_when_next_arrival_is_within_limit_should_schedule_one_event(open_network_with_servers):
+    open_network_with_servers.add_entry_point(VALID_SERVER_ID, arrival_distribution=MOCK_DISTRIBUTION)
+    event_queue = HeapEventList(open_network_with_servers.generate_jobs(time_limit=TIME_LIMIT))
+
+    event_count = open_network_with_servers.next_arrival(event_queue, 1, 0, 1)
+
+    assert event_count == 2
+    assert len(event_queue) == 2
+    assert event_queue.pop()[0] == 1
+    assert event_queue.pop()[0] == 2
+
+"""próxima chegada >= time_limit (Válido)"""
+def test_next_arrival_when_next_arrival_exceeds_limit_should_not_schedule_event(open_network_with_servers):
+    open_network_with_servers.add_entry_point(VALID_SERVER_ID, arrival_distribution=MOCK_DISTRIBUTION)
+    event_queue = HeapEventList(open_network_with_servers.generate_jobs(time_limit=TIME_LIMIT))
+
+    event_count = open_network_with_servers.next_arrival(event_queue, TIME_LIMIT, 0, 1)
+
+    assert event_count == 1
+    assert len(event_queue) == 1
\ No newline at end of file
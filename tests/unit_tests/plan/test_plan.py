@@ -0,0 +1,133 @@
+import pytest
+
+from unittest.mock import patch
+from qpy.distribution import Distribution
+from qpy.plan import DiscreteSampler, ExecutionPlan, compile_entry_points, compile_server, compile_terminals
+from qpy.queue_discipline import Discipline, QueueDiscipline
+from qpy.time_resolution import DEFAULT_RESOLUTION
+
+
+MOCK_DISTRIBUTION = Distribution.constant(value=1)
+VALUES = ('end', 1, 2)
+PROBABILITIES = (0.2, 0.3, 0.5)
+PREEMPTION_TIME = 2
+SERVER_ID = 0
+NUMBER_OF_TERMINALS = 3
+SEED = 11
+NUMBER_OF_SAMPLES = 10
+
+
+"""
+Particionamento do espaço de entrada para função draw() da classe DiscreteSampler utilizando Each Choice Coverage:
+    random: Parte própria da coluna | Parte do alias da coluna
+    values: Vazio | Não vazio
+"""
+
+"""random Parte própria da coluna | values Não vazio (Válido)"""
+def test_draw_when_random_falls_in_column_own_part_should_return_column_value():
+    with patch('qpy.plan.random.random', return_value=0.1):
+        assert DiscreteSampler(VALUES, PROBABILITIES).draw() == 'end'
+
+"""random Parte do alias da coluna | values Não vazio (Válido)"""
+def test_draw_when_random_falls_in_column_alias_part_should_return_alias_value():
+    with patch('qpy.plan.random.random', return_value=0.25):
+        assert DiscreteSampler(VALUES, PROBABILITIES).draw() == 2
+
+"""values Vazio (Válido)"""
+def test_draw_when_there_are_no_values_should_return_none():
+    assert DiscreteSampler((), ()).draw() is None
+
+"""Testando que a tabela de alias preserva as probabilidades de cada valor"""
+def test_alias_table_should_preserve_probabilities():
+    sampler = DiscreteSampler(VALUES, PROBABILITIES)
+    size = len(VALUES)
+
+    for index, probability in enumerate(PROBABILITIES):
+        mass = sampler.acceptance[index] / size + sum((1 - sampler.acceptance[column]) / size for column in range(size) if sampler.aliases[column] == index)
+
+        assert mass == pytest.approx(probability)
+
+"""Testando que o array da CDF não pode ser alterado"""
+def test_cdf_should_be_read_only():
+    sampler = DiscreteSampler(VALUES, PROBABILITIES)
+
+    with pytest.raises(ValueError):
+        sampler.cdf[0] = 1
+
+
+"""
+Particionamento do espaço de entrada para função compile_server() utilizando Each Choice Coverage:
+    queue: FCFS | SRT com preempção | Round Robin
+"""
+
+"""queue FCFS (Válido)"""
+def test_compile_server_when_queue_is_fcfs_should_not_preempt():
+    plan = compile_server(SERVER_ID, MOCK_DISTRIBUTION, QueueDiscipline.fcfs(), {'end': 1.0})
+
+    assert plan.discipline == Discipline.FCFS.value
+    assert not plan.preemptive
+    assert plan.preemption_time is None
+
+"""queue SRT com preempção (Válido)"""
+def test_compile_server_when_queue_is_srt_with_preemption_should_preempt():
+    plan = compile_server(SERVER_ID, MOCK_DISTRIBUTION, QueueDiscipline.srt(with_preemption=True), {'end': 1.0})
+
+    assert plan.discipline == Discipline.SRT.value
+    assert plan.preemptive
+
+"""queue Round Robin (Válido)"""
+def test_compile_server_when_queue_is_round_robin_should_store_preemption_time():
+    plan = compile_server(SERVER_ID, MOCK_DISTRIBUTION, QueueDiscipline.round_robin(PREEMPTION_TIME), {'end': 1.0})
+
+    assert not plan.preemptive
+    assert plan.preemption_time == PREEMPTION_TIME
+
+
+"""
+Particionamento do espaço de entrada para função compile_terminals() utilizando Each Choice Coverage:
+    routing: Com 'end' | Sem 'end'
+"""
+
+"""routing Com 'end' (Válido)"""
+def test_compile_terminals_when_routing_has_end_should_normalize_without_it():
+    plan = compile_terminals(NUMBER_OF_TERMINALS, MOCK_DISTRIBUTION, {'end': 0.5, 0: 0.25, 1: 0.25}, None)
+
+    assert plan.routing.values == (0, 1)
+    assert plan.routing.cdf.tolist() == [0.5, 1.0]
+
+"""routing Sem 'end' (Válido)"""
+def test_compile_terminals_when_routing_has_no_end_should_keep_probabilities():
+    plan = compile_terminals(NUMBER_OF_TERMINALS, MOCK_DISTRIBUTION, {0: 1.0}, None)
+
+    assert plan.routing.values == (0,)
+    assert plan.routing.cdf.tolist() == [1.0]
+
+
+"""
+Particionamento do espaço de entrada para função with_streams() da classe ExecutionPlan utilizando Each Choice Coverage:
+    distribuição: Compartilhada entre sítios | Exclusiva
+"""
+
+def build_plan(distribution) -> ExecutionPlan:
+    servers = tuple(compile_server(server_id, distribution, QueueDiscipline.fcfs(), {'end': 1.0}) for server_id in range(2))
+
+    return ExecutionPlan(servers, compile_entry_points({0: [distribution]}, {}), None, DEFAULT_RESOLUTION)
+
+"""distribuição Compartilhada entre sítios (Válido)"""
+def test_with_streams_when_distribution_is_shared_should_give_each_site_its_own_stream():
+    distribution = Distribution.exponential(1)
+    plan = build_plan(distribution).with_streams(SEED)
+
+    first_server_samples = [plan.servers[0].sample_service() for _ in range(NUMBER_OF_SAMPLES)]
+    second_server_samples = [plan.servers[1].sample_service() for _ in range(NUMBER_OF_SAMPLES)]
+
+    assert plan.servers[0].service_distribution is not distribution
+    assert first_server_samples != second_server_samples
+
+"""distribuição Exclusiva (Válido)"""
+def test_with_streams_when_seed_is_the_same_should_draw_the_same_samples():
+    first_plan = build_plan(Distribution.exponential(1)).with_streams(SEED)
+    second_plan = build_plan(Distribution.exponential(1)).with_streams(SEED)
+
+    assert [first_plan.entry_points[0].sample_arrival() for _ in range(NUMBER_OF_SAMPLES)] == [second_plan.entry_points[0].sample_arrival() for _ in range(NUMBER_OF_SAMPLES)]
+    assert [first_plan.servers[0].routing.draw() for _ in range(NUMBER_OF_SAMPLES)] == [second_plan.servers[0].routing.draw() for _ in range(NUMBER_OF_SAMPLES)]
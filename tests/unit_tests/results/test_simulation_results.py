@@ -1,8 +1,11 @@
+import pickle
 import pytest
 
 
+from qpy.estimation import BATCH_MEANS_MAXIMUM_BATCHES, PRECISION_MINIMUM_OBSERVATIONS
 from qpy.job import Job
-from qpy.results import SimulationResults
+from qpy.results import ReplicationResults, SimulationResults
+from qpy.trace import JobTrace
 
 
 NUMBER_OF_SERVERS = 3
@@ -24,7 +27,7 @@ def simulation_results_empty_object():
 def job_mock_object():
     job = Job(JOB_ID, JOB_ARRIVAL_TIME, JOB_CURRENT_SERVER, JOB_PRIORITY)
 
-    job.queue_times_per_server[JOB_CURRENT_SERVER] = 2
+    job.total_queue_time = 2
 
     return job
 
@@ -33,13 +36,24 @@ def job_mock_object():
 Particionamento do espaço de entrada para função compute_departure() da classe SimulationResults utilizando Each Choice Coverage:
     job: Válido | None
     current_time: < 0 | >= 0
+    trace: None | JobTrace
 """
 
-"""job Válido | current_time >= 0 (Válido)"""
-def test_compute_departure_when_both_inputs_are_valid_should_update_results(simulation_results_empty_object, job_mock_object):
+"""job Válido | current_time >= 0 | trace None (Válido)"""
+def test_compute_departure_when_both_inputs_are_valid_should_update_results_without_keeping_job(simulation_results_empty_object, job_mock_object):
     simulation_results_empty_object.compute_departure(job=job_mock_object, current_time=CURRENT_TIME)
 
-    assert simulation_results_empty_object.jobs[JOB_ID] != None
+    assert simulation_results_empty_object.environment_metrics.get_number_of_processed_jobs() == 1
+    assert simulation_results_empty_object.jobs == {}
+
+"""job Válido | current_time >= 0 | trace JobTrace (Válido)"""
+def test_compute_departure_when_trace_is_provided_should_record_job(job_mock_object):
+    results = SimulationResults(NUMBER_OF_SERVERS, SIMULATION_TIME, TIME_UNIT, trace=JobTrace.last(1))
+
+    results.compute_departure(job=job_mock_object, current_time=CURRENT_TIME)
+
+    assert results.jobs[JOB_ID].departure_time == CURRENT_TIME
+    assert results.jobs[JOB_ID].queue_time == job_mock_object.total_queue_time
 
 """job Inválido | current_time >= 0 (Inválido)"""
 def test_compute_departure_when_job_is_invalid_should_raise_exception(simulation_results_empty_object):
@@ -49,4 +63,135 @@ def test_compute_departure_when_job_is_invalid_should_raise_exception(simulation
 """job Válido | current_time < 0 (Inválido)"""
 def test_compute_departure_when_time_is_negative_should_raise_exception(simulation_results_empty_object, job_mock_object):
     with pytest.raises(ValueError):
-        simulation_results_empty_object.compute_departure(job=job_mock_object, current_time=NEGATIVE_VALUE)
\ No newline at end of file
+        simulation_results_empty_object.compute_departure(job=job_mock_object, current_time=NEGATIVE_VALUE)
+
+"""
+Particionamento do espaço de entrada para função compute_servers_departures() da classe SimulationResults utilizando Each Choice Coverage:
+    departures: Nenhuma | Várias
+"""
+
+"""departures Várias (Válido)"""
+def test_compute_servers_departures_when_jobs_departed_should_count_them_in_every_server(simulation_results_empty_object, job_mock_object):
+    simulation_results_empty_object.compute_departure(job=job_mock_object, current_time=CURRENT_TIME)
+    simulation_results_empty_object.compute_departure(job=job_mock_object, current_time=CURRENT_TIME)
+
+    assert all(server.total_number_of_processed_jobs_in_system == 0 for server in simulation_results_empty_object.server_metrics)
+
+    simulation_results_empty_object.compute_servers_departures()
+
+    assert all(server.total_number_of_processed_jobs_in_system == 2 for server in simulation_results_empty_object.server_metrics)
+
+"""departures Nenhuma (Válido)"""
+def test_compute_servers_departures_when_no_job_departed_should_keep_servers_unchanged(simulation_results_empty_object):
+    simulation_results_empty_object.compute_servers_departures()
+
+    assert all(server.total_number_of_processed_jobs_in_system == 0 for server in simulation_results_empty_object.server_metrics)
+
+
+"""
+Particionamento do espaço de entrada para função has_reached_precision() da classe SimulationResults utilizando Each Choice Coverage:
+    intervals: Insuficientes | Estreitos antes do mínimo de observações | Dentro da precisão | Fora da precisão
+"""
+
+"""intervals Insuficientes (Válido)"""
+def test_has_reached_precision_when_there_are_few_departures_should_return_false(job_mock_object):
+    results = SimulationResults(NUMBER_OF_SERVERS, SIMULATION_TIME, TIME_UNIT, batch_means=True)
+
+    results.compute_departure(job=job_mock_object, current_time=CURRENT_TIME)
+
+    assert not results.has_reached_precision(0.5, 0.95)
+
+"""intervals Estreitos antes do mínimo de observações (Válido)"""
+def test_has_reached_precision_when_run_is_too_short_should_return_false(job_mock_object):
+    results = SimulationResults(NUMBER_OF_SERVERS, SIMULATION_TIME, TIME_UNIT, batch_means=True)
+
+    for _ in range(BATCH_MEANS_MAXIMUM_BATCHES):
+        results.compute_departure(job=job_mock_object, current_time=CURRENT_TIME)
+
+    assert results.environment_metrics.time_in_system_batches.confidence_interval().relative_half_width == 0
+    assert not results.has_reached_precision(0.01, 0.95)
+
+"""intervals Dentro da precisão (Válido)"""
+def test_has_reached_precision_when_intervals_are_narrow_should_return_true(job_mock_object):
+    results = SimulationResults(NUMBER_OF_SERVERS, SIMULATION_TIME, TIME_UNIT, batch_means=True)
+
+    reached_at = []
+
+    for departure in range(2 * PRECISION_MINIMUM_OBSERVATIONS):
+        results.compute_departure(job=job_mock_object, current_time=CURRENT_TIME)
+
+        if results.has_reached_precision(0.01, 0.95):
+            reached_at.append(departure + 1)
+
+    assert reached_at and reached_at[0] >= PRECISION_MINIMUM_OBSERVATIONS
+
+"""intervals Fora da precisão (Válido)"""
+def test_has_reached_precision_when_intervals_are_wide_should_return_false(job_mock_object):
+    results = SimulationResults(NUMBER_OF_SERVERS, SIMULATION_TIME, TIME_UNIT, batch_means=True)
+
+    reached = False
+
+    for departure in range(2 * PRECISION_MINIMUM_OBSERVATIONS):
+        results.compute_departure(job=job_mock_object, current_time=CURRENT_TIME + departure ** 2)
+        reached = reached or results.has_reached_precision(0.01, 0.95)
+
+    assert not reached
+
+
+"""
+Particionamento do espaço de entrada para função compute_total_simulation_time() da classe SimulationResults utilizando Each Choice Coverage:
+    total_simulation_time: Válido
+"""
+
+"""total_simulation_time Válido (Válido)"""
+def test_compute_total_simulation_time_should_update_every_metric(simulation_results_empty_object, job_mock_object):
+    simulation_results_empty_object.compute_departure(job=job_mock_object, current_time=CURRENT_TIME)
+
+    simulation_results_empty_object.compute_total_simulation_time(SIMULATION_TIME / 2)
+
+    assert simulation_results_empty_object.environment_metrics.get_throughput() == 2 / SIMULATION_TIME
+    assert all(server.total_simulation_time == SIMULATION_TIME / 2 for server in simulation_results_empty_object.server_metrics)
+    assert simulation_results_empty_object.priority_metrics[JOB_PRIORITY].total_simulation_time == SIMULATION_TIME / 2
+
+
+"""Testando que os resultados podem ser serializados para voltar de um processo"""
+def test_simulation_results_should_be_picklable(simulation_results_empty_object, job_mock_object):
+    simulation_results_empty_object.compute_departure(job=job_mock_object, current_time=CURRENT_TIME)
+
+    copy = pickle.loads(pickle.dumps(simulation_results_empty_object))
+
+    assert copy.priority_metrics[JOB_PRIORITY].get_number_of_processed_jobs() == 1
+    assert copy.priority_metrics[JOB_PRIORITY + 1].total_simulation_time == SIMULATION_TIME
+
+
+"""
+Particionamento do espaço de entrada para função __init__() da classe ReplicationResults utilizando Each Choice Coverage:
+    priorities: Em todas as replicações | Ausente em uma replicação
+"""
+
+"""priorities Em todas as replicações (Válido)"""
+def test_replication_results_should_aggregate_every_metric(job_mock_object):
+    replications = [SimulationResults(NUMBER_OF_SERVERS, SIMULATION_TIME, TIME_UNIT) for _ in range(2)]
+    replications[0].compute_departure(job=job_mock_object, current_time=CURRENT_TIME)
+
+    for results in replications:
+        results.compute_departure(job=job_mock_object, current_time=CURRENT_TIME)
+
+    aggregated = ReplicationResults(replications)
+
+    assert aggregated.environment.number_of_processed_jobs.mean == 1.5
+    assert aggregated.environment.number_of_processed_jobs.standard_deviation == pytest.approx(0.5 ** 0.5)
+    assert len(aggregated.servers) == NUMBER_OF_SERVERS
+    assert aggregated.priorities[JOB_PRIORITY].mean_queue_time.mean == 2
+
+"""priorities Ausente em uma replicação (Válido)"""
+def test_replication_results_when_priority_is_missing_should_aggregate_present_replications(job_mock_object):
+    replications = [SimulationResults(NUMBER_OF_SERVERS, SIMULATION_TIME, TIME_UNIT) for _ in range(3)]
+    replications[0].compute_departure(job=job_mock_object, current_time=CURRENT_TIME)
+    replications[1].compute_departure(job=job_mock_object, current_time=CURRENT_TIME)
+
+    aggregated = ReplicationResults(replications)
+
+    assert aggregated.priorities[JOB_PRIORITY].number_of_processed_jobs.mean == 1
+    assert aggregated.priorities[JOB_PRIORITY].number_of_processed_jobs.half_width == 0
+
@@ -0,0 +1,125 @@
+import json
+import numpy as np
+import pytest
+
+
+from pydantic_core import ValidationError
+from qpy.distribution import Distribution
+from qpy.environment import Environment
+from qpy.queue_discipline import QueueDiscipline
+from qpy.sweep import SweepDesign, run_sweep
+
+
+SEED = 7
+SIMULATION_TIME = 1000
+WARMUP_TIME = 100
+ARRIVAL_RATES = [0.5, 1]
+DISCIPLINES = ['fcfs', 'lcfs']
+NUMBER_OF_POINTS = 8
+
+
+def mm1_model(arrival_rate, discipline):
+    env = Environment()
+    env.add_server(Distribution.exponential(0.5), getattr(QueueDiscipline, discipline)())
+    env.add_entry_point(0, Distribution.exponential(1 / arrival_rate))
+
+    return env
+
+@pytest.fixture
+def grid_design():
+    return SweepDesign.grid(arrival_rate=ARRIVAL_RATES, discipline=DISCIPLINES)
+
+
+"""
+Particionamento do espaço de entrada para função grid() da classe SweepDesign utilizando Each Choice Coverage:
+    parameters: Listas | Não lista
+"""
+
+"""parameters Listas (Válido)"""
+def test_grid_should_return_every_combination(grid_design):
+    assert grid_design.points == [{'arrival_rate': 0.5, 'discipline': 'fcfs'}, {'arrival_rate': 0.5, 'discipline': 'lcfs'}, {'arrival_rate': 1, 'discipline': 'fcfs'}, {'arrival_rate': 1, 'discipline': 'lcfs'}]
+
+"""parameters Não lista (Inválido)"""
+def test_grid_when_parameter_is_not_a_list_should_raise_exception():
+    with pytest.raises(ValidationError):
+        SweepDesign.grid(arrival_rate=1)
+
+
+"""
+Particionamento do espaço de entrada para função latin_hypercube() da classe SweepDesign utilizando Each Choice Coverage:
+    parameters: Intervalo | Lista de valores
+"""
+
+"""parameters Intervalo (Válido)"""
+def test_latin_hypercube_when_parameter_is_a_range_should_sample_every_stratum_once():
+    design = SweepDesign.latin_hypercube(NUMBER_OF_POINTS, seed=SEED, arrival_rate=(0, 1))
+
+    strata = sorted(int(point['arrival_rate'] * NUMBER_OF_POINTS) for point in design.points)
+
+    assert strata == list(range(NUMBER_OF_POINTS))
+
+"""parameters Lista de valores (Válido)"""
+def test_latin_hypercube_when_parameter_is_a_list_should_sample_values_evenly():
+    design = SweepDesign.latin_hypercube(NUMBER_OF_POINTS, seed=SEED, discipline=DISCIPLINES)
+
+    disciplines = [point['discipline'] for point in design.points]
+
+    assert disciplines.count('fcfs') == disciplines.count('lcfs') == NUMBER_OF_POINTS // 2
+
+
+"""
+Particionamento do espaço de entrada para função run_sweep() utilizando Each Choice Coverage:
+    workers: 1 | > 1
+    path: None | Arquivo novo | Arquivo interrompido | Arquivo de outra sweep | Arquivo com outras configurações
+"""
+
+"""workers 1 | path None (Válido)"""
+def test_run_sweep_should_return_one_row_per_point(grid_design):
+    results = run_sweep(mm1_model, grid_design, SIMULATION_TIME, WARMUP_TIME, workers=1, seed=SEED)
+
+    assert len(results) == len(grid_design)
+    assert list(results['arrival_rate']) == [0.5, 0.5, 1, 1]
+    assert list(results['discipline']) == ['fcfs', 'lcfs', 'fcfs', 'lcfs']
+    assert results['throughput'] == pytest.approx(results['arrival_rate'], rel=0.15)
+    assert results['server_0_server_utilization'] == pytest.approx(results['arrival_rate'] / 2, rel=0.15)
+
+"""workers > 1 | path Arquivo novo (Válido)"""
+def test_run_sweep_should_not_depend_on_number_of_workers(grid_design, tmp_path):
+    path = str(tmp_path / 'sweep.jsonl')
+
+    parallel = run_sweep(mm1_model, grid_design, SIMULATION_TIME, WARMUP_TIME, workers=2, seed=SEED, path=path)
+    sequential = run_sweep(mm1_model, grid_design, SIMULATION_TIME, WARMUP_TIME, workers=1, seed=SEED)
+
+    with open(path) as file:
+        assert len(file.read().splitlines()) == len(grid_design)
+
+    assert np.array_equal(parallel['mean_time_in_system'], sequential['mean_time_in_system'])
+
+"""workers 1 | path Arquivo interrompido (Válido)"""
+def test_run_sweep_when_file_was_interrupted_should_resume_missing_points(grid_design, tmp_path):
+    path = tmp_path / 'sweep.jsonl'
+    complete = run_sweep(mm1_model, grid_design, SIMULATION_TIME, WARMUP_TIME, workers=1, seed=SEED, path=str(path))
+    lines = path.read_text().splitlines()
+    path.write_text(lines[0] + '\n' + lines[1][:10])
+
+    resumed = run_sweep(mm1_model, grid_design, SIMULATION_TIME, WARMUP_TIME, workers=1, seed=SEED, path=str(path))
+
+    assert [json.loads(line)['point'] for line in path.read_text().splitlines()] == [0, 1, 2, 3]
+    assert np.array_equal(resumed['mean_time_in_system'], complete['mean_time_in_system'])
+
+"""workers 1 | path Arquivo de outra sweep (Inválido)"""
+def test_run_sweep_when_file_is_from_another_sweep_should_raise_exception(grid_design, tmp_path):
+    path = str(tmp_path / 'sweep.jsonl')
+    run_sweep(mm1_model, grid_design, SIMULATION_TIME, WARMUP_TIME, workers=1, seed=SEED, path=path)
+
+    with pytest.raises(ValueError):
+        run_sweep(mm1_model, SweepDesign.grid(arrival_rate=[0.8], discipline=DISCIPLINES), SIMULATION_TIME, WARMUP_TIME, workers=1, seed=SEED, path=path)
+
+"""workers 1 | path Arquivo com outras configurações (Inválido)"""
+@pytest.mark.parametrize('settings', [dict(time_in_seconds=2 * SIMULATION_TIME), dict(warmup_time=0), dict(engine='event'), dict(event_list='calendar'), dict(seed=SEED + 1)])
+def test_run_sweep_when_file_was_run_with_other_settings_should_raise_exception(grid_design, tmp_path, settings):
+    path = str(tmp_path / 'sweep.jsonl')
+    run_sweep(mm1_model, grid_design, SIMULATION_TIME, WARMUP_TIME, workers=1, seed=SEED, path=path)
+
+    with pytest.raises(ValueError):
+        run_sweep(mm1_model, grid_design, **{'time_in_seconds': SIMULATION_TIME, 'warmup_time': WARMUP_TIME, 'workers': 1, 'seed': SEED, 'path': path, **settings})
@@ -0,0 +1,71 @@
+import pytest
+
+from qpy.time_resolution import FLOAT_MODE_MIN_DURATION, TimeResolution
+
+
+DECIMAL_TICK = 0.001
+BINARY_TICK = 0.25
+MICROSECONDS = 0.0000123456
+TIME = 1.23456
+NEGATIVE_VALUE = -1
+ZERO_VALUE = 0
+
+
+"""
+Particionamento do espaço de entrada para a função __init__() da classe TimeResolution utilizando Each Choice Coverage:
+    tick: None | > 0 | <= 0
+"""
+
+"""tick None (Válido)"""
+def test_init_when_tick_is_none_should_use_float_mode():
+    assert TimeResolution(None).is_float_mode()
+
+"""tick > 0 (Válido)"""
+def test_init_when_tick_is_positive_should_use_ticks():
+    assert not TimeResolution(DECIMAL_TICK).is_float_mode()
+
+"""tick <= 0 (Inválido)"""
+def test_init_when_tick_is_negative_should_raise_exception():
+    with pytest.raises(ValueError):
+        TimeResolution(NEGATIVE_VALUE)
+
+
+"""
+Particionamento do espaço de entrada para a função quantize() da classe TimeResolution utilizando Each Choice Coverage:
+    tick: None | Decimal | Não decimal
+"""
+
+"""tick None (Válido)"""
+def test_quantize_when_in_float_mode_should_keep_time():
+    assert TimeResolution(None).quantize(TIME) == TIME
+
+"""tick Decimal (Válido)"""
+def test_quantize_when_tick_is_decimal_should_round_to_its_digits():
+    assert TimeResolution(DECIMAL_TICK).quantize(TIME) == 1.235
+
+"""tick Não decimal (Válido)"""
+def test_quantize_when_tick_is_not_decimal_should_snap_to_multiple_of_tick():
+    assert TimeResolution(BINARY_TICK).quantize(TIME) == 1.25
+
+
+"""
+Particionamento do espaço de entrada para a função duration() da classe TimeResolution utilizando Each Choice Coverage:
+    tick: None | > 0
+    sample: <= 0 | menor que o tick | maior que o tick
+"""
+
+"""tick None | sample menor que o tick (Válido)"""
+def test_duration_when_in_float_mode_should_keep_small_samples():
+    assert TimeResolution(None).duration(MICROSECONDS) == MICROSECONDS
+
+"""tick None | sample <= 0 (Válido)"""
+def test_duration_when_in_float_mode_and_sample_is_zero_should_return_minimum_duration():
+    assert TimeResolution(None).duration(ZERO_VALUE) == FLOAT_MODE_MIN_DURATION
+
+"""tick > 0 | sample menor que o tick (Válido)"""
+def test_duration_when_sample_is_smaller_than_tick_should_last_one_tick():
+    assert TimeResolution(DECIMAL_TICK).duration(MICROSECONDS) == DECIMAL_TICK
+
+"""tick > 0 | sample maior que o tick (Válido)"""
+def test_duration_when_sample_is_bigger_than_tick_should_be_quantized():
+    assert TimeResolution(DECIMAL_TICK).duration(TIME) == 1.235
@@ -0,0 +1,88 @@
+import pytest
+
+
+from qpy.job import Job
+from qpy.trace import JobRecord, JobTrace
+
+
+NUMBER_OF_JOBS = 10
+RING_BUFFER_SIZE = 3
+SAMPLING_INTERVAL = 4
+DEPARTURE_DELAY = 2
+PRIORITY = 1
+SERVER_ID = 0
+ZERO_VALUE = 0
+
+
+def record_departures(trace: JobTrace):
+    for job_id in range(NUMBER_OF_JOBS):
+        trace.record(Job(job_id, job_id, SERVER_ID, PRIORITY), job_id + DEPARTURE_DELAY)
+
+
+"""
+Particionamento do espaço de entrada para função last() da classe JobTrace utilizando Each Choice Coverage:
+    number_of_jobs: > 0 | 0
+"""
+
+"""number_of_jobs > 0 (Válido)"""
+def test_last_when_more_jobs_depart_than_fit_should_keep_only_the_last_ones():
+    trace = JobTrace.last(RING_BUFFER_SIZE)
+
+    record_departures(trace)
+
+    assert [record.id for record in trace] == list(range(NUMBER_OF_JOBS - RING_BUFFER_SIZE, NUMBER_OF_JOBS))
+    assert trace.records[-1] == JobRecord(NUMBER_OF_JOBS - 1, PRIORITY, NUMBER_OF_JOBS - 1, NUMBER_OF_JOBS - 1 + DEPARTURE_DELAY, ZERO_VALUE)
+
+"""number_of_jobs = 0 (Inválido)"""
+def test_last_when_number_of_jobs_is_zero_should_raise_exception():
+    with pytest.raises(ValueError):
+        JobTrace.last(ZERO_VALUE)
+
+
+"""
+Particionamento do espaço de entrada para função sample() da classe JobTrace utilizando Each Choice Coverage:
+    every: > 0 | 0
+    maximum_number_of_jobs: None | > 0
+"""
+
+"""every > 0 | maximum_number_of_jobs None (Válido)"""
+def test_sample_when_every_is_positive_should_keep_one_of_every_k_jobs():
+    trace = JobTrace.sample(SAMPLING_INTERVAL)
+
+    record_departures(trace)
+
+    assert [record.id for record in trace] == list(range(0, NUMBER_OF_JOBS, SAMPLING_INTERVAL))
+
+"""every > 0 | maximum_number_of_jobs > 0 (Válido)"""
+def test_sample_when_maximum_is_provided_should_keep_only_the_last_samples():
+    trace = JobTrace.sample(SAMPLING_INTERVAL, maximum_number_of_jobs=1)
+
+    record_departures(trace)
+
+    assert [record.id for record in trace] == [8]
+
+"""every = 0 (Inválido)"""
+def test_sample_when_every_is_zero_should_raise_exception():
+    with pytest.raises(ValueError):
+        JobTrace.sample(ZERO_VALUE)
+
+
+"""
+Particionamento do espaço de entrada para função sink() da classe JobTrace utilizando Each Choice Coverage:
+    callback: Callable | None
+"""
+
+"""callback Callable (Válido)"""
+def test_sink_when_callback_is_provided_should_stream_records_without_keeping_them():
+    received = []
+    trace = JobTrace.sink(received.append)
+
+    record_departures(trace)
+
+    assert [record.id for record in received] == list(range(NUMBER_OF_JOBS))
+    assert len(trace) == 0
+
+"""callback None (Inválido)"""
+def test_sink_when_callback_is_none_should_raise_exception():
+    with pytest.raises(ValueError):
+        JobTrace.sink(None)
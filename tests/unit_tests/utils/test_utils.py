@@ -1,12 +1,12 @@
 import pytest
 
 
-from qpy.event import Event
+from qpy.event import Event, EventType
 from qpy.distribution import ConstantDistribution
 
+from qpy.plan import compile_terminals
 from qpy.utils import (
-    randomly_draw_from_dictionary,
-    transform_input_closed_network,
+    generate_new_job_closed_network,
     validate_priority_input,
 )
 
@@ -28,82 +28,47 @@ def empty_queue():
 
 
 """
-Particionamento do espaço de entrada para função randomly_draw_from_dictionary() utilizando Each Choice Coverage:
-    probabilities: Válido | Vazio | None
+Particionamento do espaço de entrada para função generate_new_job_closed_network() utilizando Each Choice Coverage:
+    finished_event: None | Evento de partida
+    routing: Sem 'end' | Com 'end'
 """
 
-"""probabilities Válido (Válido)"""
-def test_randomly_draw_from_dictionary_when_distribution_is_valid_should_return_key():
-    probabilities = {"a": 0.5, "b": 0.5}
+"""finished_event None (Válido)"""
+def test_generate_new_job_closed_network_when_no_event_is_finished_should_create_job(constant_distribution):
+    terminals = compile_terminals(1, constant_distribution, {SERVER_ID: 1.0}, None)
 
-    result = randomly_draw_from_dictionary(probabilities)
+    arrival_time, event_id, event = generate_new_job_closed_network(EVENT_COUNT, CURRENT_TIME, terminals)
 
-    assert result in probabilities.keys()
+    assert (arrival_time, event_id) == (CURRENT_TIME + 1, EVENT_COUNT)
+    assert event.type == EventType.ARRIVAL
+    assert event.job.arrival_time == arrival_time
 
-"""probabilities Válido (Válido)"""
-def test_randomly_draw_from_dictionary_when_distribution_is_not_normalized_should_return_key():
-    probabilities = {"x": 2, "y": 3}
+"""finished_event Evento de partida (Válido)"""
+def test_generate_new_job_closed_network_when_event_is_finished_should_recycle_event_and_job(constant_distribution):
+    terminals = compile_terminals(1, constant_distribution, {SERVER_ID: 1.0}, None)
+    _, _, finished_event = generate_new_job_closed_network(EVENT_COUNT, CURRENT_TIME, terminals)
+    finished_job = finished_event.job
+    finished_event.type = EventType.DEPARTURE
+    finished_job.total_queue_time = CURRENT_TIME
 
-    result = randomly_draw_from_dictionary(probabilities)
+    arrival_time, event_id, event = generate_new_job_closed_network(EVENT_COUNT + 1, 2 * CURRENT_TIME, terminals, finished_event=finished_event)
 
-    assert result in probabilities.keys()
+    assert event is finished_event and event.job is finished_job
+    assert (arrival_time, event_id) == (2 * CURRENT_TIME + 1, EVENT_COUNT + 1)
+    assert (event.current_time, event.id, event.type, event.server_id) == (arrival_time, event_id, EventType.ARRIVAL, SERVER_ID)
+    assert (finished_job.id, finished_job.arrival_time, finished_job.total_queue_time) == (event_id, arrival_time, 0)
 
-"""probabilities Vazio (Válido)"""
-def test_randomly_draw_from_dictionary_when_dict_is_empty_should_return_none():
-    probabilities = {}
+"""routing Com 'end' (Válido)"""
+def test_generate_new_job_closed_network_when_routing_has_end_should_sample_think_time_once():
+    think_time_distribution = ConstantDistribution(1.0)
+    samples = []
+    terminals = compile_terminals(1, think_time_distribution, {'end': 0.9, SERVER_ID: 0.1}, None)._replace(sample_think_time=lambda: samples.append(1.0) or 1.0)
 
-    result = randomly_draw_from_dictionary(probabilities)
+    arrival_time, _, event = generate_new_job_closed_network(EVENT_COUNT, CURRENT_TIME, terminals)
 
-    assert result is None
-
-"""probabilities None (Inválido)"""
-def test_randomly_draw_from_dictionary_when_parameter_is_none_should_raise_exception():
-    with pytest.raises(TypeError):
-        randomly_draw_from_dictionary(None)
-
-
-"""
-Particionamento do espaço de entrada para função transform_input_closed_network() utilizando Each Choice Coverage:
-    input: Somente com 'end' | Contém 'end' | Não contém 'end' | None
-"""
-
-"""input Somente com 'end'"""
-def test_transform_input_closed_network_when_there_are_no_routes_should_raise_exception():
-    input_data = {'end': 1}
-
-    with pytest.raises(ValueError):
-        transform_input_closed_network(input_data)
-
-"""input Contém 'end' (Válido)"""
-def test_transform_input_closed_network_when_end_key_is_present_should_return_normalized_dict():
-    expected_a_probability = 0.6
-    expected_b_probability = 0.4
-    
-    input_data = {"A": 0.3, "B": 0.2, "end": 0.5}
-
-    result = transform_input_closed_network(input_data)
-
-    assert "end" not in result
-    assert round(sum(result.values()), 4) == 1.0
-    assert result["A"] == expected_a_probability
-    assert result["B"] == expected_b_probability
-
-"""input Não contém 'end' (Válido)"""
-def test_transform_input_closed_network_when_end_key_is_not_present_should_return_same_ratios():
-    expected_a_probability = 0.4
-    expected_b_probability = 0.6
-    
-    input_data = {"A": 0.4, "B": 0.6}
-
-    result = transform_input_closed_network(input_data)
-
-    assert result["A"] == expected_a_probability
-    assert result["B"] == expected_b_probability
-
-"""input None (Inválido)"""
-def test_transform_input_closed_network_when_input_is_none_should_raise_exception():
-    with pytest.raises(TypeError):
-        transform_input_closed_network(input=None)
+    assert len(samples) == 1
+    assert arrival_time == CURRENT_TIME + 1
+    assert event.server_id == SERVER_ID
 
 
 """
@@ -0,0 +1,71 @@
+import numpy as np
+
+
+from qpy.warmup import MSER_BATCH_SIZE, MSER_MINIMUM_BATCHES, MSERWarmupDetector, mser_truncation
+
+
+SEED = 7
+TRANSIENT_BATCHES = 20
+STEADY_STATE_BATCHES = 200
+STEADY_STATE_MEAN = 10
+TRANSIENT_MEAN = 100
+
+
+def stationary_series(size: int) -> np.ndarray:
+    return np.random.default_rng(SEED).normal(STEADY_STATE_MEAN, 1, size)
+
+def arrive_and_depart(detector: MSERWarmupDetector, response_time: float, departure_time: float = 0.0) -> bool:
+    detector.compute_arrival()
+
+    return detector.compute_departure(response_time, departure_time)
+
+
+"""
+Particionamento do espaço de entrada para função mser_truncation() utilizando Each Choice Coverage:
+    batch_means: Estacionário | Com transiente inicial
+"""
+
+"""batch_means Estacionário (Válido)"""
+def test_mser_truncation_when_series_is_stationary_should_keep_most_batches():
+    assert mser_truncation(stationary_series(STEADY_STATE_BATCHES)) < STEADY_STATE_BATCHES / 10
+
+"""batch_means Com transiente inicial (Válido)"""
+def test_mser_truncation_when_series_has_transient_should_truncate_it():
+    batch_means = np.concatenate([np.full(TRANSIENT_BATCHES, TRANSIENT_MEAN), stationary_series(STEADY_STATE_BATCHES)])
+
+    assert mser_truncation(batch_means) == TRANSIENT_BATCHES
+
+
+"""
+Particionamento do espaço de entrada para função compute_departure() da classe MSERWarmupDetector utilizando Each Choice Coverage:
+    departures: < MSER_MINIMUM_BATCHES batches | Série estacionária | Série com transiente inicial | Série crescente
+"""
+
+"""departures < MSER_MINIMUM_BATCHES batches (Válido)"""
+def test_compute_departure_when_there_are_few_batches_should_not_end_warmup():
+    detector = MSERWarmupDetector()
+
+    assert not any(arrive_and_depart(detector, response_time) for response_time in stationary_series(MSER_BATCH_SIZE * MSER_MINIMUM_BATCHES - 1))
+    assert detector.truncated_batches is None
+
+"""departures Série estacionária (Válido)"""
+def test_compute_departure_when_series_is_stationary_should_end_warmup():
+    detector = MSERWarmupDetector()
+
+    assert any(arrive_and_depart(detector, response_time) for response_time in stationary_series(MSER_BATCH_SIZE * STEADY_STATE_BATCHES))
+    assert 2 * detector.truncated_batches <= len(detector.response_time_means)
+
+"""departures Série com transiente inicial (Válido)"""
+def test_compute_departure_when_series_has_transient_should_report_truncation_time():
+    detector = MSERWarmupDetector()
+    response_times = np.concatenate([np.full(MSER_BATCH_SIZE * TRANSIENT_BATCHES, TRANSIENT_MEAN), stationary_series(MSER_BATCH_SIZE * STEADY_STATE_BATCHES)])
+
+    assert any(arrive_and_depart(detector, response_time, float(departure_time)) for departure_time, response_time in enumerate(response_times))
+    assert detector.truncated_batches == TRANSIENT_BATCHES
+    assert detector.truncation_time == MSER_BATCH_SIZE * TRANSIENT_BATCHES - 1
+
+"""departures Série crescente (Válido)"""
+def test_compute_departure_when_series_keeps_growing_should_not_end_warmup():
+    detector = MSERWarmupDetector()
+
+    assert not any(arrive_and_depart(detector, float(response_time)) for response_time in range(MSER_BATCH_SIZE * STEADY_STATE_BATCHES))